@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import os
+
+# todo: 라이브러리를 통해 경로를 설정하도록 변경
+local_appdata: str = os.environ.get("LOCALAPPDATA", default="")
+
+data_path: str = os.path.join(local_appdata, "ProDays", "SkillMacro")
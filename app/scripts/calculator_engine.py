@@ -30,20 +30,26 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import heapq
-import os
 import random
+import time
+from collections import deque
 from collections.abc import Callable
 from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
-from dataclasses import dataclass, field
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from math import floor
-from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, NoReturn, TypeVar, cast
+from math import comb, floor
+from typing import TYPE_CHECKING, Any, NoReturn, TypeVar, cast
+
+import numpy as np
 
 from app.scripts.calculator_models import (
     OVERALL_STAT_ORDER,
     REALM_TIER_SPECS,
+    STAT_COUNT,
+    STAT_INDEX,
     STAT_SPECS,
     TALISMAN_SPECS,
     BaseStats,
@@ -60,10 +66,27 @@ from app.scripts.calculator_models import (
     StatKey,
     TargetDanjeonState,
     TargetDistributionState,
+    derive_final_stat_values,
+    resolve_stat_rows,
+    round_float_values,
+    round_stat_values,
 )
 from app.scripts.macro_models import EquippedSkillRef, LinkUseType
+from app.scripts.optimization_pool import (
+    OptimizationCancelledError,
+    OptimizationWorkerPool,
+    SharedContextHandle,
+    check_generation_cancelled,
+    load_shared_context,
+    offer_shared_incumbent,
+    optimization_pool,
+    publish_shared_context,
+    read_shared_incumbent,
+    release_shared_context,
+)
+from app.scripts.optimization_store import OptimizationRecord, optimization_store
 from app.scripts.registry.skill_registry import get_builtin_skill_id
-from app.scripts.run_macro import get_prepared_link_skill_indices
+from app.scripts.timeline_store import TimelineRecord, timeline_store
 
 if TYPE_CHECKING:
     from app.scripts.macro_models import MacroPreset, SkillUsageSetting
@@ -118,62 +141,97 @@ TIMELINE_MILLISECONDS: int = 60000
 BASIC_ATTACK_INTERVAL_MILLISECONDS: int = 625
 BASIC_ATTACK_PAUSE_BUFFER_MILLISECONDS: int = 50
 
+# 타임라인 생성 규칙 버전 (스케줄러/평타/연계 규칙 변경 시 증가해 영속 캐시의 이전 타임라인 무효화)
+TIMELINE_SEMANTICS_VERSION: int = 1
+
+# 스킬속도 구간 테이블 범위와 구간 경계 근접 판정 허용 오차
+SKILL_SPEED_TABLE_MIN_PERCENT: float = 0.0
+SKILL_SPEED_TABLE_MAX_PERCENT: float = 90.0
+_SKILL_SPEED_BREAKPOINT_TOLERANCE: float = 1e-7
+
 
 # 역산 시 음수 허용 범위
 INVERSE_NEGATIVE_TOLERANCE: float = 0.01
 
 
-def _terminate_process_pool_workers(pool: ProcessPoolExecutor) -> None:
-    """실행 중인 병렬 계산 워커 프로세스 강제 종료"""
-
-    # ProcessPoolExecutor._processes: CPython 내부 속성 (Python 3.12 기준).
-    # 파이썬 업그레이드 시 이 접근이 깨지면 즉시 드러나도록 가드 없이 직접 접근.
-    worker_processes: dict[int, BaseProcess] = pool._processes  # type: ignore[attr-defined]
-
-    # 이미 시작된 최적화 작업의 즉시 중단 요청
-    process: BaseProcess
-    for process in worker_processes.values():
-        if process.is_alive():
-            process.terminate()
-
-    # 종료 신호 전달 후 좀비 프로세스 방지용 회수
-    for process in worker_processes.values():
-        process.join(timeout=0.2)
-        if process.is_alive():
-            # 종료 지연 워커의 남은 계산 강제 중단
-            process.kill()
-            process.join(timeout=0.2)
-
-
-# _fast_resolve 용 enum 키 모듈 수준 캐시 (매 호출마다 enum descriptor 접근 제거)
-_FK_STR: StatKey = StatKey.STR
-_FK_STR_PERCENT: StatKey = StatKey.STR_PERCENT
-_FK_DEXTERITY: StatKey = StatKey.DEXTERITY
-_FK_DEXTERITY_PERCENT: StatKey = StatKey.DEXTERITY_PERCENT
-_FK_VITALITY: StatKey = StatKey.VITALITY
-_FK_VITALITY_PERCENT: StatKey = StatKey.VITALITY_PERCENT
-_FK_LUCK: StatKey = StatKey.LUCK
-_FK_LUCK_PERCENT: StatKey = StatKey.LUCK_PERCENT
-_FK_ATTACK: StatKey = StatKey.ATTACK
-_FK_ATTACK_PERCENT: StatKey = StatKey.ATTACK_PERCENT
-_FK_HP: StatKey = StatKey.HP
-_FK_HP_PERCENT: StatKey = StatKey.HP_PERCENT
-_FK_CRIT_RATE_PERCENT: StatKey = StatKey.CRIT_RATE_PERCENT
-_FK_CRIT_DAMAGE_PERCENT: StatKey = StatKey.CRIT_DAMAGE_PERCENT
-_FK_DROP_RATE_PERCENT: StatKey = StatKey.DROP_RATE_PERCENT
-_FK_EXP_PERCENT: StatKey = StatKey.EXP_PERCENT
-_FK_DODGE_PERCENT: StatKey = StatKey.DODGE_PERCENT
-_FK_POTION_HEAL_PERCENT: StatKey = StatKey.POTION_HEAL_PERCENT
+# 스킬속도 enum 키 모듈 수준 캐시 (매 호출마다 enum descriptor 접근 제거)
 _FK_SKILL_SPEED_PERCENT: StatKey = StatKey.SKILL_SPEED_PERCENT
 
 # _evaluate_distribution_selection 용 사전 계산 상수
 _STAT_ORDER_KEYS: tuple[StatKey, ...] = OVERALL_STAT_ORDER
 _STAT_ORDER_VALUES: tuple[str, ...] = tuple(sk.value for sk in OVERALL_STAT_ORDER)
+_SKILL_SPEED_STAT_INDEX: int = STAT_INDEX[StatKey.SKILL_SPEED_PERCENT]
 
 # 기울기 기반 필터링 상수
 _GRADIENT_TOP_K: int = 15
+# 내부 조합 수가 이 값을 넘으면 전수 평가 대신 상계 한정 탐색(불가 시 기울기 필터링) 사용
 _GRADIENT_EXACT_THRESHOLD: int = 500
 
+# 조합 일괄 평가 후 단일 평가로 재확인할 상위 후보 상대 오차 범위
+_BATCH_SELECTION_TOLERANCE: float = 1e-9
+
+# 최적화 탐색/전투력 평가 규칙 버전 (규칙 변경 시 증가해 영속 결과 캐시의 이전 결과 무효화)
+OPTIMIZATION_SEMANTICS_VERSION: int = 1
+
+# 구간 상계 계산 시 조회할 최대 스킬속도 타임라인 수 (초과 시 피해량 공식 상계 미사용)
+_INTERVAL_BOUND_MAX_TIMELINES: int = 256
+# 구간 상계 단조성 전제: 음수가 아니어야 하는 resolve 입력 수치 스탯
+_INTERVAL_BOUND_FLAT_STATS: tuple[StatKey, ...] = (
+    StatKey.ATTACK,
+    StatKey.HP,
+    StatKey.STR,
+    StatKey.DEXTERITY,
+    StatKey.VITALITY,
+    StatKey.LUCK,
+)
+# 구간 상계 단조성 전제: -100 이상이어야 하는 배율 스탯
+_INTERVAL_BOUND_RATIO_STATS: tuple[StatKey, ...] = (
+    StatKey.ATTACK_PERCENT,
+    StatKey.HP_PERCENT,
+    StatKey.STR_PERCENT,
+    StatKey.DEXTERITY_PERCENT,
+    StatKey.VITALITY_PERCENT,
+    StatKey.LUCK_PERCENT,
+    StatKey.SKILL_DAMAGE_PERCENT,
+    StatKey.FINAL_ATTACK_PERCENT,
+    StatKey.BOSS_ATTACK_PERCENT,
+)
+
+# 병렬 분기 한정 탐색 작업 1회 실행 시간 (초과 시 남은 탐색 큐를 반환해 재분배)
+_SUBTREE_TIME_SLICE_SECONDS: float = 0.25
+
+# 레벨업 1회당 지급 체력과 분배 스탯 포인트
+_LEVEL_UP_HP: float = 5.0
+_LEVEL_UP_STAT_POINTS: int = 5
+# 레벨업 스탯 포인트 분배 대상 (분배 배열 열 순서)
+_LEVEL_UP_STAT_KEYS: tuple[StatKey, ...] = (
+    StatKey.STR,
+    StatKey.DEXTERITY,
+    StatKey.VITALITY,
+    StatKey.LUCK,
+)
+# 누적 분배 전체 조합 수가 이 값 이하인 레벨 수까지는 전수 일괄 평가 (5레벨업 포인트 25개 -> 3276개)
+_LEVEL_UP_EXACT_COMBINATION_LIMIT: int = 4000
+# 레벨업 계획 국소 탐색에서 두 스탯 사이로 옮겨 보는 포인트 수
+_LEVEL_UP_TRANSFER_STEPS: tuple[int, ...] = (1, 2, 3, 5, 10, 25)
+_LEVEL_UP_TRANSFER_MOVES: np.ndarray = np.array(
+    [
+        [
+            step if column == target else -step if column == source else 0
+            for column in range(len(_LEVEL_UP_STAT_KEYS))
+        ]
+        for step in _LEVEL_UP_TRANSFER_STEPS
+        for source in range(len(_LEVEL_UP_STAT_KEYS))
+        for target in range(len(_LEVEL_UP_STAT_KEYS))
+        if source != target
+    ],
+    dtype=np.int64,
+)
+# 결과 화면 레벨업 계획 기본 레벨 수
+LEVEL_UP_PLAN_MAX_LEVELS: int = 100
+# 결과 화면 무공비급 강화 계획 기본 단계 수
+SCROLL_UPGRADE_PLAN_STEPS: int = 10
+
 # 내장 공식 추가 입력 변수 이름
 _POWER_FORMULA_LEVEL_NAME: str = "level"
 _POWER_FORMULA_BOSS_DAMAGE_NAME: str = "boss_damage"
@@ -422,6 +480,9 @@ _POWER_FORMULA_COMPARE_OPS: tuple[type[ast.cmpop], ...] = (
     ast.GtE,
 )
 
+# 스칼라/배열 평가 경로 공용 이항 연산 값 타입
+FormulaValue = TypeVar("FormulaValue", float, np.ndarray)
+
 
 @dataclass(frozen=True, slots=True)
 class CompiledPowerFormula:
@@ -429,6 +490,33 @@ class CompiledPowerFormula:
 
     statements: tuple[ast.stmt, ...]
     result_expression: ast.expr | None
+    # 검증된 AST로부터 생성한 바이트코드 평가 함수
+    evaluator: Callable[[dict[str, float | int | bool]], float] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # 이원수 입력용 평가 함수 (기울기 계산 시 처음 요청될 때 생성)
+    dual_evaluator: Callable[[dict[str, object]], object] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        # 검증 완료된 AST를 제한 네임스페이스 함수로 1회 컴파일
+        object.__setattr__(
+            self,
+            "evaluator",
+            _build_power_formula_evaluator(self.statements, self.result_expression),
+        )
+
+    def __reduce__(
+        self,
+    ) -> tuple[type["CompiledPowerFormula"], tuple[object, ...]]:
+        # 함수 객체는 프로세스 간 전달이 불가하므로 AST만 전달 후 재컴파일
+        return (CompiledPowerFormula, (self.statements, self.result_expression))
 
 
 @dataclass(frozen=True, slots=True)
@@ -1019,9 +1107,9 @@ def validate_custom_formula(formula_source: str) -> str | None:
 
 def _apply_power_formula_bin_op(
     operator: ast.operator,
-    left_value: float,
-    right_value: float,
-) -> float:
+    left_value: FormulaValue,
+    right_value: FormulaValue,
+) -> FormulaValue:
     """전투력 공식 이항 연산 적용"""
 
     # 이항 연산 종류별 계산 분기
@@ -1273,11 +1361,11 @@ def _execute_power_formula_statements(
         )
 
 
-def _evaluate_compiled_power_formula(
+def _interpret_compiled_power_formula(
     compiled_formula: CompiledPowerFormula,
     input_variables: dict[str, float | int | bool],
 ) -> float:
-    """검증된 전투력 공식 스크립트 전체 평가"""
+    """검증된 전투력 공식 스크립트 AST 순회 평가"""
 
     # 지역 변수 스코프 구성 후 문장 실행
     local_variables: dict[str, float | int | bool] = {}
@@ -1300,316 +1388,1219 @@ def _evaluate_compiled_power_formula(
     return float(local_variables["result"])
 
 
-# 내장 전투력 공식 AST 캐시
-_POWER_FORMULA_NODES: dict[PowerMetric, CompiledPowerFormula] = (
-    _build_power_formula_nodes()
-)
+# 생성 함수 내부 식별자 (사용자 지역 변수는 접두사로 분리해 충돌 방지)
+_POWER_FORMULA_CODE_FILENAME: str = "<power_formula>"
+_POWER_FORMULA_CODE_FUNCTION_NAME: str = "_power_formula"
+_POWER_FORMULA_CODE_INPUTS_NAME: str = "_inputs"
+_POWER_FORMULA_CODE_FLOAT_NAME: str = "_float"
+_POWER_FORMULA_CODE_BOOL_NAME: str = "_bool"
+_POWER_FORMULA_CODE_LOCAL_PREFIX: str = "local_"
+
+# 생성 함수 전용 제한 전역 네임스페이스 (내장 함수 접근 차단)
+_POWER_FORMULA_CODE_GLOBALS: dict[str, object] = {
+    "__builtins__": {},
+    _POWER_FORMULA_CODE_FLOAT_NAME: float,
+    _POWER_FORMULA_CODE_BOOL_NAME: bool,
+    **_POWER_FORMULA_FUNCTIONS,
+}
 
 
-def _build_resolved_stat_formula_variables(
-    resolved_stats: FinalStats,
-) -> dict[str, float | int]:
-    """최종 스탯 기준 내장 전투력 공식 변수 구성"""
+@dataclass(slots=True, eq=False)
+class _PowerDual:
+    """
+    순방향 자동 미분용 이원수 (값과 스탯별 편미분 벡터)
+    연산마다 연쇄 법칙으로 편미분을 함께 전파해 공식 1회 평가로 전체 기울기를 구한다.
+    """
 
-    formula_variables: dict[str, float | int] = {
-        stat_key.value: resolved_stats.values[stat_key]
-        for stat_key in OVERALL_STAT_ORDER
-    }
-    formula_variables[_POWER_FORMULA_LEVEL_NAME] = 0
-    formula_variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = 0.0
-    formula_variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = 0.0
+    value: float
+    tangent: np.ndarray
 
-    for variable_name in _POWER_FORMULA_SKILL_VARIABLE_NAMES:
-        formula_variables[variable_name] = 0.0
+    def __add__(self, other: object) -> "_PowerDual":
+        if isinstance(other, _PowerDual):
+            return _PowerDual(self.value + other.value, self.tangent + other.tangent)
 
-    return formula_variables
+        return _PowerDual(self.value + float(other), self.tangent)
 
+    __radd__ = __add__
 
-def evaluate_official_power(resolved_stats: FinalStats) -> float:
-    """공식 전투력 값 계산"""
+    def __sub__(self, other: object) -> "_PowerDual":
+        if isinstance(other, _PowerDual):
+            return _PowerDual(self.value - other.value, self.tangent - other.tangent)
 
-    return _evaluate_compiled_power_formula(
-        _POWER_FORMULA_NODES[PowerMetric.OFFICIAL],
-        _build_resolved_stat_formula_variables(resolved_stats),
-    )
+        return _PowerDual(self.value - float(other), self.tangent)
 
+    def __rsub__(self, other: object) -> "_PowerDual":
+        return _PowerDual(float(other) - self.value, -self.tangent)
 
-def evaluate_builtin_power_metric(
-    resolved_stats: FinalStats,
-    power_metric: PowerMetric,
-) -> float:
-    """최종 스탯 기준 내장 전투력 공식 값 계산"""
+    def __mul__(self, other: object) -> "_PowerDual":
+        if isinstance(other, _PowerDual):
+            return _PowerDual(
+                self.value * other.value,
+                (self.tangent * other.value) + (other.tangent * self.value),
+            )
 
-    return _evaluate_compiled_power_formula(
-        _POWER_FORMULA_NODES[power_metric],
-        _build_resolved_stat_formula_variables(resolved_stats),
-    )
+        other_value: float = float(other)
+        return _PowerDual(self.value * other_value, self.tangent * other_value)
 
+    __rmul__ = __mul__
 
-def _compute_power_gradient(
-    timeline_artifacts: TimelineEvaluationArtifacts,
-    base_changed_stats: dict[StatKey, float],
-    target_formula_id: str,
-    compiled_custom_formula: CompiledPowerFormula | None,
-    relevant_stat_keys: frozenset[StatKey],
-) -> dict[StatKey, float]:
-    """기준점에서의 전투력 기울기 (∂power/∂stat) 계산"""
+    def __truediv__(self, other: object) -> "_PowerDual":
+        if isinstance(other, _PowerDual):
+            quotient: float = self.value / other.value
+            return _PowerDual(
+                quotient,
+                (self.tangent - (other.tangent * quotient)) / other.value,
+            )
 
-    base_resolved: FinalStats = _fast_resolve(base_changed_stats)
-    base_value: float = evaluate_single_metric(
-        artifacts=timeline_artifacts,
-        resolved_stats=base_resolved,
-        target_formula_id=target_formula_id,
-        compiled_custom_formula=compiled_custom_formula,
-    )
+        other_value: float = float(other)
+        return _PowerDual(self.value / other_value, self.tangent / other_value)
 
-    gradient: dict[StatKey, float] = {}
-    for stat_key in relevant_stat_keys:
-        perturbed: dict[StatKey, float] = base_changed_stats.copy()
-        perturbed[stat_key] = perturbed.get(stat_key, 0.0) + 1.0
-        perturbed_resolved: FinalStats = _fast_resolve(perturbed)
-        perturbed_value: float = evaluate_single_metric(
-            artifacts=timeline_artifacts,
-            resolved_stats=perturbed_resolved,
-            target_formula_id=target_formula_id,
-            compiled_custom_formula=compiled_custom_formula,
-        )
-        gradient[stat_key] = perturbed_value - base_value
+    def __rtruediv__(self, other: object) -> "_PowerDual":
+        quotient: float = float(other) / self.value
+        return _PowerDual(quotient, self.tangent * (-quotient / self.value))
 
-    return gradient
+    def __pow__(self, other: object) -> "_PowerDual":
+        if isinstance(other, _PowerDual):
+            power: float = self.value**other.value
+            tangent: np.ndarray = self.tangent * (
+                other.value * (self.value ** (other.value - 1.0))
+            )
+            if self.value > 0.0:
+                tangent = tangent + (other.tangent * (power * np.log(self.value)))
 
+            return _PowerDual(power, tangent)
 
-def _score_contribution_by_gradient(
-    gradient: dict[StatKey, float],
-    contribution: Contribution,
-) -> float:
-    """기울기 기반 기여 점수 계산 (선형 근사)"""
+        exponent: float = float(other)
+        return _PowerDual(
+            self.value**exponent,
+            self.tangent * (exponent * (self.value ** (exponent - 1.0))),
+        )
 
-    score: float = 0.0
-    for stat_key, value in contribution.values.items():
-        grad_value: float | None = gradient.get(stat_key)
-        if grad_value is not None:
-            score += grad_value * value
-    return score
+    def __rpow__(self, other: object) -> "_PowerDual":
+        base: float = float(other)
+        power: float = base**self.value
+        if base <= 0.0:
+            return _PowerDual(power, self.tangent * 0.0)
 
+        return _PowerDual(power, self.tangent * (power * np.log(base)))
 
-def _fast_resolve(changed_stats: dict[StatKey, float]) -> FinalStats:
-    """enum 접근 최소화된 고속 resolve (사전 구성된 StatKey dict 전용)"""
+    def __mod__(self, other: object) -> "_PowerDual":
+        if isinstance(other, _PowerDual):
+            return _PowerDual(
+                self.value % other.value,
+                self.tangent - (other.tangent * floor(self.value / other.value)),
+            )
 
-    final_strength: float = changed_stats[_FK_STR] * (
-        1.0 + (changed_stats[_FK_STR_PERCENT] * 0.01)
-    )
-    final_dexterity: float = changed_stats[_FK_DEXTERITY] * (
-        1.0 + (changed_stats[_FK_DEXTERITY_PERCENT] * 0.01)
-    )
-    final_vitality: float = changed_stats[_FK_VITALITY] * (
-        1.0 + (changed_stats[_FK_VITALITY_PERCENT] * 0.01)
-    )
-    final_luck: float = changed_stats[_FK_LUCK] * (
-        1.0 + (changed_stats[_FK_LUCK_PERCENT] * 0.01)
-    )
+        return _PowerDual(self.value % float(other), self.tangent)
 
-    resolved_values: dict[StatKey, float] = changed_stats.copy()
+    def __rmod__(self, other: object) -> "_PowerDual":
+        other_value: float = float(other)
+        return _PowerDual(
+            other_value % self.value,
+            self.tangent * -float(floor(other_value / self.value)),
+        )
 
-    resolved_values[_FK_STR] = final_strength
-    resolved_values[_FK_DEXTERITY] = final_dexterity
-    resolved_values[_FK_VITALITY] = final_vitality
-    resolved_values[_FK_LUCK] = final_luck
+    def __neg__(self) -> "_PowerDual":
+        return _PowerDual(-self.value, -self.tangent)
 
-    attack_percent: float = changed_stats[_FK_ATTACK_PERCENT] + (final_dexterity * 0.3)
-    resolved_values[_FK_ATTACK_PERCENT] = attack_percent
+    def __pos__(self) -> "_PowerDual":
+        return self
 
-    resolved_values[_FK_ATTACK] = (changed_stats[_FK_ATTACK] + final_strength) * (
-        1.0 + (attack_percent * 0.01)
-    )
+    def __abs__(self) -> "_PowerDual":
+        if self.value < 0.0:
+            return -self
 
-    resolved_values[_FK_HP] = (changed_stats[_FK_HP] + (final_vitality * 5.0)) * (
-        1.0 + (changed_stats[_FK_HP_PERCENT] * 0.01)
-    )
+        return self
 
-    resolved_values[_FK_CRIT_RATE_PERCENT] = changed_stats[_FK_CRIT_RATE_PERCENT] + (
-        final_dexterity * 0.05
-    )
+    def __bool__(self) -> bool:
+        return bool(self.value)
 
-    resolved_values[_FK_CRIT_DAMAGE_PERCENT] = changed_stats[
-        _FK_CRIT_DAMAGE_PERCENT
-    ] + (final_strength * 0.1)
+    # 비교는 값만 사용 (min/max/if 분기는 선택된 쪽의 편미분을 그대로 따름)
+    def __eq__(self, other: object) -> bool:  # type: ignore[override]
+        return self.value == _power_dual_value(other)
 
-    resolved_values[_FK_DROP_RATE_PERCENT] = changed_stats[_FK_DROP_RATE_PERCENT] + (
-        final_luck * 0.2
-    )
+    def __ne__(self, other: object) -> bool:  # type: ignore[override]
+        return self.value != _power_dual_value(other)
 
-    resolved_values[_FK_EXP_PERCENT] = changed_stats[_FK_EXP_PERCENT] + (
-        final_luck * 0.2
-    )
+    def __lt__(self, other: object) -> bool:
+        return self.value < _power_dual_value(other)
 
-    resolved_values[_FK_DODGE_PERCENT] = changed_stats[_FK_DODGE_PERCENT] + (
-        final_vitality * 0.03
-    )
+    def __le__(self, other: object) -> bool:
+        return self.value <= _power_dual_value(other)
 
-    resolved_values[_FK_POTION_HEAL_PERCENT] = changed_stats[
-        _FK_POTION_HEAL_PERCENT
-    ] + (final_vitality * 0.5)
+    def __gt__(self, other: object) -> bool:
+        return self.value > _power_dual_value(other)
 
-    return FinalStats(values=resolved_values)
+    def __ge__(self, other: object) -> bool:
+        return self.value >= _power_dual_value(other)
 
 
-INVERSE_ROUND_DIGITS: int = 6
+def _power_dual_value(value: object) -> float:
+    """이원수 또는 일반 수의 값 부분 반환"""
 
+    if isinstance(value, _PowerDual):
+        return value.value
 
-@dataclass(frozen=True, slots=True)
-class HitEvent:
-    """단일 타격 이벤트"""
+    return float(value)  # type: ignore[arg-type]
 
-    skill_id: str
-    time: float
-    multiplier: float
 
+def _dual_formula_float(value: object) -> object:
+    """이원수는 편미분을 유지하고 그 외 값만 float 변환"""
 
-@dataclass(frozen=True, slots=True)
-class TimelineEvaluationArtifacts:
-    """타임라인 전투력 평가용 사전 계산 결과"""
+    if isinstance(value, _PowerDual):
+        return value
 
-    hit_events: tuple[HitEvent, ...]
-    skill_slot_variables: dict[str, float | int]
-    level: int
+    return float(value)  # type: ignore[arg-type]
 
 
-@dataclass(frozen=True, slots=True)
-class SkillUseEvent:
-    """스킬 사용 이벤트"""
+# floor/round 편미분 규칙 (straight-through):
+# 계단 함수의 실제 미분은 거의 모든 점에서 0이고 경계에서는 정의되지 않으므로,
+# 값은 계단을 적용하되 편미분은 안쪽 식의 것을 그대로 전파한다.
+# 결과는 "여러 포인트에 걸친 평균 증가율"이며, 실제 +1 한 번의 변화량은
+# 0 또는 계단 하나만큼이므로 정확한 +1 값은 프로브 평가(evaluate_stat_probe_deltas)로 구한다.
+# (공식 전투력처럼 전체가 floor인 공식도 0이 아닌 한계 가치/순위를 갖도록 하기 위함)
+def _dual_formula_floor(value: object) -> object:
+    """floor (편미분은 안쪽 식의 것을 그대로 전파)"""
 
-    skill_id: str
-    time: float
+    if isinstance(value, _PowerDual):
+        return _PowerDual(float(floor(value.value)), value.tangent)
 
+    return floor(value)  # type: ignore[call-overload]
 
-@dataclass(frozen=True, slots=True)
-class DamageEvent:
-    """최종 데미지 이벤트"""
 
-    skill_id: str
-    time: float
-    damage: float
+def _dual_formula_round(value: object, digits: int | None = None) -> object:
+    """round (편미분은 안쪽 식의 것을 그대로 전파)"""
 
+    if isinstance(value, _PowerDual):
+        return _PowerDual(float(round(value.value, digits)), value.tangent)
 
-@dataclass(frozen=True, slots=True)
-class GraphDamageEvent:
-    """그래프 출력용 단일 피해 이벤트"""
+    return round(value, digits)  # type: ignore[call-overload]
 
-    # 그래프 범례와 스킬 기여도 계산에 사용할 스킬 식별자
-    skill_id: str
-    # 그래프 x축 배치에 사용할 타격 시점
-    time: float
-    # 그래프 y축 배치에 사용할 최종 피해량
-    damage: float
 
+# 이원수 평가 함수 전용 제한 전역 네임스페이스 (abs/max/min은 이원수 연산자로 동작)
+_POWER_FORMULA_DUAL_CODE_GLOBALS: dict[str, object] = {
+    **_POWER_FORMULA_CODE_GLOBALS,
+    _POWER_FORMULA_CODE_FLOAT_NAME: _dual_formula_float,
+    "floor": _dual_formula_floor,
+    "round": _dual_formula_round,
+}
 
-@dataclass(frozen=True, slots=True)
-class GraphAnalysis:
-    """그래프 분석 카드 행 데이터"""
 
-    # 분석 카드 제목
-    title: str
-    # 기준값 표기 문자열
-    value: str
-    # 최소값 표기 문자열
-    min: str
-    # 최대값 표기 문자열
-    max: str
-    # 25퍼센타일 표기 문자열
-    p25: str
-    # 75퍼센타일 표기 문자열
-    p75: str
+def _wrap_power_formula_cast(node: ast.expr, cast_name: str) -> ast.expr:
+    """생성 코드 표현식에 float/bool 변환 호출 추가"""
 
-    def get_data_from_str(self, data_name: str) -> str:
-        """분석 카드 세부 항목 문자열 반환"""
+    return ast.copy_location(
+        ast.Call(
+            func=ast.Name(id=cast_name, ctx=ast.Load()),
+            args=[node],
+            keywords=[],
+        ),
+        node,
+    )
 
-        if not hasattr(self, data_name):
-            raise AttributeError(f"{data_name} 항목이 존재하지 않습니다.")
 
-        return str(getattr(self, data_name))
+def _lower_power_formula_expression(
+    node: ast.expr,
+    local_names: frozenset[str],
+) -> ast.expr:
+    """검증된 표현식 AST를 인터프리터와 동일 의미의 파이썬 AST로 변환"""
 
+    lowered: ast.expr
 
-@dataclass(frozen=True, slots=True)
-class GraphReport:
-    """그래프/요약 화면 공용 리포트"""
+    # 지역 변수는 접두사 이름, 입력 변수는 입력 딕셔너리 조회로 변환
+    if isinstance(node, ast.Name):
+        if node.id in local_names:
+            lowered = ast.Name(
+                id=f"{_POWER_FORMULA_CODE_LOCAL_PREFIX}{node.id}",
+                ctx=ast.Load(),
+            )
+        else:
+            lowered = ast.Subscript(
+                value=ast.Name(id=_POWER_FORMULA_CODE_INPUTS_NAME, ctx=ast.Load()),
+                slice=ast.Constant(value=node.id),
+                ctx=ast.Load(),
+            )
 
-    # 그래프 분석 카드 데이터
-    analysis: tuple[GraphAnalysis, ...] = ()
+    elif isinstance(node, ast.Constant):
+        lowered = ast.Constant(value=node.value)
 
-    # 보스 기준 결정론 타격 이벤트 목록
-    deterministic_boss_attacks: tuple[GraphDamageEvent, ...] = ()
+    # 이항 연산은 양쪽 피연산자를 float로 변환
+    elif isinstance(node, ast.BinOp):
+        lowered = ast.BinOp(
+            left=_wrap_power_formula_cast(
+                _lower_power_formula_expression(node.left, local_names),
+                _POWER_FORMULA_CODE_FLOAT_NAME,
+            ),
+            op=node.op,
+            right=_wrap_power_formula_cast(
+                _lower_power_formula_expression(node.right, local_names),
+                _POWER_FORMULA_CODE_FLOAT_NAME,
+            ),
+        )
 
-    # 보스 기준 확률론 타격 이벤트 목록
-    random_boss_attacks: tuple[tuple[GraphDamageEvent, ...], ...] = ()
+    # 부호 연산은 float, not 연산은 bool 결과 유지
+    elif isinstance(node, ast.UnaryOp):
+        operand: ast.expr = _lower_power_formula_expression(node.operand, local_names)
+        if not isinstance(node.op, ast.Not):
+            operand = _wrap_power_formula_cast(operand, _POWER_FORMULA_CODE_FLOAT_NAME)
 
+        lowered = ast.UnaryOp(op=node.op, operand=operand)
 
-@dataclass(frozen=True, slots=True)
-class EvaluationContext:
-    """평가 기준이 되는 초기 상태 컨텍스트"""
+    elif isinstance(node, ast.IfExp):
+        lowered = ast.IfExp(
+            test=_lower_power_formula_expression(node.test, local_names),
+            body=_lower_power_formula_expression(node.body, local_names),
+            orelse=_lower_power_formula_expression(node.orelse, local_names),
+        )
 
-    timeline_artifacts: TimelineEvaluationArtifacts
-    baseline_base_stats: BaseStats
-    baseline_final_stats: FinalStats
-    baseline_power: float
-    server_spec: "ServerSpec"
-    preset: "MacroPreset"
-    skills_info: dict[str, "SkillUsageSetting"]
-    delay_ms: int
-    compiled_custom_formula: CompiledPowerFormula | None
+    # 연쇄 비교는 파이썬 단락 평가를 그대로 쓰고 피연산자만 float로 변환
+    elif isinstance(node, ast.Compare):
+        lowered = ast.Compare(
+            left=_wrap_power_formula_cast(
+                _lower_power_formula_expression(node.left, local_names),
+                _POWER_FORMULA_CODE_FLOAT_NAME,
+            ),
+            ops=list(node.ops),
+            comparators=[
+                _wrap_power_formula_cast(
+                    _lower_power_formula_expression(comparator, local_names),
+                    _POWER_FORMULA_CODE_FLOAT_NAME,
+                )
+                for comparator in node.comparators
+            ],
+        )
 
+    # and/or 는 피연산자 값 대신 bool 결과를 반환하도록 변환
+    elif isinstance(node, ast.BoolOp):
+        lowered = ast.BoolOp(
+            op=node.op,
+            values=[
+                _wrap_power_formula_cast(
+                    _lower_power_formula_expression(bool_value, local_names),
+                    _POWER_FORMULA_CODE_BOOL_NAME,
+                )
+                for bool_value in node.values
+            ],
+        )
 
-@dataclass(frozen=True, slots=True)
-class LevelUpEvaluation:
-    """
-    레벨업 효율 계산 결과
-    1 레벨업으로 얻는 `체력 +5과 스탯 포인트 5개`를 최적으로 분배했을 때의 스탯 분배와 전투력 변화량
-    """
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        lowered = ast.Call(
+            func=ast.Name(id=node.func.id, ctx=ast.Load()),
+            args=[
+                _lower_power_formula_expression(call_arg, local_names)
+                for call_arg in node.args
+            ],
+            keywords=[],
+        )
 
-    stat_distribution: dict[StatKey, int]
-    delta: float
+    else:
+        raise ValueError(f"unsupported compiled power formula node: {type(node)}")
 
+    return ast.copy_location(lowered, node)
 
-@dataclass(frozen=True, slots=True)
-class RealmAdvanceEvaluation:
-    """
-    다음 경지 효율 계산 결과
-    다음 경지로 진급할 때의 경지 포인트 분배와 전투력 변화량
-    """
 
-    target_realm: RealmTier
-    danjeon_distribution: tuple[int, int, int]
-    delta: float
+def _lower_power_formula_statements(
+    statements: tuple[ast.stmt, ...] | list[ast.stmt],
+    local_names: frozenset[str],
+) -> list[ast.stmt]:
+    """검증된 문장 AST 목록을 인터프리터와 동일 의미의 파이썬 AST로 변환"""
 
+    lowered_statements: list[ast.stmt] = []
+    statement: ast.stmt
+    for statement in statements:
+        lowered: ast.stmt
+        if isinstance(statement, ast.Assign):
+            assign_target: ast.Name = cast(ast.Name, statement.targets[0])
+            lowered = ast.Assign(
+                targets=[
+                    ast.Name(
+                        id=f"{_POWER_FORMULA_CODE_LOCAL_PREFIX}{assign_target.id}",
+                        ctx=ast.Store(),
+                    )
+                ],
+                value=_lower_power_formula_expression(statement.value, local_names),
+            )
 
-@dataclass(frozen=True, slots=True)
-class ScrollUpgradeEvaluation:
-    """무공비급 레벨 상승 효율 계산 결과"""
+        # 복합 대입은 좌변 현재 값과 우변을 float 변환한 일반 대입으로 변환
+        elif isinstance(statement, ast.AugAssign):
+            assign_target: ast.Name = cast(ast.Name, statement.target)
+            local_name: str = f"{_POWER_FORMULA_CODE_LOCAL_PREFIX}{assign_target.id}"
+            lowered = ast.Assign(
+                targets=[ast.Name(id=local_name, ctx=ast.Store())],
+                value=ast.copy_location(
+                    ast.BinOp(
+                        left=_wrap_power_formula_cast(
+                            ast.copy_location(
+                                ast.Name(id=local_name, ctx=ast.Load()),
+                                statement,
+                            ),
+                            _POWER_FORMULA_CODE_FLOAT_NAME,
+                        ),
+                        op=statement.op,
+                        right=_wrap_power_formula_cast(
+                            _lower_power_formula_expression(
+                                statement.value,
+                                local_names,
+                            ),
+                            _POWER_FORMULA_CODE_FLOAT_NAME,
+                        ),
+                    ),
+                    statement,
+                ),
+            )
 
-    scroll_id: str
-    scroll_name: str
-    next_level: int
-    delta: float
+        elif isinstance(statement, ast.If):
+            lowered = ast.If(
+                test=_lower_power_formula_expression(statement.test, local_names),
+                body=_lower_power_formula_statements(statement.body, local_names),
+                orelse=_lower_power_formula_statements(statement.orelse, local_names),
+            )
 
+        elif isinstance(statement, ast.Pass):
+            lowered = ast.Pass()
 
-@dataclass(frozen=True, slots=True)
-class Contribution:
-    """현재 선택 기여 합산 결과"""
+        else:
+            raise ValueError(
+                f"unsupported compiled power formula statement: {type(statement)}"
+            )
 
-    values: dict[StatKey, float] = field(default_factory=dict)
+        lowered_statements.append(ast.copy_location(lowered, statement))
 
-    def add(self, stat_key: StatKey, value: float) -> "Contribution":
-        """스탯 변화가 반영된 (frozen=True이므로) 새 기여 반환"""
+    return lowered_statements
 
-        next_values: dict[StatKey, float] = self.values.copy()
-        next_values[stat_key] = next_values.get(stat_key, 0.0) + value
 
-        return type(self)(values=next_values)
+def _build_power_formula_evaluator(
+    statements: tuple[ast.stmt, ...],
+    result_expression: ast.expr | None,
+    code_globals: dict[str, object] = _POWER_FORMULA_CODE_GLOBALS,
+) -> Callable[[dict[str, float | int | bool]], float]:
+    """검증된 전투력 공식 AST를 제한 네임스페이스 함수로 컴파일"""
+
+    # 스크립트 내 대입 대상 이름 수집 (예약 이름 대입 금지로 입력 변수와 분리됨)
+    local_names: frozenset[str] = frozenset(
+        node.id
+        for statement in statements
+        for node in ast.walk(statement)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+    )
 
-    def merge(self, *others: "Contribution") -> "Contribution":
-        """여러 기여를 합산한 새 기여 반환"""
+    # 마지막 표현식 또는 result 지역 변수를 float 로 반환하는 함수 본문 구성
+    body: list[ast.stmt] = _lower_power_formula_statements(statements, local_names)
+    return_value: ast.expr
+    if result_expression is not None:
+        return_value = _lower_power_formula_expression(result_expression, local_names)
+    else:
+        return_value = ast.Name(
+            id=f"{_POWER_FORMULA_CODE_LOCAL_PREFIX}result",
+            ctx=ast.Load(),
+        )
 
-        merged_values: dict[StatKey, float] = self.values.copy()
+    body.append(
+        ast.Return(
+            value=_wrap_power_formula_cast(
+                return_value,
+                _POWER_FORMULA_CODE_FLOAT_NAME,
+            )
+        )
+    )
+    function_def: ast.FunctionDef = ast.FunctionDef(
+        name=_POWER_FORMULA_CODE_FUNCTION_NAME,
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=_POWER_FORMULA_CODE_INPUTS_NAME)],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=body,
+        decorator_list=[],
+    )
+    module: ast.Module = ast.fix_missing_locations(
+        ast.Module(body=[function_def], type_ignores=[])
+    )
+
+    # 허용 함수만 노출한 전역 네임스페이스에서 함수 정의 실행
+    namespace: dict[str, object] = dict(code_globals)
+    exec(compile(module, _POWER_FORMULA_CODE_FILENAME, "exec"), namespace)
+    return cast(
+        Callable[[dict[str, float | int | bool]], float],
+        namespace[_POWER_FORMULA_CODE_FUNCTION_NAME],
+    )
+
+
+def _evaluate_compiled_power_formula(
+    compiled_formula: CompiledPowerFormula,
+    input_variables: dict[str, float | int | bool],
+) -> float:
+    """검증된 전투력 공식 스크립트 전체 평가"""
+
+    # 컴파일 시 생성한 바이트코드 함수로 평가
+    return compiled_formula.evaluator(input_variables)
+
+
+def _get_power_formula_dual_evaluator(
+    compiled_formula: CompiledPowerFormula,
+) -> Callable[[dict[str, object]], object]:
+    """이원수 입력용 평가 함수 반환 (같은 AST를 이원수 네임스페이스로 1회 컴파일)"""
+
+    dual_evaluator: Callable[[dict[str, object]], object] | None = (
+        compiled_formula.dual_evaluator
+    )
+    if dual_evaluator is None:
+        dual_evaluator = cast(
+            Callable[[dict[str, object]], object],
+            _build_power_formula_evaluator(
+                compiled_formula.statements,
+                compiled_formula.result_expression,
+                _POWER_FORMULA_DUAL_CODE_GLOBALS,
+            ),
+        )
+        object.__setattr__(compiled_formula, "dual_evaluator", dual_evaluator)
+
+    return dual_evaluator
+
+
+# 배치 평가 허용 함수 (원소별 배열 연산 대응)
+def _batch_formula_max(*values: np.ndarray | float) -> np.ndarray | float:
+    """원소별 max (단일 인자는 스칼라 경로와 동일하게 오류)"""
+
+    if len(values) == 1:
+        raise TypeError("'float' object is not iterable")
+
+    return np.maximum.reduce(np.broadcast_arrays(*values))
+
+
+def _batch_formula_min(*values: np.ndarray | float) -> np.ndarray | float:
+    """원소별 min (단일 인자는 스칼라 경로와 동일하게 오류)"""
+
+    if len(values) == 1:
+        raise TypeError("'float' object is not iterable")
+
+    return np.minimum.reduce(np.broadcast_arrays(*values))
+
+
+def _batch_formula_round(
+    value: np.ndarray | float,
+    digits: int = 0,
+) -> np.ndarray | float:
+    """
+    원소별 round (스칼라 경로의 파이썬 round와 모든 원소에서 같은 값 보장)
+    np.round는 10^n 배율 곱셈 오차로 .5 근처 값의 방향이 달라질 수 있어 사용하지 않는다.
+    """
+
+    rounded: np.ndarray = round_float_values(value, digits)
+    if rounded.ndim == 0:
+        return float(rounded)
+
+    return rounded
+
+
+_POWER_FORMULA_BATCH_FUNCTIONS: dict[str, Callable[..., np.ndarray | float]] = {
+    "abs": np.abs,
+    "floor": np.floor,
+    "max": _batch_formula_max,
+    "min": _batch_formula_min,
+    "round": _batch_formula_round,
+}
+
+# 배치 평가 비교 연산 함수
+_POWER_FORMULA_BATCH_COMPARE_OPS: dict[
+    type[ast.cmpop], Callable[[np.ndarray, np.ndarray], np.ndarray]
+] = {
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+}
+
+
+def _evaluate_power_formula_expression_batch(
+    node: ast.AST,
+    input_variables: dict[str, np.ndarray | float | int | bool],
+    local_variables: dict[str, np.ndarray | float | int | bool],
+) -> np.ndarray | float | int | bool:
+    """검증된 전투력 공식 표현식 AST 원소별 배열 평가"""
+
+    # 지역 변수 우선의 변수/상수 단말 노드 평가
+    if isinstance(node, ast.Name):
+        if node.id in local_variables:
+            return local_variables[node.id]
+
+        return input_variables[node.id]
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, int | float | bool):
+        return node.value
+
+    # 산술 이항 연산 평가 (스칼라 경로와 동일하게 float 변환)
+    if isinstance(node, ast.BinOp):
+        left_value: np.ndarray = np.asarray(
+            _evaluate_power_formula_expression_batch(
+                node.left,
+                input_variables,
+                local_variables,
+            ),
+            dtype=np.float64,
+        )
+        right_value: np.ndarray = np.asarray(
+            _evaluate_power_formula_expression_batch(
+                node.right,
+                input_variables,
+                local_variables,
+            ),
+            dtype=np.float64,
+        )
+        return _apply_power_formula_bin_op(node.op, left_value, right_value)
+
+    # 산술/논리 단항 연산 평가
+    if isinstance(node, ast.UnaryOp):
+        operand_value: np.ndarray | float | int | bool = (
+            _evaluate_power_formula_expression_batch(
+                node.operand,
+                input_variables,
+                local_variables,
+            )
+        )
+        if isinstance(node.op, ast.UAdd):
+            return +np.asarray(operand_value, dtype=np.float64)
+
+        if isinstance(node.op, ast.USub):
+            return -np.asarray(operand_value, dtype=np.float64)
+
+        if isinstance(node.op, ast.Not):
+            return np.logical_not(operand_value)
+
+    # 삼항 if 식은 양쪽 값을 모두 계산한 뒤 where 로 선택
+    if isinstance(node, ast.IfExp):
+        condition_value: np.ndarray = np.asarray(
+            _evaluate_power_formula_expression_batch(
+                node.test,
+                input_variables,
+                local_variables,
+            ),
+            dtype=bool,
+        )
+        return np.where(
+            condition_value,
+            _evaluate_power_formula_expression_batch(
+                node.body,
+                input_variables,
+                local_variables,
+            ),
+            _evaluate_power_formula_expression_batch(
+                node.orelse,
+                input_variables,
+                local_variables,
+            ),
+        )
+
+    # 연쇄 비교는 인접 비교 결과의 논리곱으로 평가
+    if isinstance(node, ast.Compare):
+        left_value: np.ndarray = np.asarray(
+            _evaluate_power_formula_expression_batch(
+                node.left,
+                input_variables,
+                local_variables,
+            ),
+            dtype=np.float64,
+        )
+        compare_result: np.ndarray | bool = True
+        compare_index: int
+        compare_op: ast.cmpop
+        for compare_index, compare_op in enumerate(node.ops):
+            right_value: np.ndarray = np.asarray(
+                _evaluate_power_formula_expression_batch(
+                    node.comparators[compare_index],
+                    input_variables,
+                    local_variables,
+                ),
+                dtype=np.float64,
+            )
+            compare_result = np.logical_and(
+                compare_result,
+                _POWER_FORMULA_BATCH_COMPARE_OPS[type(compare_op)](
+                    left_value,
+                    right_value,
+                ),
+            )
+            left_value = right_value
+
+        return compare_result
+
+    # and/or 논리식 평가
+    if isinstance(node, ast.BoolOp):
+        bool_values: list[np.ndarray | float | int | bool] = [
+            _evaluate_power_formula_expression_batch(
+                bool_value,
+                input_variables,
+                local_variables,
+            )
+            for bool_value in node.values
+        ]
+        if isinstance(node.op, ast.And):
+            return np.logical_and.reduce(np.broadcast_arrays(*bool_values))
+
+        if isinstance(node.op, ast.Or):
+            return np.logical_or.reduce(np.broadcast_arrays(*bool_values))
+
+    # 허용 함수 호출 평가
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        formula_function: Callable[..., np.ndarray | float] = (
+            _POWER_FORMULA_BATCH_FUNCTIONS[node.func.id]
+        )
+        call_args: list[np.ndarray | float | int | bool] = [
+            _evaluate_power_formula_expression_batch(
+                call_arg,
+                input_variables,
+                local_variables,
+            )
+            for call_arg in node.args
+        ]
+        return formula_function(*call_args)
+
+    raise ValueError(f"unsupported compiled power formula node: {type(node)}")
+
+
+def _execute_power_formula_statements_batch(
+    statements: tuple[ast.stmt, ...] | list[ast.stmt],
+    input_variables: dict[str, np.ndarray | float | int | bool],
+    local_variables: dict[str, np.ndarray | float | int | bool],
+) -> None:
+    """검증된 전투력 공식 스크립트 문장 원소별 배열 실행"""
+
+    statement: ast.stmt
+    for statement in statements:
+        if isinstance(statement, ast.Assign):
+            assign_target: ast.Name = cast(ast.Name, statement.targets[0])
+            local_variables[assign_target.id] = (
+                _evaluate_power_formula_expression_batch(
+                    statement.value,
+                    input_variables,
+                    local_variables,
+                )
+            )
+            continue
+
+        if isinstance(statement, ast.AugAssign):
+            assign_target: ast.Name = cast(ast.Name, statement.target)
+            target_name: str = assign_target.id
+            left_value: np.ndarray = np.asarray(
+                local_variables[target_name],
+                dtype=np.float64,
+            )
+            right_value: np.ndarray = np.asarray(
+                _evaluate_power_formula_expression_batch(
+                    statement.value,
+                    input_variables,
+                    local_variables,
+                ),
+                dtype=np.float64,
+            )
+            local_variables[target_name] = _apply_power_formula_bin_op(
+                statement.op,
+                left_value,
+                right_value,
+            )
+            continue
+
+        # if 문은 조건이 갈리는 경우 양쪽 분기를 각각 실행한 뒤 where 로 병합
+        if isinstance(statement, ast.If):
+            condition_value: np.ndarray = np.asarray(
+                _evaluate_power_formula_expression_batch(
+                    statement.test,
+                    input_variables,
+                    local_variables,
+                ),
+                dtype=bool,
+            )
+            if condition_value.all():
+                _execute_power_formula_statements_batch(
+                    statement.body,
+                    input_variables,
+                    local_variables,
+                )
+                continue
+
+            if not condition_value.any():
+                _execute_power_formula_statements_batch(
+                    statement.orelse,
+                    input_variables,
+                    local_variables,
+                )
+                continue
+
+            body_variables: dict[str, np.ndarray | float | int | bool] = (
+                local_variables.copy()
+            )
+            orelse_variables: dict[str, np.ndarray | float | int | bool] = (
+                local_variables.copy()
+            )
+            _execute_power_formula_statements_batch(
+                statement.body,
+                input_variables,
+                body_variables,
+            )
+            _execute_power_formula_statements_batch(
+                statement.orelse,
+                input_variables,
+                orelse_variables,
+            )
+
+            # 양쪽 분기에서 모두 정의된 변수만 이후 문장에서 참조 가능
+            variable_name: str
+            for variable_name in body_variables.keys() & orelse_variables.keys():
+                body_value: np.ndarray | float | int | bool = body_variables[
+                    variable_name
+                ]
+                orelse_value: np.ndarray | float | int | bool = orelse_variables[
+                    variable_name
+                ]
+                if body_value is orelse_value:
+                    local_variables[variable_name] = body_value
+                    continue
+
+                local_variables[variable_name] = np.where(
+                    condition_value,
+                    body_value,
+                    orelse_value,
+                )
+
+            continue
+
+        if isinstance(statement, ast.Pass):
+            continue
+
+        raise ValueError(
+            f"unsupported compiled power formula statement: {type(statement)}"
+        )
+
+
+def _evaluate_compiled_power_formula_batch(
+    compiled_formula: CompiledPowerFormula,
+    input_variables: dict[str, np.ndarray | float | int | bool],
+    row_count: int,
+) -> np.ndarray:
+    """검증된 전투력 공식 스크립트 전체 원소별 배열 평가"""
+
+    # 배열 연산은 행 단위 예외 대신 nan/inf 를 만들므로 경고만 억제
+    local_variables: dict[str, np.ndarray | float | int | bool] = {}
+    with np.errstate(all="ignore"):
+        _execute_power_formula_statements_batch(
+            compiled_formula.statements,
+            input_variables,
+            local_variables,
+        )
+
+        # 마지막 표현식 또는 result 변수에서 최종 값 확정
+        result_value: np.ndarray | float | int | bool
+        if compiled_formula.result_expression is not None:
+            result_value = _evaluate_power_formula_expression_batch(
+                compiled_formula.result_expression,
+                input_variables,
+                local_variables,
+            )
+        else:
+            result_value = local_variables["result"]
+
+    return np.broadcast_to(
+        np.asarray(result_value, dtype=np.float64),
+        (row_count,),
+    ).copy()
+
+
+# 내장 전투력 공식 AST 캐시
+_POWER_FORMULA_NODES: dict[PowerMetric, CompiledPowerFormula] = (
+    _build_power_formula_nodes()
+)
+
+
+def _build_resolved_stat_formula_variables(
+    resolved_stats: FinalStats,
+) -> dict[str, float | int]:
+    """최종 스탯 기준 내장 전투력 공식 변수 구성"""
+
+    formula_variables: dict[str, float | int] = {
+        stat_key.value: resolved_stats.values[stat_key]
+        for stat_key in OVERALL_STAT_ORDER
+    }
+    formula_variables[_POWER_FORMULA_LEVEL_NAME] = 0
+    formula_variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = 0.0
+    formula_variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = 0.0
+
+    for variable_name in _POWER_FORMULA_SKILL_VARIABLE_NAMES:
+        formula_variables[variable_name] = 0.0
+
+    return formula_variables
+
+
+def evaluate_official_power(resolved_stats: FinalStats) -> float:
+    """공식 전투력 값 계산"""
+
+    return _evaluate_compiled_power_formula(
+        _POWER_FORMULA_NODES[PowerMetric.OFFICIAL],
+        _build_resolved_stat_formula_variables(resolved_stats),
+    )
+
+
+def evaluate_builtin_power_metric(
+    resolved_stats: FinalStats,
+    power_metric: PowerMetric,
+) -> float:
+    """최종 스탯 기준 내장 전투력 공식 값 계산"""
+
+    return _evaluate_compiled_power_formula(
+        _POWER_FORMULA_NODES[power_metric],
+        _build_resolved_stat_formula_variables(resolved_stats),
+    )
+
+
+def _compute_power_gradient(
+    timeline_artifacts: TimelineEvaluationArtifacts,
+    base_changed_stats: dict[StatKey, float],
+    target_formula_id: str,
+    compiled_custom_formula: CompiledPowerFormula | None,
+    relevant_stat_keys: frozenset[StatKey],
+) -> dict[StatKey, float]:
+    """
+    기준점에서의 전투력 기울기 (∂power/∂stat) 계산
+    대상 스탯에 단위 편미분 벡터를 심은 이원수로 resolve와 공식을 1회 평가한다.
+    타임라인은 고정(스킬속도 경계 사이 계단 함수)이라 스킬속도 편미분은 0이고,
+    최종 스탯 반올림과 공식의 floor/round는 _dual_formula_floor와 같은
+    straight-through 규칙(안쪽 식의 편미분 전파)을 따른다.
+    """
+
+    # 대상 스탯마다 단위 편미분 벡터를 가진 이원수 입력 구성
+    ordered_stat_keys: list[StatKey] = list(relevant_stat_keys)
+    seed_tangents: np.ndarray = np.eye(len(ordered_stat_keys), dtype=np.float64)
+    seeded_stats: dict[StatKey, float | _PowerDual] = dict(base_changed_stats)
+    stat_index: int
+    stat_key: StatKey
+    for stat_index, stat_key in enumerate(ordered_stat_keys):
+        seeded_stats[stat_key] = _PowerDual(
+            float(base_changed_stats.get(stat_key, 0.0)),
+            seed_tangents[stat_index],
+        )
+
+    # 스탯 파생 규칙 → 피해량 변수 → 선택 공식 순으로 편미분 전파
+    compiled_formula: CompiledPowerFormula = _get_compiled_power_formula(
+        target_formula_id,
+        compiled_custom_formula,
+    )
+    power_value: object = _get_power_formula_dual_evaluator(compiled_formula)(
+        _build_power_formula_dual_variables(
+            timeline_artifacts,
+            derive_final_stat_values(seeded_stats),
+        )
+    )
+
+    # 대상 스탯과 무관하게 상수로 끝난 공식이면 기울기 0
+    if not isinstance(power_value, _PowerDual):
+        return {stat_key: 0.0 for stat_key in ordered_stat_keys}
+
+    return dict(zip(ordered_stat_keys, power_value.tangent.tolist()))
+
+
+def _score_contribution_by_gradient(
+    gradient: dict[StatKey, float],
+    contribution: Contribution,
+) -> float:
+    """기울기 기반 기여 점수 계산 (선형 근사)"""
+
+    score: float = 0.0
+    for stat_key, value in contribution.values.items():
+        grad_value: float | None = gradient.get(stat_key)
+        if grad_value is not None:
+            score += grad_value * value
+    return score
+
+
+def _fast_resolve(changed_stats: dict[StatKey, float]) -> FinalStats:
+    """enum 접근 최소화된 고속 resolve (사전 구성된 StatKey dict 전용)"""
+
+    return FinalStats(values=derive_final_stat_values(changed_stats))
+
+
+INVERSE_ROUND_DIGITS: int = 6
+
+
+@dataclass(frozen=True, slots=True)
+class HitEvent:
+    """단일 타격 이벤트"""
+
+    skill_id: str
+    time: float
+    multiplier: float
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineEvaluationArtifacts:
+    """타임라인 전투력 평가용 사전 계산 결과"""
+
+    hit_events: tuple[HitEvent, ...]
+    skill_slot_variables: dict[str, float | int]
+    level: int
+    # 타격 계수 총합 (피해량 = 총합 x 스탯 배율, 평가당 O(1) 집계용)
+    # 타격별 누적과 곱셈 결합 순서가 달라 상대 오차 1e-12 이내로만 일치
+    # (benchmarks/multiplier_sum_aggregation.py로 확인)
+    multiplier_sum: float
+
+
+@dataclass(frozen=True, slots=True)
+class SkillUseEvent:
+    """스킬 사용 이벤트"""
+
+    skill_id: str
+    time: float
+
+
+@dataclass(frozen=True, slots=True)
+class DamageEvent:
+    """최종 데미지 이벤트"""
+
+    skill_id: str
+    time: float
+    damage: float
+
+
+@dataclass(frozen=True, slots=True)
+class GraphDamageEvent:
+    """그래프 출력용 단일 피해 이벤트"""
+
+    # 그래프 범례와 스킬 기여도 계산에 사용할 스킬 식별자
+    skill_id: str
+    # 그래프 x축 배치에 사용할 타격 시점
+    time: float
+    # 그래프 y축 배치에 사용할 최종 피해량
+    damage: float
+
+
+@dataclass(frozen=True, slots=True)
+class GraphAnalysis:
+    """그래프 분석 카드 행 데이터"""
+
+    # 분석 카드 제목
+    title: str
+    # 기준값 표기 문자열
+    value: str
+    # 최소값 표기 문자열
+    min: str
+    # 최대값 표기 문자열
+    max: str
+    # 25퍼센타일 표기 문자열
+    p25: str
+    # 75퍼센타일 표기 문자열
+    p75: str
+
+    def get_data_from_str(self, data_name: str) -> str:
+        """분석 카드 세부 항목 문자열 반환"""
+
+        if not hasattr(self, data_name):
+            raise AttributeError(f"{data_name} 항목이 존재하지 않습니다.")
+
+        return str(getattr(self, data_name))
+
+
+@dataclass(frozen=True, slots=True)
+class GraphReport:
+    """그래프/요약 화면 공용 리포트"""
+
+    # 그래프 분석 카드 데이터
+    analysis: tuple[GraphAnalysis, ...] = ()
+
+    # 보스 기준 결정론 타격 이벤트 목록
+    deterministic_boss_attacks: tuple[GraphDamageEvent, ...] = ()
+
+    # 보스 기준 확률론 타격 이벤트 목록
+    random_boss_attacks: tuple[tuple[GraphDamageEvent, ...], ...] = ()
+
+
+@dataclass(slots=True)
+class SkillSpeedTimelineTable:
+    """스킬속도 구간별 타임라인 조회 테이블
+
+    스킬 쿨타임은 `int(cooltime * (100 - 스킬속도) * 10)` ms 정수로만 반영되므로,
+    정수값이 바뀌는 스킬속도(구간 경계) 사이에서는 타임라인이 동일하다.
+    이진 탐색으로 구간을 찾아 구간별 타임라인을 한 번만 구성해 재사용한다.
+    부동소수 오차로 정수 판정이 달라질 수 있는 경계 근접 값과 범위 밖 값은
+    정확한 스킬속도 기준으로 별도 구성한다.
+    """
+
+    server_spec: "ServerSpec"
+    preset: "MacroPreset"
+    skills_info: dict[str, "SkillUsageSetting"]
+    delay_ms: int
+    level: int
+    skill_slot_variables: dict[str, float | int]
+    # 오름차순 구간 경계 스킬속도 (경계값은 왼쪽 구간에 포함)
+    breakpoints: np.ndarray
+    min_speed: float = SKILL_SPEED_TABLE_MIN_PERCENT
+    max_speed: float = SKILL_SPEED_TABLE_MAX_PERCENT
+    interval_artifacts: dict[int, TimelineEvaluationArtifacts] = field(
+        default_factory=dict
+    )
+    exact_artifacts: dict[float, TimelineEvaluationArtifacts] = field(
+        default_factory=dict
+    )
+    # 누적 조회 수와 타임라인 구성 수 (조회 수 - 구성 수 = 테이블 적중 수)
+    lookup_count: int = 0
+    build_count: int = 0
+
+    def get(self, skill_speed: float) -> TimelineEvaluationArtifacts:
+        """스킬속도에 해당하는 타임라인 평가 데이터 반환"""
+
+        self.lookup_count += 1
+        interval_index: int | None = self._find_interval_index(skill_speed)
+        if interval_index is None:
+            exact_artifacts: TimelineEvaluationArtifacts | None = (
+                self.exact_artifacts.get(skill_speed)
+            )
+            if exact_artifacts is None:
+                exact_artifacts = self._build_artifacts(skill_speed)
+                self.exact_artifacts[skill_speed] = exact_artifacts
+
+            return exact_artifacts
+
+        artifacts: TimelineEvaluationArtifacts | None = self.interval_artifacts.get(
+            interval_index
+        )
+        if artifacts is None:
+            # 구간 내부 값이므로 조회한 스킬속도로 구성한 타임라인이 구간 대표값
+            artifacts = self._build_artifacts(skill_speed)
+            self.interval_artifacts[interval_index] = artifacts
+
+        return artifacts
+
+    def _find_interval_index(self, skill_speed: float) -> int | None:
+        """이진 탐색으로 구간 번호 조회 (범위 밖/경계 근접 시 None)"""
+
+        if not self.min_speed <= skill_speed <= self.max_speed:
+            return None
+
+        interval_index: int = int(np.searchsorted(self.breakpoints, skill_speed))
+        breakpoint_count: int = len(self.breakpoints)
+        if (
+            interval_index < breakpoint_count
+            and self.breakpoints[interval_index] - skill_speed
+            <= _SKILL_SPEED_BREAKPOINT_TOLERANCE
+        ):
+            return None
+
+        if (
+            interval_index > 0
+            and skill_speed - self.breakpoints[interval_index - 1]
+            <= _SKILL_SPEED_BREAKPOINT_TOLERANCE
+        ):
+            return None
+
+        return interval_index
+
+    def _build_artifacts(self, skill_speed: float) -> TimelineEvaluationArtifacts:
+        """정확한 스킬속도 기준 타임라인 평가 데이터 구성"""
+
+        self.build_count += 1
+        hit_events: tuple[HitEvent, ...] = build_calculator_timeline(
+            server_spec=self.server_spec,
+            preset=self.preset,
+            skills_info=self.skills_info,
+            delay_ms=self.delay_ms,
+            cooltime_reduction=skill_speed,
+        )
+        return _build_timeline_evaluation_artifacts(
+            hit_events,
+            level=self.level,
+            skill_slot_variables=self.skill_slot_variables,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EvaluationContext:
+    """평가 기준이 되는 초기 상태 컨텍스트"""
+
+    timeline_artifacts: TimelineEvaluationArtifacts
+    # 스킬속도 변화 시 타임라인 재사용 테이블
+    timeline_table: SkillSpeedTimelineTable
+    baseline_base_stats: BaseStats
+    baseline_final_stats: FinalStats
+    baseline_power: float
+    server_spec: "ServerSpec"
+    preset: "MacroPreset"
+    skills_info: dict[str, "SkillUsageSetting"]
+    delay_ms: int
+    compiled_custom_formula: CompiledPowerFormula | None
+
+
+@dataclass(frozen=True, slots=True)
+class LevelUpEvaluation:
+    """
+    레벨업 효율 계산 결과
+    1 레벨업으로 얻는 `체력 +5과 스탯 포인트 5개`를 최적으로 분배했을 때의 스탯 분배와 전투력 변화량
+    """
+
+    stat_distribution: dict[StatKey, int]
+    delta: float
+
+
+@dataclass(frozen=True, slots=True)
+class RealmAdvanceEvaluation:
+    """
+    다음 경지 효율 계산 결과
+    다음 경지로 진급할 때의 경지 포인트 분배와 전투력 변화량
+    """
+
+    target_realm: RealmTier
+    danjeon_distribution: tuple[int, int, int]
+    delta: float
+
+
+@dataclass(frozen=True, slots=True)
+class ScrollUpgradeEvaluation:
+    """무공비급 레벨 상승 효율 계산 결과"""
+
+    scroll_id: str
+    scroll_name: str
+    next_level: int
+    delta: float
+
+
+@dataclass(frozen=True, slots=True)
+class ScrollUpgradePlanStep:
+    """무공비급 강화 계획 단일 단계 결과 (이번 단계 증가량과 계획 시작 대비 누적 증가량)"""
+
+    scroll_id: str
+    scroll_name: str
+    next_level: int
+    delta: float
+    total_delta: float
+
+
+@dataclass(frozen=True, slots=True)
+class StatProbeEvaluation:
+    """스탯 효율 일괄 평가의 단일 프로브 (스탯, 변화량) 결과"""
+
+    stat_key: StatKey
+    amount: float
+    delta: float
+
+
+@dataclass(frozen=True, slots=True)
+class Contribution:
+    """현재 선택 기여 합산 결과"""
+
+    values: dict[StatKey, float] = field(default_factory=dict)
+
+    def add(self, stat_key: StatKey, value: float) -> "Contribution":
+        """스탯 변화가 반영된 (frozen=True이므로) 새 기여 반환"""
+
+        next_values: dict[StatKey, float] = self.values.copy()
+        next_values[stat_key] = next_values.get(stat_key, 0.0) + value
+
+        return type(self)(values=next_values)
+
+    def merge(self, *others: "Contribution") -> "Contribution":
+        """여러 기여를 합산한 새 기여 반환"""
+
+        merged_values: dict[StatKey, float] = self.values.copy()
 
         for target in others:
             for stat_key, value in target.values.items():
@@ -1622,6 +2613,19 @@ class Contribution:
 
         return base_stats.with_changes(self.values, is_add=is_add)
 
+    def to_vector(self) -> np.ndarray:
+        """OVERALL_STAT_ORDER 순서 기여 벡터 반환 (전체 스탯 외 키는 무시)"""
+
+        vector: np.ndarray = np.zeros(STAT_COUNT, dtype=np.float64)
+        stat_key: StatKey
+        value: float
+        for stat_key, value in self.values.items():
+            stat_index: int | None = STAT_INDEX.get(stat_key)
+            if stat_index is not None:
+                vector[stat_index] = value
+
+        return vector
+
 
 @dataclass(frozen=True, slots=True)
 class BaseState:
@@ -1662,6 +2666,107 @@ class OptimizationCandidate:
     equipped_talisman_names: tuple[str, ...]
 
 
+@dataclass(slots=True)
+class OptimizationStats:
+    """최적화 탐색 계측 값 (워커별 값을 merge로 합산)"""
+
+    # 분기 한정 범위 노드 전개/상계 가지치기 수
+    expanded_node_count: int = 0
+    pruned_node_count: int = 0
+    # 잎 노드(단일 분배) 평가 수
+    leaf_evaluation_count: int = 0
+    # 분배별 내부 선택지 평가 수와 그중 기울기 상위 K개 근사 평가 수
+    selection_evaluation_count: int = 0
+    approximate_selection_count: int = 0
+    # 분배 평가 결과 캐시(distribution_result_cache) 조회/적중 수
+    distribution_cache_lookup_count: int = 0
+    distribution_cache_hit_count: int = 0
+    # 스킬속도 타임라인 테이블 조회 수와 타임라인 구성 수
+    timeline_lookup_count: int = 0
+    timeline_build_count: int = 0
+    # 영속 타임라인 캐시(timeline_store) 적중 수와 스케줄러 재실행 수
+    timeline_store_hit_count: int = 0
+    timeline_rebuild_count: int = 0
+    # 전투력 공식 평가 행 수 (일괄 평가 행 + 단일 재확인 평가)
+    formula_evaluation_count: int = 0
+    # 제출한 탐색 작업 수와 이전 실행 결과 재사용 수
+    task_count: int = 0
+    result_store_hit_count: int = 0
+    # 단계별 소요 시간 (초, 워커 단계는 워커 시간 합계)
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def distribution_cache_hit_rate(self) -> float | None:
+        """분배 평가 결과 캐시 적중률 (조회가 없으면 None)"""
+
+        if not self.distribution_cache_lookup_count:
+            return None
+
+        return self.distribution_cache_hit_count / self.distribution_cache_lookup_count
+
+    @property
+    def timeline_cache_hit_rate(self) -> float | None:
+        """스킬속도 타임라인 테이블 적중률 (조회가 없으면 None)"""
+
+        if not self.timeline_lookup_count:
+            return None
+
+        return (
+            self.timeline_lookup_count - self.timeline_build_count
+        ) / self.timeline_lookup_count
+
+    def add_phase_seconds(self, phase: str, seconds: float) -> None:
+        """단계 소요 시간 누적"""
+
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    def merge(self, other: "OptimizationStats") -> None:
+        """다른 작업의 계측 값 합산"""
+
+        self.expanded_node_count += other.expanded_node_count
+        self.pruned_node_count += other.pruned_node_count
+        self.leaf_evaluation_count += other.leaf_evaluation_count
+        self.selection_evaluation_count += other.selection_evaluation_count
+        self.approximate_selection_count += other.approximate_selection_count
+        self.distribution_cache_lookup_count += other.distribution_cache_lookup_count
+        self.distribution_cache_hit_count += other.distribution_cache_hit_count
+        self.timeline_lookup_count += other.timeline_lookup_count
+        self.timeline_build_count += other.timeline_build_count
+        self.timeline_store_hit_count += other.timeline_store_hit_count
+        self.timeline_rebuild_count += other.timeline_rebuild_count
+        self.formula_evaluation_count += other.formula_evaluation_count
+        self.task_count += other.task_count
+        self.result_store_hit_count += other.result_store_hit_count
+
+        phase: str
+        seconds: float
+        for phase, seconds in other.phase_seconds.items():
+            self.add_phase_seconds(phase, seconds)
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON 로그용 사전 변환 (적중률 포함)"""
+
+        return {
+            "expanded_node_count": self.expanded_node_count,
+            "pruned_node_count": self.pruned_node_count,
+            "leaf_evaluation_count": self.leaf_evaluation_count,
+            "selection_evaluation_count": self.selection_evaluation_count,
+            "approximate_selection_count": self.approximate_selection_count,
+            "distribution_cache_lookup_count": self.distribution_cache_lookup_count,
+            "distribution_cache_hit_count": self.distribution_cache_hit_count,
+            "distribution_cache_hit_rate": self.distribution_cache_hit_rate,
+            "timeline_lookup_count": self.timeline_lookup_count,
+            "timeline_build_count": self.timeline_build_count,
+            "timeline_cache_hit_rate": self.timeline_cache_hit_rate,
+            "timeline_store_hit_count": self.timeline_store_hit_count,
+            "timeline_rebuild_count": self.timeline_rebuild_count,
+            "formula_evaluation_count": self.formula_evaluation_count,
+            "task_count": self.task_count,
+            "result_store_hit_count": self.result_store_hit_count,
+            "phase_seconds": dict(self.phase_seconds),
+        }
+
+
 @dataclass(frozen=True, slots=True)
 class OptimizationResult:
     """최적화 최종 결과"""
@@ -1669,6 +2774,32 @@ class OptimizationResult:
     candidate: OptimizationCandidate
     delta: float
     base_stats: BaseStats
+    # 내부 조합을 전수/상계 한정 탐색했으면 True, 기울기 상위 K개 근사면 False
+    is_exact: bool
+    # optimize_current_selection이 반환할 때 채우는 전체 탐색 계측 값
+    stats: OptimizationStats | None = field(default=None, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class OptimizationIncumbent:
+    """anytime 최적화 진행 중 현재 최고 해와 증명된 상계"""
+
+    result: OptimizationResult
+    # 남은 탐색 범위 상계의 최댓값 (상계를 아직 구하지 못한 범위가 있으면 None)
+    upper_bound: float | None
+    # 최적화 시작 이후 경과 시간 (초)
+    elapsed_seconds: float
+    # 탐색 공간을 모두 확인해 최적이 증명되었는지 여부
+    is_complete: bool
+
+    @property
+    def gap(self) -> float | None:
+        """현재 최고 해와 상계의 차이 (상계를 모르면 None)"""
+
+        if self.upper_bound is None:
+            return None
+
+        return max(0.0, self.upper_bound - self.result.delta)
 
 
 @dataclass(frozen=True, slots=True)
@@ -1709,6 +2840,30 @@ class DanjeonSearchRange:
     use_reset: bool
 
 
+@dataclass(frozen=True, slots=True)
+class SubtreeSearchOutcome:
+    """서브트리 탐색 작업 결과"""
+
+    best_result: OptimizationResult | None
+    # 시간 제한으로 탐색하지 못한 (상계, 범위) 목록
+    pending_ranges: tuple[tuple[float, DistributionSearchRange], ...]
+    # 분배 선택 평가 횟수
+    node_count: int
+    stats: OptimizationStats
+
+
+@dataclass(frozen=True, slots=True)
+class ParallelSearchOutcome:
+    """병렬 분기 한정 탐색 전체 결과"""
+
+    best_result: OptimizationResult | None
+    node_count: int
+    # 재분배 작업을 포함한 전체 제출 작업 수
+    task_count: int
+    # 전체 작업 계측 합계
+    stats: OptimizationStats
+
+
 EntryPayload = TypeVar("EntryPayload")
 
 
@@ -1973,80 +3128,139 @@ def _build_skill_sequence(
     return tuple(skill_sequence)
 
 
-def _update_prepared_skills(
-    placed_refs: list[EquippedSkillRef],
-    skill_cooltime_timers_ms: dict[EquippedSkillRef, int],
-    skill_cooltimes_ms: dict[EquippedSkillRef, int],
-    elapsed_time_ms: int,
-    prepared_skills: set[EquippedSkillRef],
-) -> None:
-    """쿨타임 종료 스킬 준비 상태 반영"""
+@dataclass(slots=True)
+class _SkillScheduleState:
+    """이벤트 기반 스킬 스케줄러 상태
 
-    # 현재 시점까지 쿨타임이 끝난 스킬만 준비 상태로 복귀
-    for skill_ref in placed_refs:
-        if skill_ref in prepared_skills:
-            continue
+    준비 상태 집합을 매 시점 전체 스캔하는 대신 쿨타임 종료 시각 힙,
+    우선순위 힙, 자동 연계 그룹별 미준비 스킬 수를 증분 관리한다.
+    힙 항목은 지연 삭제 방식으로 꺼낼 때 유효성을 확인한다.
+    """
 
-        elapsed_from_last_use: int = (
-            elapsed_time_ms - skill_cooltime_timers_ms[skill_ref]
-        )
-        if elapsed_from_last_use < skill_cooltimes_ms[skill_ref]:
-            continue
+    # 현재 준비 상태 스킬
+    prepared_skills: set[EquippedSkillRef]
+    # 스킬별 쿨타임 (ms)
+    skill_cooltimes_ms: dict[EquippedSkillRef, int]
+    # 스킬별 우선순위 순서 위치
+    sequence_indices: dict[EquippedSkillRef, int]
+    # 우선순위 순서 위치별 스킬
+    sequence_refs: tuple[EquippedSkillRef, ...]
+    # 단독 사용 가능 여부 (연계 소속이면 use_alone, 아니면 use_skill)
+    usable_alone: dict[EquippedSkillRef, bool]
+    # 자동 연계 그룹 목록과 스킬별 소속 그룹 인덱스
+    auto_link_skills: list[list[EquippedSkillRef]]
+    link_group_indices: dict[EquippedSkillRef, tuple[int, ...]]
+    # 자동 연계 그룹별 미준비 스킬 수
+    link_missing_counts: list[int]
+    # 단독 사용 가능한 준비 스킬 우선순위 힙 (순서 위치)
+    usable_heap: list[int] = field(default_factory=list)
+    # 모든 스킬이 준비된 자동 연계 그룹 힙 (그룹 인덱스)
+    ready_link_heap: list[int] = field(default_factory=list)
+    # 쿨타임 종료 시각 힙 (종료 시각, 삽입 순번, 스킬)
+    cooltime_heap: list[tuple[int, int, EquippedSkillRef]] = field(default_factory=list)
+    # 스킬별 최신 쿨타임 종료 시각
+    ready_times_ms: dict[EquippedSkillRef, int] = field(default_factory=dict)
+    push_count: int = 0
+
+    def mark_prepared(self, skill_ref: EquippedSkillRef) -> None:
+        """스킬 준비 상태 전환 및 우선순위/연계 힙 갱신"""
+
+        if skill_ref in self.prepared_skills:
+            return
 
-        prepared_skills.add(skill_ref)
+        self.prepared_skills.add(skill_ref)
+        if self.usable_alone[skill_ref]:
+            heapq.heappush(self.usable_heap, self.sequence_indices[skill_ref])
 
+        group_index: int
+        for group_index in self.link_group_indices[skill_ref]:
+            self.link_missing_counts[group_index] -= 1
+            if self.link_missing_counts[group_index] == 0:
+                heapq.heappush(self.ready_link_heap, group_index)
 
-def _build_next_task_list(
-    preset: "MacroPreset",
-    skills_info: dict[str, "SkillUsageSetting"],
-    prepared_skills: set[EquippedSkillRef],
-    link_skill_requirements: list[list[EquippedSkillRef]],
-    auto_link_skills: list[list[EquippedSkillRef]],
-    skill_sequence: tuple[EquippedSkillRef, ...],
-) -> list[EquippedSkillRef]:
-    """현재 시점 기준 실행 가능한 다음 작업 목록 구성"""
-
-    # 자동 연계 완성 여부를 먼저 확인
-    prepared_link_indices: list[int] = get_prepared_link_skill_indices(
-        prepared_skills=prepared_skills,
-        link_skills_requirements=link_skill_requirements,
-    )
-    if prepared_link_indices:
-        target_link_skills: list[EquippedSkillRef] = auto_link_skills[
-            prepared_link_indices[0]
-        ]
-        task_list: list[EquippedSkillRef] = []
-        for skill_ref in target_link_skills:
-            prepared_skills.discard(skill_ref)
-            task_list.append(skill_ref)
-
-        return task_list
-
-    # 자동 연계에 속한 스킬 참조 집합 구성
-    linked_skill_refs: set[EquippedSkillRef] = {
-        skill_ref
-        for requirement_group in link_skill_requirements
-        for skill_ref in requirement_group
-    }
+    def mark_unprepared(self, skill_ref: EquippedSkillRef) -> None:
+        """스킬 미준비 상태 전환 (힙 항목은 지연 삭제)"""
 
-    # 우선순위 순서대로 사용 가능한 첫 스킬 선택
-    for skill_ref in skill_sequence:
-        if skill_ref not in prepared_skills:
-            continue
+        if skill_ref not in self.prepared_skills:
+            return
 
-        skill_id: str = preset.skills.get_placed_skill_id(skill_ref)
-        setting: "SkillUsageSetting" = skills_info[skill_id]
-        in_link: bool = skill_ref in linked_skill_refs
-        can_use: bool = (in_link and setting.use_alone) or (
-            not in_link and setting.use_skill
+        self.prepared_skills.discard(skill_ref)
+        group_index: int
+        for group_index in self.link_group_indices[skill_ref]:
+            self.link_missing_counts[group_index] += 1
+
+    def mark_used(self, skill_ref: EquippedSkillRef, elapsed_time_ms: int) -> None:
+        """스킬 사용 시각 기준 쿨타임 종료 이벤트 등록"""
+
+        ready_time_ms: int = elapsed_time_ms + self.skill_cooltimes_ms[skill_ref]
+        self.ready_times_ms[skill_ref] = ready_time_ms
+        self.push_count += 1
+        heapq.heappush(
+            self.cooltime_heap,
+            (ready_time_ms, self.push_count, skill_ref),
         )
-        if not can_use:
-            continue
 
-        prepared_skills.discard(skill_ref)
-        return [skill_ref]
+    def _discard_stale_cooltimes(self) -> None:
+        """재사용으로 덮어써진 쿨타임 종료 이벤트 제거"""
+
+        while self.cooltime_heap:
+            ready_time_ms: int
+            skill_ref: EquippedSkillRef
+            ready_time_ms, _, skill_ref = self.cooltime_heap[0]
+            if self.ready_times_ms.get(skill_ref) == ready_time_ms:
+                return
+
+            heapq.heappop(self.cooltime_heap)
+
+    def release_ready(self, elapsed_time_ms: int) -> None:
+        """현재 시점까지 쿨타임이 끝난 스킬만 준비 상태로 복귀"""
+
+        self._discard_stale_cooltimes()
+        while self.cooltime_heap and self.cooltime_heap[0][0] <= elapsed_time_ms:
+            skill_ref: EquippedSkillRef = heapq.heappop(self.cooltime_heap)[2]
+            del self.ready_times_ms[skill_ref]
+            self.mark_prepared(skill_ref)
+            self._discard_stale_cooltimes()
+
+    def next_ready_time(self) -> int | None:
+        """가장 빨리 쿨타임이 끝나는 시각 반환 (대기 스킬이 없으면 None)"""
 
-    return []
+        self._discard_stale_cooltimes()
+        if not self.cooltime_heap:
+            return None
+
+        return self.cooltime_heap[0][0]
+
+    def take_next_tasks(self) -> list[EquippedSkillRef]:
+        """현재 시점 기준 실행 가능한 다음 작업 목록 구성"""
+
+        # 자동 연계 완성 여부를 먼저 확인 (가장 앞선 완성 그룹 선택)
+        while self.ready_link_heap:
+            group_index: int = self.ready_link_heap[0]
+            if self.link_missing_counts[group_index] != 0:
+                heapq.heappop(self.ready_link_heap)
+                continue
+
+            target_link_skills: list[EquippedSkillRef] = self.auto_link_skills[
+                group_index
+            ]
+            skill_ref: EquippedSkillRef
+            for skill_ref in target_link_skills:
+                self.mark_unprepared(skill_ref)
+
+            return list(target_link_skills)
+
+        # 우선순위 순서대로 사용 가능한 첫 스킬 선택
+        while self.usable_heap:
+            sequence_index: int = heapq.heappop(self.usable_heap)
+            skill_ref: EquippedSkillRef = self.sequence_refs[sequence_index]
+            if skill_ref not in self.prepared_skills:
+                continue
+
+            self.mark_unprepared(skill_ref)
+            return [skill_ref]
+
+        return []
 
 
 def build_skill_use_sequence(
@@ -2066,7 +3280,6 @@ def build_skill_use_sequence(
         return ()
 
     # 자동 연계 계산에 필요한 배치/설정 맵 구성
-    prepared_skills: set[EquippedSkillRef] = set(placed_refs)
     skill_ref_map: dict[str, EquippedSkillRef] = preset.skills.get_placed_skill_ref_map(
         server_spec
     )
@@ -2076,83 +3289,130 @@ def build_skill_use_sequence(
         if link_skill.use_type == LinkUseType.AUTO
         and all(skill_id in skill_ref_map for skill_id in link_skill.skills)
     ]
-    link_skill_requirements: list[list[EquippedSkillRef]] = [
-        [skill_ref for skill_ref in link_skill_group]
-        for link_skill_group in auto_link_skills
-    ]
     skill_sequence: tuple[EquippedSkillRef, ...] = _build_skill_sequence(
         server_spec=server_spec,
         preset=preset,
         skills_info=skills_info,
     )
 
-    # 쿨타임 감소를 반영한 스킬별 재사용 대기시간 계산
-    skill_cooltime_timers_ms: dict[EquippedSkillRef, int] = {
-        skill_ref: 0 for skill_ref in placed_refs
+    # 배치 위치별 스킬 ID, 소속 자동 연계 그룹, 단독 사용 가능 여부 사전 계산
+    placed_skill_ids: dict[EquippedSkillRef, str] = {
+        skill_ref: preset.skills.get_placed_skill_id(skill_ref)
+        for skill_ref in placed_refs
+    }
+    link_group_indices: dict[EquippedSkillRef, tuple[int, ...]] = {
+        skill_ref: tuple(
+            group_index
+            for group_index, link_group in enumerate(auto_link_skills)
+            if skill_ref in link_group
+        )
+        for skill_ref in placed_refs
     }
+    usable_alone: dict[EquippedSkillRef, bool] = {}
+    skill_ref: EquippedSkillRef
+    for skill_ref in placed_refs:
+        setting: "SkillUsageSetting" = skills_info[placed_skill_ids[skill_ref]]
+        in_link: bool = bool(link_group_indices[skill_ref])
+        usable_alone[skill_ref] = (in_link and setting.use_alone) or (
+            not in_link and setting.use_skill
+        )
+
+    # 쿨타임 감소를 반영한 스킬별 재사용 대기시간 계산
     skill_cooltimes_ms: dict[EquippedSkillRef, int] = {
         skill_ref: int(
-            server_spec.skill_registry.get(
-                preset.skills.get_placed_skill_id(skill_ref)
-            ).cooltime
+            server_spec.skill_registry.get(placed_skill_ids[skill_ref]).cooltime
             * (100 - cooltime_reduction)
             * 10
         )
         for skill_ref in placed_refs
     }
 
+    # 모든 스킬 준비 상태에서 시작
+    schedule_state: _SkillScheduleState = _SkillScheduleState(
+        prepared_skills=set(),
+        skill_cooltimes_ms=skill_cooltimes_ms,
+        sequence_indices={
+            skill_ref: sequence_index
+            for sequence_index, skill_ref in enumerate(skill_sequence)
+        },
+        sequence_refs=skill_sequence,
+        usable_alone=usable_alone,
+        auto_link_skills=auto_link_skills,
+        link_group_indices=link_group_indices,
+        link_missing_counts=[len(set(link_group)) for link_group in auto_link_skills],
+    )
+    for skill_ref in placed_refs:
+        schedule_state.mark_prepared(skill_ref)
+
     # 60초 범위 내 실제 스킬 사용 시점 기록
-    task_list: list[EquippedSkillRef] = []
+    task_queue: deque[EquippedSkillRef] = deque()
     used_skills: list[SkillUseEvent] = []
     elapsed_time_ms: int = 0
     while elapsed_time_ms < TIMELINE_MILLISECONDS:
-        if not task_list:
-            _update_prepared_skills(
-                placed_refs=placed_refs,
-                skill_cooltime_timers_ms=skill_cooltime_timers_ms,
-                skill_cooltimes_ms=skill_cooltimes_ms,
-                elapsed_time_ms=elapsed_time_ms,
-                prepared_skills=prepared_skills,
-            )
-            task_list = _build_next_task_list(
-                preset=preset,
-                skills_info=skills_info,
-                prepared_skills=prepared_skills,
-                link_skill_requirements=link_skill_requirements,
-                auto_link_skills=auto_link_skills,
-                skill_sequence=skill_sequence,
-            )
-
-        if task_list:
-            skill_ref: EquippedSkillRef = task_list.pop(0)
-            skill_id: str = preset.skills.get_placed_skill_id(skill_ref)
+        if not task_queue:
+            schedule_state.release_ready(elapsed_time_ms)
+            task_queue.extend(schedule_state.take_next_tasks())
+
+        if task_queue:
+            skill_ref = task_queue.popleft()
             used_skills.append(
                 SkillUseEvent(
-                    skill_id=skill_id,
+                    skill_id=placed_skill_ids[skill_ref],
                     time=round(elapsed_time_ms * 0.001, 2),
                 )
             )
-            skill_cooltime_timers_ms[skill_ref] = elapsed_time_ms
+            schedule_state.mark_used(skill_ref, elapsed_time_ms)
             elapsed_time_ms += int(delay_ms)
             continue
 
         # 모든 준비 스킬이 없으면 가장 빨리 돌아오는 스킬까지 점프
-        waiting_refs: list[EquippedSkillRef] = [
-            skill_ref for skill_ref in placed_refs if skill_ref not in prepared_skills
-        ]
-        if not waiting_refs:
+        next_ready_time_ms: int | None = schedule_state.next_ready_time()
+        if next_ready_time_ms is None:
             break
 
-        next_cooltime_ms: int = min(
-            skill_cooltimes_ms[skill_ref]
-            - (elapsed_time_ms - skill_cooltime_timers_ms[skill_ref])
-            for skill_ref in waiting_refs
-        )
-        elapsed_time_ms += next_cooltime_ms
+        elapsed_time_ms = next_ready_time_ms
 
     return tuple(used_skills)
 
 
+def _merge_pause_ranges(
+    pause_ranges: list[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """평타 중지 구간을 정렬된 서로소 반열린 구간 목록으로 병합"""
+
+    merged_ranges: list[tuple[int, int]] = []
+    # 스킬 사용 순서대로 생성된 구간은 이미 정렬되어 있어 정렬 비용이 선형
+    for start_ms, end_ms in sorted(pause_ranges):
+        if start_ms >= end_ms:
+            continue
+
+        if merged_ranges and start_ms <= merged_ranges[-1][1]:
+            last_start_ms, last_end_ms = merged_ranges[-1]
+            merged_ranges[-1] = (last_start_ms, max(last_end_ms, end_ms))
+            continue
+
+        merged_ranges.append((start_ms, end_ms))
+
+    return merged_ranges
+
+
+def _build_basic_attack_times(merged_ranges: list[tuple[int, int]]) -> list[int]:
+    """병합된 중지 구간 사이 빈 구간에서만 평타 시각을 한 번에 순회 생성"""
+
+    interval_ms: int = BASIC_ATTACK_INTERVAL_MILLISECONDS
+    attack_times: list[int] = []
+    gap_start_ms: int = 0
+    for start_ms, end_ms in merged_ranges:
+        # 빈 구간 [gap_start_ms, start_ms) 안의 첫 평타 격자 시각부터 확장
+        first_tick_ms: int = -(-gap_start_ms // interval_ms) * interval_ms
+        attack_times.extend(range(first_tick_ms, start_ms, interval_ms))
+        gap_start_ms = max(gap_start_ms, end_ms)
+
+    first_tick_ms = -(-gap_start_ms // interval_ms) * interval_ms
+    attack_times.extend(range(first_tick_ms, TIMELINE_MILLISECONDS, interval_ms))
+    return attack_times
+
+
 def build_simulation_events(
     server_spec: "ServerSpec",
     preset: "MacroPreset",
@@ -2170,7 +3430,7 @@ def build_simulation_events(
         cooltime_reduction=cooltime_reduction,
     )
 
-    hit_events: list[HitEvent] = []
+    basic_attack_events: list[HitEvent] = []
     if preset.settings.use_default_attack:
         basic_attack_pause_ms: int = delay_ms + BASIC_ATTACK_PAUSE_BUFFER_MILLISECONDS
         basic_attack_pause_ranges: list[tuple[int, int]] = []
@@ -2185,18 +3445,10 @@ def build_simulation_events(
 
         # 평타 간격 기준으로 스킬 입력 구간 밖의 평타 이벤트만 확장
         basic_attack_skill_id: str = get_builtin_skill_id(server_spec.id, "평타")
-        for current_time_ms in range(
-            0,
-            TIMELINE_MILLISECONDS,
-            BASIC_ATTACK_INTERVAL_MILLISECONDS,
+        for current_time_ms in _build_basic_attack_times(
+            _merge_pause_ranges(basic_attack_pause_ranges)
         ):
-            if any(
-                start_ms <= current_time_ms < end_ms
-                for start_ms, end_ms in basic_attack_pause_ranges
-            ):
-                continue
-
-            hit_events.append(
+            basic_attack_events.append(
                 HitEvent(
                     skill_id=basic_attack_skill_id,
                     time=round(current_time_ms * 0.001, 2),
@@ -2205,6 +3457,7 @@ def build_simulation_events(
             )
 
     # 사용 시점과 현재 레벨 스킬 계수를 조합해 최종 이벤트 생성
+    skill_hit_events: list[HitEvent] = []
     for skill_use in skill_uses:
         skill_level: int = preset.info.get_skill_level(
             server_spec,
@@ -2213,7 +3466,7 @@ def build_simulation_events(
         skill_damage: float = float(
             server_spec.skill_registry.get(skill_use.skill_id).levels[skill_level]
         )
-        hit_events.append(
+        skill_hit_events.append(
             HitEvent(
                 skill_id=skill_use.skill_id,
                 time=skill_use.time,
@@ -2221,9 +3474,14 @@ def build_simulation_events(
             )
         )
 
-    # 시각화/평가 일관성을 위한 시간순 정렬
+    # 시각화/평가 일관성을 위한 시간순 병합
+    # 두 목록 모두 시간순이므로 선형 병합, 동일 시각은 평타 우선
     ordered_hit_events: tuple[HitEvent, ...] = tuple(
-        sorted(hit_events, key=lambda item: item.time)
+        heapq.merge(
+            basic_attack_events,
+            skill_hit_events,
+            key=lambda item: item.time,
+        )
     )
     return ordered_hit_events
 
@@ -2237,6 +3495,33 @@ def build_calculator_timeline(
 ) -> tuple[HitEvent, ...]:
     """메인 화면 스킬 상태 기준 계산기용 60초 타임라인 생성"""
 
+    # 동일 입력 타임라인은 영속 캐시에서 재사용
+    try:
+        cache_key: bytes = _build_timeline_cache_key(
+            server_spec=server_spec,
+            preset=preset,
+            skills_info=skills_info,
+            delay_ms=delay_ms,
+            cooltime_reduction=cooltime_reduction,
+        )
+
+    except KeyError:
+        # 등록 정보 누락 입력은 캐시 없이 기존 경로의 오류를 그대로 전달
+        return build_simulation_events(
+            server_spec=server_spec,
+            preset=preset,
+            skills_info=skills_info,
+            delay_ms=delay_ms,
+            cooltime_reduction=cooltime_reduction,
+        )
+
+    cached_record: TimelineRecord | None = timeline_store.get(cache_key)
+    if cached_record is not None:
+        return tuple(
+            HitEvent(skill_id=skill_id, time=hit_time, multiplier=multiplier)
+            for skill_id, hit_time, multiplier in cached_record
+        )
+
     # 공유 스케줄러가 생성한 타격 이벤트를 계산기 타임라인으로 고정
     hit_events: tuple[HitEvent, ...] = build_simulation_events(
         server_spec=server_spec,
@@ -2245,9 +3530,117 @@ def build_calculator_timeline(
         delay_ms=delay_ms,
         cooltime_reduction=cooltime_reduction,
     )
+    timeline_store.put(
+        cache_key,
+        tuple(
+            (hit_event.skill_id, hit_event.time, hit_event.multiplier)
+            for hit_event in hit_events
+        ),
+    )
     return hit_events
 
 
+def _build_timeline_cache_key(
+    server_spec: "ServerSpec",
+    preset: "MacroPreset",
+    skills_info: dict[str, "SkillUsageSetting"],
+    delay_ms: int,
+    cooltime_reduction: float,
+) -> bytes:
+    """타임라인 입력 전체(프리셋 지문 + 스킬속도) 기준 캐시 키 구성"""
+
+    # 배치 스킬의 쿨타임/레벨 계수와 무공비급 레벨을 순서 고정 튜플로 변환
+    placed_skill_ids: tuple[str, ...] = tuple(preset.skills.placed_skills)
+    skill_definitions: list[tuple[str, float, tuple[tuple[int, float], ...], int]] = []
+    skill_id: str
+    for skill_id in sorted({skill_id for skill_id in placed_skill_ids if skill_id}):
+        skill_def: "SkillDef" = server_spec.skill_registry.get(skill_id)
+        skill_definitions.append(
+            (
+                skill_id,
+                float(skill_def.cooltime),
+                tuple(sorted(skill_def.levels.items())),
+                preset.info.get_skill_level(server_spec, skill_id),
+            )
+        )
+
+    # 스킬 사용 설정과 자동 연계 상태 고정
+    usage_settings: tuple[tuple[str, tuple[bool, bool, int]], ...] = tuple(
+        (skill_id, skills_info[skill_id].to_tuple())
+        for skill_id in sorted(skills_info.keys())
+    )
+    link_skills: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+        (link_skill.use_type.value, tuple(link_skill.skills))
+        for link_skill in preset.link_skills
+    )
+
+    # 스킬속도는 정확한 float 표현으로 구분해 캐시 사용 여부와 무관한 결과 보장
+    fingerprint: tuple = (
+        TIMELINE_SEMANTICS_VERSION,
+        server_spec.id,
+        int(delay_ms),
+        bool(preset.settings.use_default_attack),
+        placed_skill_ids,
+        tuple(skill_definitions),
+        usage_settings,
+        link_skills,
+        float(cooltime_reduction).hex(),
+    )
+    return hashlib.sha256(repr(fingerprint).encode("utf-8")).digest()
+
+
+def build_skill_speed_breakpoints(
+    server_spec: "ServerSpec",
+    preset: "MacroPreset",
+    min_speed: float = SKILL_SPEED_TABLE_MIN_PERCENT,
+    max_speed: float = SKILL_SPEED_TABLE_MAX_PERCENT,
+) -> np.ndarray:
+    """배치 스킬 쿨타임 정수값이 바뀌는 스킬속도 경계 목록 계산"""
+
+    # 쿨타임 c의 정수값 k 경계: c * (100 - r) * 10 = k -> r = 100 - k / (10c)
+    cooltimes: set[float] = {
+        float(server_spec.skill_registry.get(skill_id).cooltime)
+        for skill_id in preset.skills.placed_skills
+        if skill_id
+    }
+    breakpoint_arrays: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+    cooltime: float
+    for cooltime in cooltimes:
+        if cooltime <= 0.0:
+            continue
+
+        scale: float = cooltime * 10.0
+        k_values: np.ndarray = np.arange(
+            np.ceil(scale * (100.0 - max_speed)),
+            np.floor(scale * (100.0 - min_speed)) + 1.0,
+        )
+        breakpoint_arrays.append(100.0 - (k_values / scale))
+
+    breakpoints: np.ndarray = np.unique(np.concatenate(breakpoint_arrays))
+    return breakpoints[(breakpoints >= min_speed) & (breakpoints <= max_speed)]
+
+
+def build_skill_speed_timeline_table(
+    server_spec: "ServerSpec",
+    preset: "MacroPreset",
+    skills_info: dict[str, "SkillUsageSetting"],
+    delay_ms: int,
+    level: int,
+    skill_slot_variables: dict[str, float | int],
+) -> SkillSpeedTimelineTable:
+    """프리셋 기준 스킬속도 구간 타임라인 테이블 구성 (타임라인은 조회 시 지연 구성)"""
+
+    return SkillSpeedTimelineTable(
+        server_spec=server_spec,
+        preset=preset,
+        skills_info=skills_info,
+        delay_ms=delay_ms,
+        level=level,
+        skill_slot_variables=skill_slot_variables,
+        breakpoints=build_skill_speed_breakpoints(server_spec, preset),
+    )
+
+
 def _build_timeline_evaluation_artifacts(
     hit_events: tuple[HitEvent, ...],
     level: int,
@@ -2260,6 +3653,7 @@ def _build_timeline_evaluation_artifacts(
         hit_events=hit_events,
         skill_slot_variables=skill_slot_variables,
         level=level,
+        multiplier_sum=sum(hit_event.multiplier for hit_event in hit_events),
     )
     return artifacts
 
@@ -2291,6 +3685,28 @@ def _calculate_hit_damage(
     return damage
 
 
+def _calculate_damage_per_multiplier(
+    resolved_stats: dict[StatKey, float],
+    is_boss: bool,
+) -> float:
+    """스킬 계수 1당 기대 피해량 계산 (타격 공통 스탯 배율)"""
+
+    # _calculate_hit_damage 와 동일한 배율을 계수만 제외하고 구성
+    damage: float = float(resolved_stats[StatKey.ATTACK])
+    damage *= 1.0 + (float(resolved_stats[StatKey.FINAL_ATTACK_PERCENT]) * 0.01)
+    if is_boss:
+        damage *= 1.0 + (float(resolved_stats[StatKey.BOSS_ATTACK_PERCENT]) * 0.01)
+
+    crit_rate: float = min(float(resolved_stats[StatKey.CRIT_RATE_PERCENT]), 100.0)
+    crit_damage: float = float(resolved_stats[StatKey.CRIT_DAMAGE_PERCENT])
+    crit_bonus_ratio: float = (crit_damage - 100.0) * 0.01
+    damage *= 1.0 + ((crit_rate * 0.01) * crit_bonus_ratio)
+
+    damage *= 1.0 + (float(resolved_stats[StatKey.SKILL_DAMAGE_PERCENT]) * 0.01)
+
+    return damage
+
+
 def _calculate_random_hit_damage(
     resolved_stats: dict[StatKey, float],
     hit_event: HitEvent,
@@ -2388,33 +3804,136 @@ def _build_power_formula_variables(
 ) -> dict[str, float | int | bool]:
     """최종 스탯과 내장 전투력 공식 변수 구성"""
 
-    # 기본 최종 스탯과 타격 이벤트 조회
-    base_values: dict[StatKey, float] = resolved_stats.values
-    hit_events: tuple[HitEvent, ...] = artifacts.hit_events
+    # 타격 계수 총합에 스탯 배율을 곱해 60초 피해량을 O(1)로 집계
+    base_values: dict[StatKey, float] = resolved_stats.values
+    normal_damage: float = artifacts.multiplier_sum * _calculate_damage_per_multiplier(
+        resolved_stats=base_values,
+        is_boss=False,
+    )
+    boss_damage: float = artifacts.multiplier_sum * _calculate_damage_per_multiplier(
+        resolved_stats=base_values,
+        is_boss=True,
+    )
+
+    # 최종 스탯과 내장 공식 평가 입력값 구성
+    formula_variables: dict[str, float | int | bool] = {
+        stat_key.value: resolved_stats.values[stat_key]
+        for stat_key in OVERALL_STAT_ORDER
+    }
+    formula_variables[_POWER_FORMULA_LEVEL_NAME] = artifacts.level
+    formula_variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = boss_damage
+    formula_variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = normal_damage
+    formula_variables.update(artifacts.skill_slot_variables)
+    return formula_variables
+
+
+def evaluate_single_metric(
+    artifacts: TimelineEvaluationArtifacts,
+    resolved_stats: FinalStats,
+    target_formula_id: str,
+    compiled_custom_formula: CompiledPowerFormula | None,
+) -> float:
+    """선택된 단일 전투력 공식만 평가하여 값 반환"""
+
+    # 공식 변수 선행 구성 후 대상 공식 하나만 직접 평가
+    formula_variables: dict[str, float | int | bool] = _build_power_formula_variables(
+        artifacts,
+        resolved_stats,
+    )
+
+    if target_formula_id in DISPLAY_POWER_METRIC_IDS:
+        power_metric: PowerMetric = PowerMetric(target_formula_id)
+        return _evaluate_compiled_power_formula(
+            _POWER_FORMULA_NODES[power_metric],
+            formula_variables,
+        )
+
+    if compiled_custom_formula is None:
+        raise KeyError(target_formula_id)
+
+    return _evaluate_compiled_power_formula(
+        compiled_custom_formula,
+        formula_variables,
+    )
+
+
+def _build_power_formula_batch_variables(
+    artifacts: TimelineEvaluationArtifacts,
+    stat_matrix: np.ndarray,
+) -> dict[str, np.ndarray | float | int | bool]:
+    """(N x 스탯) 배열 기준 내장 전투력 공식 배열 변수 구성"""
+
+    # 스탯 열을 공식 변수 이름의 배열 뷰로 노출
+    formula_variables: dict[str, np.ndarray | float | int | bool] = {
+        stat_key.value: stat_matrix[:, stat_index]
+        for stat_index, stat_key in enumerate(OVERALL_STAT_ORDER)
+    }
+
+    # 타격 계수 총합에 행별 공통 배율을 곱해 60초 피해량 일괄 계산
+    # (_calculate_damage_per_multiplier와 같은 곱셈 순서로 단일 평가와 비트 단위 일치)
+    attack_power: np.ndarray = formula_variables[StatKey.ATTACK.value] * (
+        1.0 + (formula_variables[StatKey.FINAL_ATTACK_PERCENT.value] * 0.01)
+    )
+    crit_rate: np.ndarray = np.minimum(
+        formula_variables[StatKey.CRIT_RATE_PERCENT.value],
+        100.0,
+    )
+    crit_bonus_ratio: np.ndarray = (
+        formula_variables[StatKey.CRIT_DAMAGE_PERCENT.value] - 100.0
+    ) * 0.01
+    crit_factor: np.ndarray = 1.0 + ((crit_rate * 0.01) * crit_bonus_ratio)
+    skill_damage_factor: np.ndarray = 1.0 + (
+        formula_variables[StatKey.SKILL_DAMAGE_PERCENT.value] * 0.01
+    )
+    boss_attack_power: np.ndarray = attack_power * (
+        1.0 + (formula_variables[StatKey.BOSS_ATTACK_PERCENT.value] * 0.01)
+    )
+    normal_damage: np.ndarray = artifacts.multiplier_sum * (
+        (attack_power * crit_factor) * skill_damage_factor
+    )
+    boss_damage: np.ndarray = artifacts.multiplier_sum * (
+        (boss_attack_power * crit_factor) * skill_damage_factor
+    )
+
+    formula_variables[_POWER_FORMULA_LEVEL_NAME] = artifacts.level
+    formula_variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = boss_damage
+    formula_variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = normal_damage
+    formula_variables.update(artifacts.skill_slot_variables)
+    return formula_variables
+
 
-    # 60초 타격 데미지 누적
-    boss_damage: float = 0.0
-    normal_damage: float = 0.0
-    hit_event: HitEvent
-    for hit_event in hit_events:
-        normal_hit_damage: float = _calculate_hit_damage(
-            resolved_stats=base_values,
-            hit_event=hit_event,
-            is_boss=False,
-        )
-        boss_hit_damage: float = _calculate_hit_damage(
-            resolved_stats=base_values,
-            hit_event=hit_event,
-            is_boss=True,
-        )
-        normal_damage += normal_hit_damage
-        boss_damage += boss_hit_damage
+def _build_power_formula_dual_variables(
+    artifacts: TimelineEvaluationArtifacts,
+    resolved_values: dict[StatKey, Any],
+) -> dict[str, object]:
+    """이원수 최종 스탯 기준 내장 전투력 공식 변수 구성 (배열 경로와 같은 피해량 식)"""
 
-    # 최종 스탯과 내장 공식 평가 입력값 구성
-    formula_variables: dict[str, float | int | bool] = {
-        stat_key.value: resolved_stats.values[stat_key]
-        for stat_key in OVERALL_STAT_ORDER
+    formula_variables: dict[str, object] = {
+        stat_key.value: resolved_values[stat_key] for stat_key in OVERALL_STAT_ORDER
     }
+
+    # 타격 계수 총합에 공통 배율을 곱해 60초 피해량 계산 (치명타 확률 100% 상한)
+    attack_power: Any = resolved_values[StatKey.ATTACK] * (
+        1.0 + (resolved_values[StatKey.FINAL_ATTACK_PERCENT] * 0.01)
+    )
+    crit_rate: Any = min(resolved_values[StatKey.CRIT_RATE_PERCENT], 100.0)
+    crit_bonus_ratio: Any = (
+        resolved_values[StatKey.CRIT_DAMAGE_PERCENT] - 100.0
+    ) * 0.01
+    crit_factor: Any = 1.0 + ((crit_rate * 0.01) * crit_bonus_ratio)
+    skill_damage_factor: Any = 1.0 + (
+        resolved_values[StatKey.SKILL_DAMAGE_PERCENT] * 0.01
+    )
+    boss_attack_power: Any = attack_power * (
+        1.0 + (resolved_values[StatKey.BOSS_ATTACK_PERCENT] * 0.01)
+    )
+    normal_damage: Any = artifacts.multiplier_sum * (
+        (attack_power * crit_factor) * skill_damage_factor
+    )
+    boss_damage: Any = artifacts.multiplier_sum * (
+        (boss_attack_power * crit_factor) * skill_damage_factor
+    )
+
     formula_variables[_POWER_FORMULA_LEVEL_NAME] = artifacts.level
     formula_variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = boss_damage
     formula_variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = normal_damage
@@ -2422,35 +3941,76 @@ def _build_power_formula_variables(
     return formula_variables
 
 
-def evaluate_single_metric(
+def evaluate_metric_batch(
     artifacts: TimelineEvaluationArtifacts,
-    resolved_stats: FinalStats,
+    stat_matrix: np.ndarray,
     target_formula_id: str,
     compiled_custom_formula: CompiledPowerFormula | None,
-) -> float:
-    """선택된 단일 전투력 공식만 평가하여 값 반환"""
+) -> np.ndarray:
+    """(N x 스탯) 최종 스탯 배열에 대해 선택 전투력 공식을 일괄 평가"""
 
-    # 공식 변수 선행 구성 후 대상 공식 하나만 직접 평가
-    formula_variables: dict[str, float | int | bool] = _build_power_formula_variables(
-        artifacts,
-        resolved_stats,
+    if stat_matrix.ndim != 2 or stat_matrix.shape[1] != len(OVERALL_STAT_ORDER):
+        raise ValueError("스탯 배열은 (N, 전체 스탯 수) 형태여야 합니다.")
+
+    compiled_formula: CompiledPowerFormula = _get_compiled_power_formula(
+        target_formula_id, compiled_custom_formula
     )
+    formula_variables: dict[str, np.ndarray | float | int | bool] = (
+        _build_power_formula_batch_variables(artifacts, stat_matrix)
+    )
+    return _evaluate_formula_rows(
+        compiled_formula,
+        formula_variables,
+        int(stat_matrix.shape[0]),
+    )
+
+
+def _get_compiled_power_formula(
+    target_formula_id: str,
+    compiled_custom_formula: CompiledPowerFormula | None,
+) -> CompiledPowerFormula:
+    """공식 ID에 해당하는 컴파일된 공식 반환 (내장 공식이 아니면 사용자 정의 공식)"""
 
     if target_formula_id in DISPLAY_POWER_METRIC_IDS:
-        power_metric: PowerMetric = PowerMetric(target_formula_id)
-        return _evaluate_compiled_power_formula(
-            _POWER_FORMULA_NODES[power_metric],
-            formula_variables,
-        )
+        return _POWER_FORMULA_NODES[PowerMetric(target_formula_id)]
 
     if compiled_custom_formula is None:
         raise KeyError(target_formula_id)
 
-    return _evaluate_compiled_power_formula(
-        compiled_custom_formula,
+    return compiled_custom_formula
+
+
+def _evaluate_formula_rows(
+    compiled_formula: CompiledPowerFormula,
+    formula_variables: dict[str, np.ndarray | float | int | bool],
+    row_count: int,
+) -> np.ndarray:
+    """배열 공식 변수로 단일 공식을 일괄 평가 (유한하지 않은 행은 단일 평가로 재현)"""
+
+    values: np.ndarray = _evaluate_compiled_power_formula_batch(
+        compiled_formula,
         formula_variables,
+        row_count,
     )
 
+    # 스칼라 경로에서 예외가 나는 행(0 나누기 등)은 단일 평가로 동일 예외/값 재현
+    row_index: int
+    for row_index in np.flatnonzero(~np.isfinite(values)).tolist():
+        row_variables: dict[str, float | int | bool] = {
+            variable_name: (
+                float(variable_value[row_index])
+                if isinstance(variable_value, np.ndarray)
+                else variable_value
+            )
+            for variable_name, variable_value in formula_variables.items()
+        }
+        values[row_index] = _evaluate_compiled_power_formula(
+            compiled_formula,
+            row_variables,
+        )
+
+    return values
+
 
 def build_calculator_context(
     server_spec: "ServerSpec",
@@ -2465,25 +4025,25 @@ def build_calculator_context(
 
     # 기준 원시 스탯 resolve 및 기준 스킬속도 타임라인 구성
     baseline_final_stats: FinalStats = base_stats.resolve()
-    hit_events: tuple[HitEvent, ...] = build_calculator_timeline(
+    skill_slot_variables: dict[str, float | int] = _build_skill_slot_formula_variables(
+        server_spec,
+        preset,
+    )
+    timeline_table: SkillSpeedTimelineTable = build_skill_speed_timeline_table(
         server_spec=server_spec,
         preset=preset,
         skills_info=skills_info,
         delay_ms=delay_ms,
-        cooltime_reduction=baseline_final_stats.values[StatKey.SKILL_SPEED_PERCENT],
-    )
-    skill_slot_variables: dict[str, float | int] = _build_skill_slot_formula_variables(
-        server_spec,
-        preset,
+        level=preset.info.calculator.level,
+        skill_slot_variables=skill_slot_variables,
     )
-    timeline_artifacts: TimelineEvaluationArtifacts = (
-        _build_timeline_evaluation_artifacts(
-            hit_events,
-            level=preset.info.calculator.level,
-            skill_slot_variables=skill_slot_variables,
-        )
+    timeline_artifacts: TimelineEvaluationArtifacts = timeline_table.get(
+        float(baseline_final_stats.values[StatKey.SKILL_SPEED_PERCENT])
     )
 
+    # 새로 구성한 기준 타임라인을 다음 계산/워커 프로세스와 공유
+    timeline_store.flush()
+
     # 선택된 사용자 정의 공식만 1회 컴파일하는
     compiled_custom_formula: CompiledPowerFormula | None = None
     if target_formula_id not in DISPLAY_POWER_METRIC_IDS:
@@ -2505,6 +4065,7 @@ def build_calculator_context(
 
     return EvaluationContext(
         timeline_artifacts=timeline_artifacts,
+        timeline_table=timeline_table,
         baseline_base_stats=base_stats,
         baseline_final_stats=baseline_final_stats,
         baseline_power=baseline_power,
@@ -2534,18 +4095,7 @@ def _resolve_stat_changes_with_timeline(
         resolved_stats.values[StatKey.SKILL_SPEED_PERCENT]
     )
     if resolved_skill_speed != baseline_skill_speed:
-        updated_hit_events: tuple[HitEvent, ...] = build_calculator_timeline(
-            server_spec=context.server_spec,
-            preset=context.preset,
-            skills_info=context.skills_info,
-            delay_ms=context.delay_ms,
-            cooltime_reduction=resolved_skill_speed,
-        )
-        timeline_artifacts = _build_timeline_evaluation_artifacts(
-            updated_hit_events,
-            level=context.timeline_artifacts.level,
-            skill_slot_variables=context.timeline_artifacts.skill_slot_variables,
-        )
+        timeline_artifacts = context.timeline_table.get(resolved_skill_speed)
 
     return resolved_stats, timeline_artifacts
 
@@ -2556,24 +4106,13 @@ def evaluate_single_stat_delta(
     amount: float,
     target_formula_id: str,
 ) -> float:
-    """단일 스탯 변화량 기준 선택 공식 전투력 차이 계산"""
+    """단일 스탯 변화량 기준 선택 공식 전투력 차이 계산 (단일 프로브 평가)"""
 
-    # 단일 스탯 변화량과 선택 공식 기준 증감량 계산
-    stat_changes: dict[StatKey, float] = {stat_key: amount}
-    resolved_stats: FinalStats
-    timeline_artifacts: TimelineEvaluationArtifacts
-    resolved_stats, timeline_artifacts = _resolve_stat_changes_with_timeline(
-        context,
-        stat_changes,
-    )
-    target_value: float = evaluate_single_metric(
-        artifacts=timeline_artifacts,
-        resolved_stats=resolved_stats,
+    return evaluate_stat_probe_deltas(
+        context=context,
+        probes=[(stat_key, amount)],
         target_formula_id=target_formula_id,
-        compiled_custom_formula=context.compiled_custom_formula,
-    )
-
-    return target_value - context.baseline_power
+    )[0].delta
 
 
 def evaluate_arbitrary_stat_delta(
@@ -2599,6 +4138,71 @@ def evaluate_arbitrary_stat_delta(
     return target_value - context.baseline_power
 
 
+def evaluate_stat_probe_deltas(
+    context: EvaluationContext,
+    probes: list[tuple[StatKey, float]],
+    target_formula_id: str,
+) -> list[StatProbeEvaluation]:
+    """
+    (스탯, 변화량) 프로브 목록을 한 번에 평가해 선택 공식 전투력 차이 반환
+    프로브마다 변화량을 따로 줄 수 있어 +1/+10/+100 같은 효율표를 한 번에 구성할 수 있다.
+    """
+
+    if not probes:
+        return []
+
+    # 프로브별 베이스 스탯 행을 한 배열로 구성 후 일괄 resolve
+    changed_rows: np.ndarray = np.repeat(
+        context.baseline_base_stats.to_vector()[None, :],
+        len(probes),
+        axis=0,
+    )
+    probe_index: int
+    stat_key: StatKey
+    amount: float
+    for probe_index, (stat_key, amount) in enumerate(probes):
+        changed_rows[probe_index, STAT_INDEX[stat_key]] += amount
+
+    # 스킬속도가 같은 행끼리 묶어 평가 (기준 스킬속도 행은 기준 타임라인 재사용,
+    # 그 외 스킬속도는 타임라인 테이블에서 속도별 1회만 구성)
+    metric_deltas: np.ndarray = _evaluate_rows_by_skill_speed(
+        context,
+        resolve_stat_rows(changed_rows),
+        target_formula_id,
+    )
+
+    return [
+        StatProbeEvaluation(stat_key=stat_key, amount=amount, delta=metric_delta)
+        for (stat_key, amount), metric_delta in zip(probes, metric_deltas.tolist())
+    ]
+
+
+def evaluate_power_gradient(
+    context: EvaluationContext,
+    target_formula_id: str,
+    stat_keys: tuple[StatKey, ...],
+) -> dict[StatKey, float]:
+    """
+    현재 입력 기준 스탯 1포인트당 선택 공식 전투력 한계 가치 (기울기) 반환
+    이원수 평가 1회로 전체 스탯의 편미분을 구한다. floor/round로 감싼 공식은
+    계단을 무시한 평균 증가율이며, 타임라인이 바뀌는 스킬속도는 대상에서 제외한다.
+    """
+
+    target_stat_keys: frozenset[StatKey] = frozenset(stat_keys) - {
+        StatKey.SKILL_SPEED_PERCENT
+    }
+    if not target_stat_keys:
+        return {}
+
+    return _compute_power_gradient(
+        timeline_artifacts=context.timeline_artifacts,
+        base_changed_stats=context.baseline_base_stats.to_stat_map(),
+        target_formula_id=target_formula_id,
+        compiled_custom_formula=context.compiled_custom_formula,
+        relevant_stat_keys=target_stat_keys,
+    )
+
+
 def _build_skill_slot_formula_variables(
     server_spec: "ServerSpec",
     preset: "MacroPreset",
@@ -2636,62 +4240,222 @@ def evaluate_level_up_delta(
 ) -> LevelUpEvaluation:
     """레벨 1업 시 최적 스탯 분배 기준 전투력 차이 계산"""
 
-    # 체력 +10과 스탯 포인트 5개 분배 조합 전체 탐색
-    best_distribution: dict[StatKey, int] = {
-        StatKey.STR: 0,
-        StatKey.DEXTERITY: 0,
-        StatKey.VITALITY: 0,
-        StatKey.LUCK: 0,
-    }
-    best_delta: float | None = None
-    # 0~5 -> 6
-    for strength in range(6):
-        for dexterity in range(6 - strength):
-            for vitality in range(6 - strength - dexterity):
-                luck: int = 5 - strength - dexterity - vitality
-                stat_changes: dict[StatKey, float] = {
-                    StatKey.HP: 5.0,
-                    StatKey.STR: float(strength),
-                    StatKey.DEXTERITY: float(dexterity),
-                    StatKey.VITALITY: float(vitality),
-                    StatKey.LUCK: float(luck),
-                }
-                metric_delta: float = evaluate_arbitrary_stat_delta(
-                    context=context,
-                    stat_changes=stat_changes,
-                    target_formula_id=target_formula_id,
-                )
+    return plan_level_ups(
+        context=context,
+        target_formula_id=target_formula_id,
+        level_count=1,
+    )[0]
 
-                # 첫 후보 시드 후 최대 delta만 유지하는
-                if best_delta is None:
-                    best_distribution = {
-                        StatKey.STR: strength,
-                        StatKey.DEXTERITY: dexterity,
-                        StatKey.VITALITY: vitality,
-                        StatKey.LUCK: luck,
-                    }
-                    best_delta = metric_delta
-                    continue
 
-                if metric_delta <= best_delta:
-                    continue
+def plan_level_ups(
+    context: EvaluationContext,
+    target_formula_id: str,
+    level_count: int = LEVEL_UP_PLAN_MAX_LEVELS,
+    cancel_checker: Callable[[], None] | None = None,
+) -> list[LevelUpEvaluation]:
+    """
+    다음 1~N 레벨업 각각의 누적 최적 스탯 분배와 전투력 차이 계산
+    i번째 결과는 `i + 1` 레벨업으로 얻는 체력과 스탯 포인트 전체를 한 번에 분배한 기준이다.
+    분배 조합 수가 적은 레벨 수는 전체 조합을 일괄 평가하고,
+    그 이후는 이전 레벨 최적 분배에 포인트를 더한 후보에서 시작해 포인트 이동 국소 탐색으로 검증한다.
+    """
 
-                best_distribution = {
-                    StatKey.STR: strength,
-                    StatKey.DEXTERITY: dexterity,
-                    StatKey.VITALITY: vitality,
-                    StatKey.LUCK: luck,
-                }
-                best_delta = metric_delta
+    if level_count < 1:
+        raise ValueError("레벨업 횟수는 1 이상이어야 합니다.")
+
+    plan: list[LevelUpEvaluation] = []
+    previous_distribution: np.ndarray = np.zeros(
+        len(_LEVEL_UP_STAT_KEYS), dtype=np.int64
+    )
+    level_up_distributions: np.ndarray = _build_level_up_compositions(
+        _LEVEL_UP_STAT_POINTS
+    )
+    current_level_count: int
+    for current_level_count in range(1, level_count + 1):
+        if cancel_checker is not None:
+            cancel_checker()
+
+        point_count: int = _LEVEL_UP_STAT_POINTS * current_level_count
+        best_distribution: np.ndarray
+        best_delta: float
+
+        # 전체 조합 수가 작으면 전수 일괄 평가 후 상위 후보 단일 평가 재확인
+        if comb(
+            point_count + len(_LEVEL_UP_STAT_KEYS) - 1, len(_LEVEL_UP_STAT_KEYS) - 1
+        ) <= (_LEVEL_UP_EXACT_COMBINATION_LIMIT):
+            distributions: np.ndarray = _build_level_up_compositions(point_count)
+            best_distribution, best_delta = _select_level_up_distribution(
+                context=context,
+                distributions=distributions,
+                metric_deltas=_evaluate_level_up_rows(
+                    context, distributions, current_level_count, target_formula_id
+                ),
+                level_count=current_level_count,
+                target_formula_id=target_formula_id,
+            )
+
+        else:
+            best_distribution, best_delta = _search_level_up_distribution(
+                context=context,
+                start_distributions=previous_distribution[None, :]
+                + level_up_distributions,
+                level_count=current_level_count,
+                target_formula_id=target_formula_id,
+            )
+
+        previous_distribution = best_distribution
+        plan.append(
+            LevelUpEvaluation(
+                stat_distribution={
+                    stat_key: int(points)
+                    for stat_key, points in zip(
+                        _LEVEL_UP_STAT_KEYS, best_distribution.tolist()
+                    )
+                },
+                delta=best_delta,
+            )
+        )
+
+    return plan
+
+
+def _build_level_up_compositions(point_count: int) -> np.ndarray:
+    """스탯 포인트를 레벨업 분배 스탯에 나누는 전체 조합 (힘, 민첩, 생명력 순 오름차순)"""
+
+    return np.array(
+        [
+            (
+                strength,
+                dexterity,
+                vitality,
+                point_count - strength - dexterity - vitality,
+            )
+            for strength in range(point_count + 1)
+            for dexterity in range(point_count + 1 - strength)
+            for vitality in range(point_count + 1 - strength - dexterity)
+        ],
+        dtype=np.int64,
+    )
+
+
+def _build_level_up_stat_changes(
+    distribution: np.ndarray,
+    level_count: int,
+) -> dict[StatKey, float]:
+    """누적 분배 1개를 단일 평가용 스탯 변화량으로 변환"""
+
+    stat_changes: dict[StatKey, float] = {StatKey.HP: _LEVEL_UP_HP * level_count}
+    stat_key: StatKey
+    points: int
+    for stat_key, points in zip(_LEVEL_UP_STAT_KEYS, distribution.tolist()):
+        stat_changes[stat_key] = float(points)
+
+    return stat_changes
+
+
+def _evaluate_level_up_rows(
+    context: EvaluationContext,
+    distributions: np.ndarray,
+    level_count: int,
+    target_formula_id: str,
+) -> np.ndarray:
+    """누적 분배 행 전체를 한 번에 resolve 후 스킬속도별 일괄 평가"""
+
+    changed_rows: np.ndarray = np.repeat(
+        context.baseline_base_stats.to_vector()[None, :],
+        len(distributions),
+        axis=0,
+    )
+    changed_rows[:, STAT_INDEX[StatKey.HP]] += _LEVEL_UP_HP * level_count
+    column: int
+    stat_key: StatKey
+    for column, stat_key in enumerate(_LEVEL_UP_STAT_KEYS):
+        changed_rows[:, STAT_INDEX[stat_key]] += distributions[:, column]
+
+    return _evaluate_rows_by_skill_speed(
+        context,
+        resolve_stat_rows(changed_rows),
+        target_formula_id,
+    )
+
+
+def _select_level_up_distribution(
+    context: EvaluationContext,
+    distributions: np.ndarray,
+    metric_deltas: np.ndarray,
+    level_count: int,
+    target_formula_id: str,
+) -> tuple[np.ndarray, float]:
+    """일괄 평가 최고값 근처 후보를 단일 평가로 재확인해 행 순서상 첫 최고 분배 선택"""
+
+    best_batch_delta: float = float(metric_deltas.max())
+    candidate_indices: np.ndarray = np.flatnonzero(
+        metric_deltas >= best_batch_delta - _selection_tolerance(best_batch_delta)
+    )
+
+    best_index: int = int(candidate_indices[0])
+    best_delta: float | None = None
+    row_index: int
+    for row_index in candidate_indices.tolist():
+        metric_delta: float = evaluate_arbitrary_stat_delta(
+            context=context,
+            stat_changes=_build_level_up_stat_changes(
+                distributions[row_index], level_count
+            ),
+            target_formula_id=target_formula_id,
+        )
+
+        if best_delta is not None and metric_delta <= best_delta:
+            continue
+
+        best_index = row_index
+        best_delta = metric_delta
 
-    # 분배 조합이 항상 존재하는 탐색 결과 보장
+    # 재확인 후보가 항상 1개 이상 존재하는 선택 결과 보장
     assert best_delta is not None
 
-    return LevelUpEvaluation(
-        stat_distribution=best_distribution,
-        delta=best_delta,
+    return distributions[best_index], best_delta
+
+
+def _search_level_up_distribution(
+    context: EvaluationContext,
+    start_distributions: np.ndarray,
+    level_count: int,
+    target_formula_id: str,
+) -> tuple[np.ndarray, float]:
+    """시작 후보 중 최고 분배에서 포인트 이동 이웃이 더 나아지지 않을 때까지 국소 탐색"""
+
+    start_deltas: np.ndarray = _evaluate_level_up_rows(
+        context, start_distributions, level_count, target_formula_id
+    )
+    best_start_index: int = int(np.argmax(start_deltas))
+    current_distribution: np.ndarray = start_distributions[best_start_index]
+    current_delta: float = float(start_deltas[best_start_index])
+
+    # 이웃 평가 최고값이 허용 오차 이상 개선될 때만 이동 (개선 없으면 국소 최적 확인)
+    while True:
+        neighbors: np.ndarray = current_distribution[None, :] + _LEVEL_UP_TRANSFER_MOVES
+        neighbors = neighbors[(neighbors >= 0).all(axis=1)]
+        neighbor_deltas: np.ndarray = _evaluate_level_up_rows(
+            context, neighbors, level_count, target_formula_id
+        )
+        best_neighbor_index: int = int(np.argmax(neighbor_deltas))
+        best_neighbor_delta: float = float(neighbor_deltas[best_neighbor_index])
+        if best_neighbor_delta <= current_delta + _selection_tolerance(current_delta):
+            break
+
+        current_distribution = neighbors[best_neighbor_index]
+        current_delta = best_neighbor_delta
+
+    # 최종 분배 전투력 차이는 단일 평가 기준으로 보고
+    metric_delta: float = evaluate_arbitrary_stat_delta(
+        context=context,
+        stat_changes=_build_level_up_stat_changes(current_distribution, level_count),
+        target_formula_id=target_formula_id,
     )
 
+    return current_distribution, metric_delta
+
 
 def _get_next_realm(current_realm: RealmTier) -> RealmTier | None:
     """다음 경지 반환"""
@@ -2746,40 +4510,163 @@ def evaluate_next_realm_delta(
                 target_formula_id=target_formula_id,
             )
 
-            # 첫 후보 시드 후 최대 delta만 유지하는
-            if best_delta is None:
-                best_distribution = (upper, middle, lower)
-                best_delta = metric_delta
-                continue
+            # 첫 후보 시드 후 최대 delta만 유지하는
+            if best_delta is None:
+                best_distribution = (upper, middle, lower)
+                best_delta = metric_delta
+                continue
+
+            if metric_delta <= best_delta:
+                continue
+
+            best_distribution = (upper, middle, lower)
+            best_delta = metric_delta
+
+    # 단전 분배 조합이 항상 존재하는 탐색 결과 보장
+    assert best_delta is not None
+
+    return RealmAdvanceEvaluation(
+        target_realm=next_realm,
+        danjeon_distribution=best_distribution,
+        delta=best_delta,
+    )
+
+
+def evaluate_scroll_upgrade_deltas(
+    server_spec: "ServerSpec",
+    preset: "MacroPreset",
+    baseline_context: EvaluationContext,
+    target_formula_id: str,
+) -> list[ScrollUpgradeEvaluation]:
+    """각 무공비급 1레벨 상승 시 전투력 차이 계산"""
+
+    # 무공비급별 1레벨 상승 효과 계산 (기준 타임라인 타격 계수만 교체, 프리셋 변경 없음)
+    evaluations: list[ScrollUpgradeEvaluation] = []
+    scroll_def: "ScrollDef"
+    for scroll_def in _get_equipped_scroll_defs(server_spec, preset):
+        current_level: int = preset.info.get_scroll_level(scroll_def.id)
+        if current_level >= server_spec.max_skill_level:
+            continue
+
+        # 선택 공식 기준 단일 전투력 증감량만 계산
+        target_value: float = evaluate_single_metric(
+            artifacts=_build_scroll_level_artifacts(
+                baseline_context,
+                {scroll_def.id: current_level + 1},
+            ),
+            resolved_stats=baseline_context.baseline_final_stats,
+            target_formula_id=target_formula_id,
+            compiled_custom_formula=baseline_context.compiled_custom_formula,
+        )
+        evaluations.append(
+            ScrollUpgradeEvaluation(
+                scroll_id=scroll_def.id,
+                scroll_name=scroll_def.name,
+                next_level=current_level + 1,
+                delta=(target_value - baseline_context.baseline_power),
+            )
+        )
+
+    return evaluations
+
+
+def plan_scroll_upgrades(
+    server_spec: "ServerSpec",
+    preset: "MacroPreset",
+    baseline_context: EvaluationContext,
+    target_formula_id: str,
+    upgrade_count: int = SCROLL_UPGRADE_PLAN_STEPS,
+    cancel_checker: Callable[[], None] | None = None,
+) -> list[ScrollUpgradePlanStep]:
+    """
+    다음 K회 무공비급 강화 순서 계획
+    매 단계 남은 강화 횟수 안에서 무공비급별 1~j레벨 연속 강화의 레벨당 평균 증가량을 비교해
+    가장 높은 무공비급을 고르므로, 특정 레벨에서 계수가 크게 오르는 무공비급도 놓치지 않는다.
+    계획 레벨 조합별 전투력은 캐시해 재평가하지 않으며 프리셋은 변경하지 않는다.
+    """
+
+    scroll_defs: list["ScrollDef"] = _get_equipped_scroll_defs(server_spec, preset)
+    current_levels: dict[str, int] = {
+        scroll_def.id: preset.info.get_scroll_level(scroll_def.id)
+        for scroll_def in scroll_defs
+    }
+    planned_levels: dict[str, int] = dict(current_levels)
+    metric_cache: dict[tuple[int, ...], float] = {
+        tuple(current_levels.values()): baseline_context.baseline_power
+    }
 
-            if metric_delta <= best_delta:
-                continue
+    steps: list[ScrollUpgradePlanStep] = []
+    planned_value: float = baseline_context.baseline_power
+    while len(steps) < upgrade_count:
+        if cancel_checker is not None:
+            cancel_checker()
+
+        # 남은 강화 횟수 안의 연속 강화 후보 중 레벨당 평균 증가량 최고 후보 선택
+        remaining_count: int = upgrade_count - len(steps)
+        best_scroll_def: "ScrollDef | None" = None
+        best_level_gain: int = 0
+        best_rate: float = 0.0
+        scroll_def: "ScrollDef"
+        for scroll_def in scroll_defs:
+            planned_level: int = planned_levels[scroll_def.id]
+            level_gain: int
+            for level_gain in range(
+                1,
+                min(remaining_count, server_spec.max_skill_level - planned_level) + 1,
+            ):
+                candidate_value: float = _evaluate_scroll_levels(
+                    context=baseline_context,
+                    current_levels=current_levels,
+                    scroll_levels={
+                        **planned_levels,
+                        scroll_def.id: planned_level + level_gain,
+                    },
+                    target_formula_id=target_formula_id,
+                    metric_cache=metric_cache,
+                )
+                rate: float = (candidate_value - planned_value) / level_gain
+                if best_scroll_def is not None and rate <= best_rate:
+                    continue
 
-            best_distribution = (upper, middle, lower)
-            best_delta = metric_delta
+                best_scroll_def = scroll_def
+                best_level_gain = level_gain
+                best_rate = rate
 
-    # 단전 분배 조합이 항상 존재하는 탐색 결과 보장
-    assert best_delta is not None
+        # 모든 장착 무공비급이 최대 레벨이면 계획 종료
+        if best_scroll_def is None:
+            break
 
-    return RealmAdvanceEvaluation(
-        target_realm=next_realm,
-        danjeon_distribution=best_distribution,
-        delta=best_delta,
-    )
+        # 선택한 연속 강화를 1레벨씩 단계로 기록
+        for _ in range(best_level_gain):
+            planned_levels[best_scroll_def.id] += 1
+            step_value: float = _evaluate_scroll_levels(
+                context=baseline_context,
+                current_levels=current_levels,
+                scroll_levels=planned_levels,
+                target_formula_id=target_formula_id,
+                metric_cache=metric_cache,
+            )
+            steps.append(
+                ScrollUpgradePlanStep(
+                    scroll_id=best_scroll_def.id,
+                    scroll_name=best_scroll_def.name,
+                    next_level=planned_levels[best_scroll_def.id],
+                    delta=step_value - planned_value,
+                    total_delta=step_value - baseline_context.baseline_power,
+                )
+            )
+            planned_value = step_value
 
+    return steps
 
-def evaluate_scroll_upgrade_deltas(
+
+def _get_equipped_scroll_defs(
     server_spec: "ServerSpec",
     preset: "MacroPreset",
-    skills_info: dict[str, "SkillUsageSetting"],
-    delay_ms: int,
-    baseline_context: EvaluationContext,
-    target_formula_id: str,
-) -> list[ScrollUpgradeEvaluation]:
-    """각 무공비급 1레벨 상승 시 전투력 차이 계산"""
+) -> list["ScrollDef"]:
+    """현재 프리셋 장착 순서 기준 계산 대상 무공비급 목록 구성"""
 
-    # 현재 프리셋 장착 순서 기준 계산 대상 무공비급 목록 구성
-    equipped_scroll_ids: list[str] = []
+    scroll_defs: list["ScrollDef"] = []
     seen_scroll_ids: set[str] = set()
     scroll_id: str
     for scroll_id in preset.skills.equipped_scrolls:
@@ -2787,62 +4674,105 @@ def evaluate_scroll_upgrade_deltas(
         if not scroll_id or scroll_id in seen_scroll_ids:
             continue
 
-        equipped_scroll_ids.append(scroll_id)
+        scroll_defs.append(server_spec.skill_registry.get_scroll(scroll_id))
         seen_scroll_ids.add(scroll_id)
 
-    # 무공비급별 1레벨 상승 효과 계산
-    evaluations: list[ScrollUpgradeEvaluation] = []
-    scroll_def: "ScrollDef"
-    for scroll_id in equipped_scroll_ids:
-        # 현재 장착 무공비급 정의와 레벨 조회
-        scroll_def = server_spec.skill_registry.get_scroll(scroll_id)
-        current_level: int = preset.info.get_scroll_level(scroll_def.id)
-        if current_level >= server_spec.max_skill_level:
-            continue
+    return scroll_defs
 
-        # 레벨을 일시적으로 1 올린 상태의 타임라인 재계산
-        preset.info.set_scroll_level(scroll_def.id, current_level + 1)
-        try:
-            upgraded_hit_events: tuple[HitEvent, ...] = build_calculator_timeline(
-                server_spec=server_spec,
-                preset=preset,
-                skills_info=skills_info,
-                delay_ms=delay_ms,
-                cooltime_reduction=baseline_context.baseline_final_stats.values[
-                    StatKey.SKILL_SPEED_PERCENT
-                ],
-            )
-            upgraded_timeline_artifacts: TimelineEvaluationArtifacts = (
-                _build_timeline_evaluation_artifacts(
-                    upgraded_hit_events,
-                    level=baseline_context.timeline_artifacts.level,
-                    skill_slot_variables=_build_skill_slot_formula_variables(
-                        server_spec,
-                        preset,
-                    ),
-                )
+
+def _evaluate_scroll_levels(
+    context: EvaluationContext,
+    current_levels: dict[str, int],
+    scroll_levels: dict[str, int],
+    target_formula_id: str,
+    metric_cache: dict[tuple[int, ...], float],
+) -> float:
+    """무공비급 레벨 조합 기준 선택 공식 전투력 (current_levels 키 순서의 레벨 튜플로 캐시)"""
+
+    cache_key: tuple[int, ...] = tuple(
+        scroll_levels[scroll_id] for scroll_id in current_levels
+    )
+    cached_value: float | None = metric_cache.get(cache_key)
+    if cached_value is not None:
+        return cached_value
+
+    # 현재 레벨과 다른 무공비급만 타격 계수 교체
+    metric_value: float = evaluate_single_metric(
+        artifacts=_build_scroll_level_artifacts(
+            context,
+            {
+                scroll_id: scroll_level
+                for scroll_id, scroll_level in scroll_levels.items()
+                if scroll_level != current_levels[scroll_id]
+            },
+        ),
+        resolved_stats=context.baseline_final_stats,
+        target_formula_id=target_formula_id,
+        compiled_custom_formula=context.compiled_custom_formula,
+    )
+    metric_cache[cache_key] = metric_value
+    return metric_value
+
+
+def _build_scroll_level_artifacts(
+    context: EvaluationContext,
+    scroll_levels: dict[str, int],
+) -> TimelineEvaluationArtifacts:
+    """
+    기준 타임라인 스케줄은 그대로 두고 지정 무공비급 소속 스킬의 타격 계수와 슬롯 변수만 교체
+    무공비급 레벨은 스킬 사용 시점에 영향을 주지 않아 재스케줄링 없이 같은 타격 목록을 재가중한다.
+    """
+
+    # 무공비급 레벨별 소속 스킬 계수 조회
+    skill_damages: dict[str, float] = {}
+    scroll_id: str
+    scroll_level: int
+    for scroll_id, scroll_level in scroll_levels.items():
+        skill_id: str
+        for skill_id in context.server_spec.skill_registry.get_scroll(scroll_id).skills:
+            skill_damages[skill_id] = float(
+                context.server_spec.skill_registry.get(skill_id).levels[scroll_level]
             )
 
-        finally:
-            preset.info.set_scroll_level(scroll_def.id, current_level)
+    baseline_artifacts: TimelineEvaluationArtifacts = context.timeline_artifacts
+    if not skill_damages:
+        return baseline_artifacts
 
-        # 선택 공식 기준 단일 전투력 증감량만 계산
-        target_value: float = evaluate_single_metric(
-            artifacts=upgraded_timeline_artifacts,
-            resolved_stats=baseline_context.baseline_final_stats,
-            target_formula_id=target_formula_id,
-            compiled_custom_formula=baseline_context.compiled_custom_formula,
-        )
-        evaluations.append(
-            ScrollUpgradeEvaluation(
-                scroll_id=scroll_def.id,
-                scroll_name=scroll_def.name,
-                next_level=current_level + 1,
-                delta=(target_value - baseline_context.baseline_power),
+    # 해당 스킬 타격만 새 계수로 교체 (시각/순서 유지)
+    hit_events: tuple[HitEvent, ...] = tuple(
+        (
+            HitEvent(
+                skill_id=hit_event.skill_id,
+                time=hit_event.time,
+                multiplier=skill_damages[hit_event.skill_id],
             )
+            if hit_event.skill_id in skill_damages
+            else hit_event
         )
+        for hit_event in baseline_artifacts.hit_events
+    )
 
-    return evaluations
+    # 배치 슬롯의 스킬 계수 변수도 같은 계수로 교체
+    skill_slot_variables: dict[str, float | int] = dict(
+        baseline_artifacts.skill_slot_variables
+    )
+    skill_index: int
+    for skill_index, skill_id in enumerate(
+        context.preset.skills.placed_skills, start=1
+    ):
+        if skill_index > _POWER_FORMULA_SKILL_SLOT_COUNT:
+            break
+
+        if skill_id in skill_damages:
+            skill_slot_variables[f"skill_{skill_index}_damage"] = skill_damages[
+                skill_id
+            ]
+
+    return _build_timeline_evaluation_artifacts(
+        hit_events,
+        level=baseline_artifacts.level,
+        skill_slot_variables=skill_slot_variables,
+    )
 
 
 def build_base_state(
@@ -3385,28 +5315,50 @@ def _build_contribution_signature(
     return tuple(ordered_items)
 
 
-def _contribution_dominates(
-    left_contribution: Contribution,
-    right_contribution: Contribution,
-) -> bool:
-    """좌측 기여의 우월 관계 확인"""
+def _compute_skyline_indices(vectors: np.ndarray) -> list[int]:
+    """서로 다른 (N x 스탯) 벡터 중 다른 벡터에 지배되지 않는 행 번호 반환
 
-    # 비교 대상 스탯 키 집합 구성
-    target_stat_keys: set[StatKey] = set(left_contribution.values.keys()) | set(
-        right_contribution.values.keys()
-    )
-    has_strict_advantage: bool = False
-    stat_key: StatKey
-    for stat_key in target_stat_keys:
-        left_value: float = float(left_contribution.values.get(stat_key, 0.0))
-        right_value: float = float(right_contribution.values.get(stat_key, 0.0))
-        if left_value < right_value:
-            return False
+    스탯 합 내림차순(단조 키)으로 정렬해 block-nested-loop 방식으로 처리한다.
+    지배하는 벡터는 합이 더 크므로 대부분 먼저 창(window)에 들어가고,
+    부동소수 합이 같은 경우를 위해 새 벡터가 지배하는 창 항목도 제거한다.
+    """
+
+    if vectors.shape[0] <= 1:
+        return list(range(vectors.shape[0]))
 
-        if left_value > right_value:
-            has_strict_advantage = True
+    # 모든 행이 같은 값인 스탯 열은 지배 판정에 영향이 없으므로 제외
+    varying_columns: np.ndarray = np.ptp(vectors, axis=0) > 0.0
+    compact_vectors: np.ndarray = vectors[:, varying_columns]
+    order: np.ndarray = np.argsort(-compact_vectors.sum(axis=1), kind="stable")
 
-    return has_strict_advantage
+    window: np.ndarray = np.empty_like(compact_vectors)
+    window_indices: list[int] = []
+    window_size: int = 0
+    row_index: int
+    for row_index in order.tolist():
+        row: np.ndarray = compact_vectors[row_index]
+
+        # 서로 다른 벡터끼리는 모든 스탯이 크거나 같으면 지배
+        active_window: np.ndarray = window[:window_size]
+        if np.any(np.all(active_window >= row, axis=1)):
+            continue
+
+        dominated_mask: np.ndarray = np.all(active_window <= row, axis=1)
+        if np.any(dominated_mask):
+            keep_mask: np.ndarray = ~dominated_mask
+            window_size = int(keep_mask.sum())
+            window[:window_size] = active_window[keep_mask]
+            window_indices = [
+                window_index
+                for window_index, is_kept in zip(window_indices, keep_mask.tolist())
+                if is_kept
+            ]
+
+        window[window_size] = row
+        window_indices.append(row_index)
+        window_size += 1
+
+    return sorted(window_indices)
 
 
 def _prune_contribution_entries(
@@ -3429,33 +5381,20 @@ def _prune_contribution_entries(
 
         signature_to_entry[signature] = (payload, contribution)
 
-    # 지배 후보 제거
+    # 지배 후보 제거 (스탯 벡터 skyline, 원래 순서 유지)
     unique_entries: list[tuple[EntryPayload, Contribution]] = list(
         signature_to_entry.values()
     )
-    pruned_entries: list[tuple[EntryPayload, Contribution]] = []
-    target_index: int
-    for target_index, (payload, contribution) in enumerate(unique_entries):
-        is_dominated: bool = False
-        compare_index: int
-        other_payload: EntryPayload
-        other_contribution: Contribution
-        for compare_index, (other_payload, other_contribution) in enumerate(
-            unique_entries
-        ):
-            if compare_index == target_index:
-                continue
-
-            if not _contribution_dominates(other_contribution, contribution):
-                continue
-
-            is_dominated = True
-            break
-
-        if is_dominated:
-            continue
+    if not unique_entries:
+        return []
 
-        pruned_entries.append((payload, contribution))
+    contribution_vectors: np.ndarray = np.array(
+        [contribution.to_vector() for _, contribution in unique_entries]
+    )
+    pruned_entries: list[tuple[EntryPayload, Contribution]] = [
+        unique_entries[entry_index]
+        for entry_index in _compute_skyline_indices(contribution_vectors)
+    ]
 
     return pruned_entries
 
@@ -3474,74 +5413,580 @@ def _build_distribution_cache_key(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class InnerSelectionSpace:
+    """고정 분배 기준 내부 선택지(단전/칭호/부적) 기여 배열
+
+    탐색마다 1번 구성해 노드 평가마다 기여 딕셔너리를 벡터로 다시 변환하지 않는다.
+    """
+
+    # (후보 x 스탯) 단전/칭호/부적 기여 배열
+    danjeon_vectors: np.ndarray
+    title_vectors: np.ndarray
+    talisman_vectors: np.ndarray
+    # 내부 선택지 기여가 하나라도 0이 아닌 스탯 열 번호 (오름차순, 기울기 계산 대상)
+    varying_indices: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class DistributionBoundModel:
+    """스탯 분배 범위 노드의 구간 연산 상계 계산 데이터
+
+    내장 공식은 수치 스탯 >= 0, 배율 스탯 >= -100, 치명타 확률 >= 0,
+    치명타 공격력 >= 100 조건에서 모든 스탯에 대해 단조 증가하므로,
+    범위 노드가 만들 수 있는 스탯 상자의 위 꼭짓점에서 평가한 값이
+    노드 안 모든 (분배, 단전, 칭호, 부적) 조합 값의 상계가 된다.
+    칭호는 후보별 스탯 구성이 크게 달라 축별 최댓값 결합이 느슨하므로 후보별로 나눠 평가한다.
+    """
+
+    base_vector: np.ndarray
+    selection_space: InnerSelectionSpace
+    # 단전/부적 기여의 스탯별 최대 벡터
+    danjeon_upper_vector: np.ndarray
+    talisman_upper_vector: np.ndarray
+    # 오름차순 스킬속도 경계와, 각 경계 이하 도달 가능 스킬속도의 타임라인 중
+    # 타격 계수 총합이 가장 큰 타임라인 (피해량 변수를 쓰지 않는 공식은 1개)
+    skill_speeds: np.ndarray
+    speed_artifacts: tuple[TimelineEvaluationArtifacts, ...]
+    target_formula_id: str
+    baseline_power: float
+
+
+def _collect_power_formula_names(compiled_formula: CompiledPowerFormula) -> set[str]:
+    """공식이 참조하는 변수 이름 수집"""
+
+    nodes: list[ast.AST] = list(compiled_formula.statements)
+    if compiled_formula.result_expression is not None:
+        nodes.append(compiled_formula.result_expression)
+
+    return {
+        child.id
+        for node in nodes
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name)
+    }
+
+
+def _build_inner_selection_space(
+    danjeon_entries: list[tuple[DanjeonState, Contribution]],
+    title_entries: list[tuple[str | None, Contribution]],
+    talisman_entries: list[tuple[tuple[str, ...], Contribution]],
+) -> InnerSelectionSpace:
+    """내부 선택지 기여 배열과 조합에 따라 변하는 스탯 열 구성"""
+
+    vectors: list[np.ndarray] = [
+        np.array(
+            [contribution.to_vector() for _, contribution in entries],
+            dtype=np.float64,
+        ).reshape(-1, STAT_COUNT)
+        for entries in (danjeon_entries, title_entries, talisman_entries)
+    ]
+
+    # 모든 후보 기여가 0인 열은 조합과 무관하게 (베이스 + 분배) 값과 같음
+    varying_mask: np.ndarray = np.zeros(STAT_COUNT, dtype=bool)
+    entry_vectors: np.ndarray
+    for entry_vectors in vectors:
+        varying_mask |= np.any(entry_vectors != 0.0, axis=0)
+
+    return InnerSelectionSpace(
+        danjeon_vectors=vectors[0],
+        title_vectors=vectors[1],
+        talisman_vectors=vectors[2],
+        varying_indices=np.flatnonzero(varying_mask),
+    )
+
+
+def _build_distribution_bound_model(
+    context: EvaluationContext,
+    base_state: BaseState,
+    selection_space: InnerSelectionSpace,
+    target_formula_id: str,
+) -> DistributionBoundModel | None:
+    """구간 상계 계산 데이터 구성 (사용자 정의 공식 등 적용 불가 시 None)"""
+
+    # 단조성을 확인한 내장 공식만 지원 (사용자 정의 공식은 기존 상계 사용)
+    if target_formula_id not in DISPLAY_POWER_METRIC_IDS:
+        return None
+
+    danjeon_vectors: np.ndarray = selection_space.danjeon_vectors
+    title_vectors: np.ndarray = selection_space.title_vectors
+    talisman_vectors: np.ndarray = selection_space.talisman_vectors
+    if not (len(danjeon_vectors) and len(title_vectors) and len(talisman_vectors)):
+        return None
+
+    # 스킬 계수/대상 수가 음수면 스킬속도 항의 단조성이 깨짐
+    slot_value: float | int
+    for slot_value in context.timeline_artifacts.skill_slot_variables.values():
+        if slot_value < 0:
+            return None
+
+    base_vector: np.ndarray = base_state.base_stats.to_vector()
+
+    # 단조성 전제 확인: 분배 기여는 0 이상이므로 분배 0 + 내부 선택지 최솟값인
+    # 아래 꼭짓점에서 성립하면 모든 노드에서 성립
+    lower_row: np.ndarray = (
+        base_vector
+        + (danjeon_vectors.min(axis=0) + title_vectors.min(axis=0))
+        + talisman_vectors.min(axis=0)
+    )
+    if any(
+        lower_row[STAT_INDEX[stat_key]] < 0.0 for stat_key in _INTERVAL_BOUND_FLAT_STATS
+    ):
+        return None
+
+    if any(
+        lower_row[STAT_INDEX[stat_key]] < -100.0
+        for stat_key in _INTERVAL_BOUND_RATIO_STATS
+    ):
+        return None
+
+    resolved_lower_row: np.ndarray = resolve_stat_rows(lower_row[None, :])[0]
+    if (
+        resolved_lower_row[STAT_INDEX[StatKey.CRIT_RATE_PERCENT]] < 0.0
+        or resolved_lower_row[STAT_INDEX[StatKey.CRIT_DAMAGE_PERCENT]] < 100.0
+    ):
+        return None
+
+    # 분배는 스킬속도에 기여하지 않으므로 도달 가능한 최종 스킬속도는
+    # 실제 평가와 같은 순서로 더한 내부 선택지 조합 값으로 한정됨
+    skill_speeds: np.ndarray = np.unique(
+        round_stat_values(
+            base_vector[_SKILL_SPEED_STAT_INDEX]
+            + (
+                (
+                    danjeon_vectors[:, None, None, _SKILL_SPEED_STAT_INDEX]
+                    + title_vectors[None, :, None, _SKILL_SPEED_STAT_INDEX]
+                )
+                + talisman_vectors[None, None, :, _SKILL_SPEED_STAT_INDEX]
+            )
+        )
+    )
+    if not (
+        SKILL_SPEED_TABLE_MIN_PERCENT <= float(skill_speeds[0])
+        and float(skill_speeds[-1]) <= SKILL_SPEED_TABLE_MAX_PERCENT
+    ):
+        return None
+
+    # 타임라인은 타격 계수 총합으로만 공식에 반영되므로, 피해량 변수를 쓰는
+    # 공식은 상계 행 스킬속도 이하로 도달 가능한 타임라인 중 총합 최대값을 사용
+    speed_artifacts: tuple[TimelineEvaluationArtifacts, ...] = (
+        context.timeline_artifacts,
+    )
+    formula_names: set[str] = _collect_power_formula_names(
+        _POWER_FORMULA_NODES[PowerMetric(target_formula_id)]
+    )
+    if (
+        _POWER_FORMULA_BOSS_DAMAGE_NAME in formula_names
+        or _POWER_FORMULA_NORMAL_DAMAGE_NAME in formula_names
+    ):
+        if len(skill_speeds) > _INTERVAL_BOUND_MAX_TIMELINES:
+            return None
+
+        prefix_artifacts: list[TimelineEvaluationArtifacts] = []
+        skill_speed: float
+        for skill_speed in skill_speeds.tolist():
+            artifacts: TimelineEvaluationArtifacts = context.timeline_table.get(
+                skill_speed
+            )
+            if prefix_artifacts and (
+                prefix_artifacts[-1].multiplier_sum >= artifacts.multiplier_sum
+            ):
+                artifacts = prefix_artifacts[-1]
+
+            prefix_artifacts.append(artifacts)
+
+        # 총합 누적 최대값이 음수인 구간이 있으면 스탯에 대한 단조성이 깨짐
+        if prefix_artifacts[0].multiplier_sum < 0.0:
+            return None
+
+        speed_artifacts = tuple(prefix_artifacts)
+
+    else:
+        skill_speeds = skill_speeds[:1]
+
+    return DistributionBoundModel(
+        base_vector=base_vector,
+        selection_space=selection_space,
+        danjeon_upper_vector=danjeon_vectors.max(axis=0),
+        talisman_upper_vector=talisman_vectors.max(axis=0),
+        skill_speeds=skill_speeds,
+        speed_artifacts=speed_artifacts,
+        target_formula_id=target_formula_id,
+        baseline_power=context.baseline_power,
+    )
+
+
+def _estimate_distribution_upper_bound(
+    bound_model: DistributionBoundModel,
+    distribution_range: DistributionSearchRange,
+    stats: OptimizationStats | None = None,
+) -> float | None:
+    """범위 노드 내부 조합 평가 없이 구간 연산으로 지표 변화량 상계 계산
+
+    단조성 전제가 성립하지 않는 노드는 None 반환.
+    """
+
+    # 분배 기여가 0 이상일 때만 모델의 아래 꼭짓점 전제가 유효
+    if (
+        min(
+            distribution_range.strength_min,
+            distribution_range.dexterity_min,
+            distribution_range.vitality_min,
+            distribution_range.luck_min,
+        )
+        < 0
+    ):
+        return None
+
+    # 실제 평가와 같은 덧셈 순서(분배 + 단전 + 칭호 + 부적, 베이스 + 기여)로 꼭짓점 구성
+    # 부동소수 덧셈/곱셈/반올림은 단조이므로 위 꼭짓점 값이 내부 모든 조합 값 이상
+    upper_rows: np.ndarray = (
+        bound_model.base_vector
+        + (
+            (
+                build_distribution_contribution(
+                    _build_optimistic_distribution_state(distribution_range)
+                ).to_vector()
+                + bound_model.danjeon_upper_vector
+            )
+            + bound_model.selection_space.title_vectors
+        )
+        + bound_model.talisman_upper_vector
+    )
+    upper_deltas: np.ndarray | None = _evaluate_upper_rows(
+        bound_model, upper_rows, stats
+    )
+    if upper_deltas is None:
+        return None
+
+    return float(upper_deltas.max())
+
+
+def _evaluate_upper_rows(
+    bound_model: DistributionBoundModel,
+    upper_rows: np.ndarray,
+    stats: OptimizationStats | None = None,
+) -> np.ndarray | None:
+    """위 꼭짓점 베이스 스탯 행별 지표 변화량 상계 배열 반환 (단조성 불성립 시 None)"""
+
+    resolved_upper_rows: np.ndarray = resolve_stat_rows(upper_rows)
+
+    # 스킬속도 항(1 - 스킬속도 * 0.01)이 양수여야 단조 증가
+    if np.any(resolved_upper_rows[:, _SKILL_SPEED_STAT_INDEX] >= 100.0):
+        return None
+
+    if stats is not None:
+        stats.formula_evaluation_count += resolved_upper_rows.shape[0]
+
+    # 행마다 상계 스킬속도 이하 경계의 타임라인으로 묶어 평가
+    # (내부 조합의 실제 스킬속도는 상계 행 스킬속도 이하이며 최솟값 경계 이상)
+    artifact_indices: np.ndarray = (
+        np.searchsorted(
+            bound_model.skill_speeds,
+            resolved_upper_rows[:, _SKILL_SPEED_STAT_INDEX],
+            side="right",
+        )
+        - 1
+    )
+    upper_values: np.ndarray = np.empty(resolved_upper_rows.shape[0], dtype=np.float64)
+    artifact_index: int
+    for artifact_index in np.unique(artifact_indices).tolist():
+        artifact_mask: np.ndarray = artifact_indices == artifact_index
+        upper_values[artifact_mask] = evaluate_metric_batch(
+            artifacts=bound_model.speed_artifacts[artifact_index],
+            stat_matrix=resolved_upper_rows[artifact_mask],
+            target_formula_id=bound_model.target_formula_id,
+            compiled_custom_formula=None,
+        )
+
+    if not np.all(np.isfinite(upper_values)):
+        return None
+
+    # 일괄 평가와 단일 평가의 연산 오차만큼 여유를 더해 상계 보장
+    upper_values = upper_values + _BATCH_SELECTION_TOLERANCE * np.maximum(
+        1.0, np.abs(upper_values)
+    )
+    return upper_values - bound_model.baseline_power
+
+
+def _evaluate_rows_by_skill_speed(
+    context: EvaluationContext,
+    resolved_rows: np.ndarray,
+    target_formula_id: str,
+    stats: OptimizationStats | None = None,
+) -> np.ndarray:
+    """최종 스탯 행을 스킬속도별 타임라인 묶음 단위로 일괄 평가해 지표 변화량 배열 반환"""
+
+    if stats is not None:
+        stats.formula_evaluation_count += resolved_rows.shape[0]
+
+    metric_deltas: np.ndarray = np.empty(resolved_rows.shape[0], dtype=np.float64)
+    skill_speed_column: np.ndarray = resolved_rows[:, _SKILL_SPEED_STAT_INDEX]
+    baseline_skill_speed: float = float(
+        context.baseline_final_stats.values[StatKey.SKILL_SPEED_PERCENT]
+    )
+    skill_speed: float
+    for skill_speed in np.unique(skill_speed_column).tolist():
+        # 기준 스킬속도 행은 조회 없이 기준 타임라인 재사용
+        timeline_artifacts: TimelineEvaluationArtifacts = context.timeline_artifacts
+        if skill_speed != baseline_skill_speed:
+            timeline_artifacts = context.timeline_table.get(skill_speed)
+
+        speed_mask: np.ndarray = skill_speed_column == skill_speed
+        metric_deltas[speed_mask] = (
+            evaluate_metric_batch(
+                artifacts=timeline_artifacts,
+                stat_matrix=resolved_rows[speed_mask],
+                target_formula_id=target_formula_id,
+                compiled_custom_formula=context.compiled_custom_formula,
+            )
+            - context.baseline_power
+        )
+
+    return metric_deltas
+
+
+def _selection_tolerance(metric_delta: float) -> float:
+    """일괄 평가 최고값 기준 재확인 후보 허용 오차"""
+
+    return _BATCH_SELECTION_TOLERANCE * max(1.0, abs(metric_delta))
+
+
+def _find_bounded_selection_candidates(
+    context: EvaluationContext,
+    bound_model: DistributionBoundModel,
+    distribution_vector: np.ndarray,
+    target_formula_id: str,
+    stats: OptimizationStats | None = None,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """상계 한정 탐색으로 (단전 x 칭호 x 부적) 전수 평가와 같은 재확인 후보 행 탐색
+
+    칭호별, 칭호 안에서는 단전별/부적별로 나머지 차원을 스탯별 최댓값으로 낙관 결합한
+    상계를 구해 현재 일괄 평가 최고값의 허용 오차 밖인 후보는 평가하지 않는다.
+    (전수 평가 행 번호 오름차순 후보 번호 배열, 베이스 스탯 행 배열)을 반환하며,
+    단조성 전제가 깨지거나 평가 값이 유한하지 않으면 None 반환.
+    """
+
+    danjeon_vectors: np.ndarray = bound_model.selection_space.danjeon_vectors
+    title_vectors: np.ndarray = bound_model.selection_space.title_vectors
+    talisman_vectors: np.ndarray = bound_model.selection_space.talisman_vectors
+    title_count: int = title_vectors.shape[0]
+    talisman_count: int = talisman_vectors.shape[0]
+
+    # 실제 평가와 같은 덧셈 순서(분배 + 단전 + 칭호 + 부적, 베이스 + 기여)로 상계 행 구성
+    title_upper_deltas: np.ndarray | None = _evaluate_upper_rows(
+        bound_model,
+        bound_model.base_vector
+        + (
+            ((distribution_vector + bound_model.danjeon_upper_vector) + title_vectors)
+            + bound_model.talisman_upper_vector
+        ),
+        stats,
+    )
+    if title_upper_deltas is None:
+        return None
+
+    best_batch_delta: float = float("-inf")
+    found_indices: list[np.ndarray] = []
+    found_rows: list[np.ndarray] = []
+    found_deltas: list[np.ndarray] = []
+    title_index: int
+    for title_index in np.argsort(-title_upper_deltas, kind="stable").tolist():
+        # 상계 내림차순이므로 이후 칭호도 모두 후보가 될 수 없음
+        threshold: float = best_batch_delta - _selection_tolerance(best_batch_delta)
+        if title_upper_deltas[title_index] < threshold:
+            break
+
+        # 단전별 상계(부적 최댓값 결합)와 부적별 상계(단전 최댓값 결합)를 한 번에 평가
+        inner_upper_deltas: np.ndarray | None = _evaluate_upper_rows(
+            bound_model,
+            bound_model.base_vector
+            + np.concatenate(
+                (
+                    (
+                        (distribution_vector + danjeon_vectors)
+                        + title_vectors[title_index]
+                    )
+                    + bound_model.talisman_upper_vector,
+                    (
+                        (distribution_vector + bound_model.danjeon_upper_vector)
+                        + title_vectors[title_index]
+                    )
+                    + talisman_vectors,
+                )
+            ),
+            stats,
+        )
+        if inner_upper_deltas is None:
+            return None
+
+        danjeon_upper_deltas: np.ndarray = inner_upper_deltas[: len(danjeon_vectors)]
+        talisman_upper_deltas: np.ndarray = inner_upper_deltas[len(danjeon_vectors) :]
+
+        # 상계가 가장 큰 단전을 먼저 평가해 최고값을 올린 뒤 나머지 단전을 다시 거름
+        danjeon_order: np.ndarray = np.argsort(-danjeon_upper_deltas, kind="stable")
+        danjeon_group: np.ndarray
+        for danjeon_group in (danjeon_order[:1], danjeon_order[1:]):
+            threshold = best_batch_delta - _selection_tolerance(best_batch_delta)
+            kept_danjeon_indices: np.ndarray = danjeon_group[
+                danjeon_upper_deltas[danjeon_group] >= threshold
+            ]
+            kept_talisman_indices: np.ndarray = np.flatnonzero(
+                talisman_upper_deltas >= threshold
+            )
+            if not (kept_danjeon_indices.size and kept_talisman_indices.size):
+                continue
+
+            # 남은 단전 x 남은 부적 조합 정확 평가
+            changed_rows: np.ndarray = bound_model.base_vector + (
+                (
+                    (
+                        distribution_vector
+                        + danjeon_vectors[kept_danjeon_indices, None, :]
+                    )
+                    + title_vectors[title_index]
+                )
+                + talisman_vectors[None, kept_talisman_indices, :]
+            ).reshape(-1, STAT_COUNT)
+            metric_deltas: np.ndarray = _evaluate_rows_by_skill_speed(
+                context,
+                resolve_stat_rows(changed_rows),
+                target_formula_id,
+                stats,
+            )
+            if not np.all(np.isfinite(metric_deltas)):
+                return None
+
+            best_batch_delta = max(best_batch_delta, float(metric_deltas.max()))
+            threshold = best_batch_delta - _selection_tolerance(best_batch_delta)
+            candidate_mask: np.ndarray = metric_deltas >= threshold
+            found_indices.append(
+                (
+                    kept_danjeon_indices[:, None] * (title_count * talisman_count)
+                    + title_index * talisman_count
+                    + kept_talisman_indices[None, :]
+                ).reshape(-1)[candidate_mask]
+            )
+            found_rows.append(changed_rows[candidate_mask])
+            found_deltas.append(metric_deltas[candidate_mask])
+
+    # 이후 갱신된 최고값 기준으로 다시 거른 뒤 전수 평가와 같은 행 순서로 정렬
+    threshold = best_batch_delta - _selection_tolerance(best_batch_delta)
+    candidate_mask = np.concatenate(found_deltas) >= threshold
+    candidate_indices: np.ndarray = np.concatenate(found_indices)[candidate_mask]
+    candidate_rows: np.ndarray = np.concatenate(found_rows)[candidate_mask]
+    row_order: np.ndarray = np.argsort(candidate_indices, kind="stable")
+    return candidate_indices[row_order], candidate_rows[row_order]
+
+
 def _evaluate_distribution_selection(
-    server_spec: "ServerSpec",
-    preset: "MacroPreset",
-    skills_info: dict[str, "SkillUsageSetting"],
-    delay_ms: int,
     context: EvaluationContext,
     base_state: BaseState,
     distribution_state: DistributionState,
     danjeon_entries: list[tuple[DanjeonState, Contribution]],
     title_entries: list[tuple[str | None, Contribution]],
     talisman_entries: list[tuple[tuple[str, ...], Contribution]],
-    timeline_cache: dict[float, TimelineEvaluationArtifacts],
     target_formula_id: str,
+    selection_space: InnerSelectionSpace | None = None,
+    bound_model: DistributionBoundModel | None = None,
+    stats: OptimizationStats | None = None,
 ) -> OptimizationResult | None:
-    """고정 스탯 분배 기준 내부 선택지 최적화"""
+    """고정 스탯 분배 기준 내부 선택지 최적화
+
+    조합 수가 많으면 bound_model의 상계로 한정 탐색해 정확한 최적을 구하고,
+    상계를 쓸 수 없으면 기울기 상위 K개 후보만 평가하는 근사 결과(is_exact=False)를 반환한다.
+    selection_space는 entries로 구성한 기여 배열이며, 없으면 호출마다 구성한다.
+    stats가 주어지면 평가 횟수를 누적한다.
+    """
+
+    if stats is not None:
+        stats.selection_evaluation_count += 1
 
     # 분배 기여 사전 계산
     distribution_contribution: Contribution = build_distribution_contribution(
         distribution_state
     )
+    distribution_vector: np.ndarray = distribution_contribution.to_vector()
 
-    # 기준 베이스의 str 키 → 값 맵을 사전 캐시하여 반복 변환 제거
-    base_raw_values: dict[str, float] = base_state.base_stats.values
-
-    # 분배 기여만 적용한 기준 스탯 구성 (기울기 계산용)
-    dist_base_stats: dict[StatKey, float] = {}
-    for _idx, _sk in enumerate(_STAT_ORDER_KEYS):
-        _base_val: float = base_raw_values.get(_STAT_ORDER_VALUES[_idx], 0.0)
-        dist_base_stats[_sk] = _base_val + distribution_contribution.values.get(
-            _sk, 0.0
-        )
-
-    # 기준 분배 스킬속도에 맞는 타임라인 아티팩트 확보
-    dist_resolved: FinalStats = _fast_resolve(dist_base_stats)
-    dist_skill_speed: float = float(dist_resolved.values[_FK_SKILL_SPEED_PERCENT])
-    dist_speed_key: float = round(dist_skill_speed, 2)
-    dist_timeline: TimelineEvaluationArtifacts | None = timeline_cache.get(
-        dist_speed_key
-    )
-    if dist_timeline is None:
-        dist_timeline = _build_timeline_evaluation_artifacts(
-            build_calculator_timeline(
-                server_spec=server_spec,
-                preset=preset,
-                skills_info=skills_info,
-                delay_ms=delay_ms,
-                cooltime_reduction=dist_skill_speed,
-            ),
-            level=preset.info.calculator.level,
-            skill_slot_variables=context.timeline_artifacts.skill_slot_variables,
+    if selection_space is None:
+        selection_space = _build_inner_selection_space(
+            danjeon_entries,
+            title_entries,
+            talisman_entries,
         )
-        timeline_cache[dist_speed_key] = dist_timeline
 
-    # 조합 수 기반 기울기 필터링 적용 여부 결정
+    # 조합 수가 많으면 상계 한정 탐색 우선 시도 (분배 기여가 음수면 상계 전제 불성립)
     total_combos: int = (
         len(danjeon_entries) * len(title_entries) * len(talisman_entries)
     )
-    if total_combos > _GRADIENT_EXACT_THRESHOLD:
+    if (
+        bound_model is not None
+        and total_combos > _GRADIENT_EXACT_THRESHOLD
+        and min(
+            distribution_state.strength,
+            distribution_state.dexterity,
+            distribution_state.vitality,
+            distribution_state.luck,
+        )
+        >= 0
+    ):
+        bounded_candidates: tuple[np.ndarray, np.ndarray] | None = (
+            _find_bounded_selection_candidates(
+                context=context,
+                bound_model=bound_model,
+                distribution_vector=distribution_vector,
+                target_formula_id=target_formula_id,
+                stats=stats,
+            )
+        )
+        if bounded_candidates is not None:
+            return _select_best_candidate_row(
+                context=context,
+                distribution_state=distribution_state,
+                danjeon_entries=danjeon_entries,
+                title_entries=title_entries,
+                talisman_entries=talisman_entries,
+                target_formula_id=target_formula_id,
+                candidate_indices=bounded_candidates[0].tolist(),
+                candidate_rows=bounded_candidates[1],
+                is_exact=True,
+                stats=stats,
+            )
+
+    # 조합 수 기반 기울기 필터링 적용 여부 결정 (평가할 후보 위치 목록)
+    danjeon_indices: list[int] = list(range(len(danjeon_entries)))
+    title_indices: list[int] = list(range(len(title_entries)))
+    talisman_indices: list[int] = list(range(len(talisman_entries)))
+    is_exact: bool = total_combos <= _GRADIENT_EXACT_THRESHOLD
+    if not is_exact:
+        if stats is not None:
+            stats.approximate_selection_count += 1
+
+        # 기준 베이스의 str 키 → 값 맵을 사전 캐시하여 반복 변환 제거
+        base_raw_values: dict[str, float] = base_state.base_stats.values
+
+        # 분배 기여만 적용한 기준 스탯 구성 (기울기 계산용)
+        dist_base_stats: dict[StatKey, float] = {}
+        for _idx, _sk in enumerate(_STAT_ORDER_KEYS):
+            _base_val: float = base_raw_values.get(_STAT_ORDER_VALUES[_idx], 0.0)
+            dist_base_stats[_sk] = _base_val + distribution_contribution.values.get(
+                _sk, 0.0
+            )
+
+        # 기준 분배 스킬속도에 맞는 타임라인 아티팩트 확보
+        dist_resolved: FinalStats = _fast_resolve(dist_base_stats)
+        dist_skill_speed: float = float(dist_resolved.values[_FK_SKILL_SPEED_PERCENT])
+        dist_timeline: TimelineEvaluationArtifacts = context.timeline_table.get(
+            dist_skill_speed
+        )
+
         # 기여에 사용되는 스탯 키 수집
-        relevant_stats: set[StatKey] = set()
-        for _, _contrib in danjeon_entries:
-            relevant_stats.update(k for k, v in _contrib.values.items() if v != 0.0)
-        for _, _contrib in title_entries:
-            relevant_stats.update(k for k, v in _contrib.values.items() if v != 0.0)
-        for _, _contrib in talisman_entries:
-            relevant_stats.update(k for k, v in _contrib.values.items() if v != 0.0)
-
-        # 기준점 기울기 계산
+        relevant_stats: set[StatKey] = {
+            _STAT_ORDER_KEYS[stat_index]
+            for stat_index in selection_space.varying_indices.tolist()
+        }
+
+        # 기준점 기울기 계산 (floor/round로 감싼 공식도 안쪽 식의 기울기로 순위 결정)
         gradient: dict[StatKey, float] = _compute_power_gradient(
             dist_timeline,
             dist_base_stats,
@@ -3551,201 +5996,367 @@ def _evaluate_distribution_selection(
         )
 
         # 각 차원 독립 점수 매기기 → 상위 K개 필터링
-        effective_danjeon: list[tuple[DanjeonState, Contribution]] = sorted(
-            danjeon_entries,
-            key=lambda e: _score_contribution_by_gradient(gradient, e[1]),
+        danjeon_indices = sorted(
+            danjeon_indices,
+            key=lambda i: _score_contribution_by_gradient(
+                gradient, danjeon_entries[i][1]
+            ),
             reverse=True,
         )[:_GRADIENT_TOP_K]
-        effective_title: list[tuple[str | None, Contribution]] = sorted(
-            title_entries,
-            key=lambda e: _score_contribution_by_gradient(gradient, e[1]),
+        title_indices = sorted(
+            title_indices,
+            key=lambda i: _score_contribution_by_gradient(
+                gradient, title_entries[i][1]
+            ),
             reverse=True,
         )[:_GRADIENT_TOP_K]
-        effective_talisman: list[tuple[tuple[str, ...], Contribution]] = sorted(
-            talisman_entries,
-            key=lambda e: _score_contribution_by_gradient(gradient, e[1]),
+        talisman_indices = sorted(
+            talisman_indices,
+            key=lambda i: _score_contribution_by_gradient(
+                gradient, talisman_entries[i][1]
+            ),
             reverse=True,
         )[:_GRADIENT_TOP_K]
+
+    # 후보 조합 수가 0이면 평가 불가
+    if not (danjeon_indices and title_indices and talisman_indices):
+        return None
+
+    # 조합별 베이스 스탯을 (단전 x 칭호 x 부적) 순서 행 배열로 합산
+    # 기존 딕셔너리 병합과 같은 순서(분배 + 단전 + 칭호 + 부적, 베이스 + 기여)로 더함
+    danjeon_vectors: np.ndarray = selection_space.danjeon_vectors[danjeon_indices]
+    title_vectors: np.ndarray = selection_space.title_vectors[title_indices]
+    talisman_vectors: np.ndarray = selection_space.talisman_vectors[talisman_indices]
+    merged_contributions: np.ndarray = (
+        (distribution_vector + danjeon_vectors[:, None, None, :])
+        + title_vectors[None, :, None, :]
+    ) + talisman_vectors[None, None, :, :]
+    changed_rows: np.ndarray = base_state.base_stats.to_vector() + (
+        merged_contributions.reshape(-1, STAT_COUNT)
+    )
+    metric_deltas: np.ndarray = _evaluate_rows_by_skill_speed(
+        context,
+        resolve_stat_rows(changed_rows),
+        target_formula_id,
+        stats,
+    )
+
+    # 일괄 평가 오차 범위 내 상위 후보만 기존 단일 평가로 재확인해 동일 결과 보장
+    if np.all(np.isfinite(metric_deltas)):
+        best_batch_delta: float = float(metric_deltas.max())
+        candidate_indices: list[int] = np.flatnonzero(
+            metric_deltas >= best_batch_delta - _selection_tolerance(best_batch_delta)
+        ).tolist()
     else:
-        effective_danjeon = danjeon_entries
-        effective_title = title_entries
-        effective_talisman = talisman_entries
+        candidate_indices = list(range(changed_rows.shape[0]))
+
+    return _select_best_candidate_row(
+        context=context,
+        distribution_state=distribution_state,
+        danjeon_entries=[danjeon_entries[index] for index in danjeon_indices],
+        title_entries=[title_entries[index] for index in title_indices],
+        talisman_entries=[talisman_entries[index] for index in talisman_indices],
+        target_formula_id=target_formula_id,
+        candidate_indices=candidate_indices,
+        candidate_rows=changed_rows[candidate_indices],
+        is_exact=is_exact,
+        stats=stats,
+    )
+
+
+def _select_best_candidate_row(
+    context: EvaluationContext,
+    distribution_state: DistributionState,
+    danjeon_entries: list[tuple[DanjeonState, Contribution]],
+    title_entries: list[tuple[str | None, Contribution]],
+    talisman_entries: list[tuple[tuple[str, ...], Contribution]],
+    target_formula_id: str,
+    candidate_indices: list[int],
+    candidate_rows: np.ndarray,
+    is_exact: bool,
+    stats: OptimizationStats | None = None,
+) -> OptimizationResult | None:
+    """재확인 후보 행을 단일 평가해 최고 결과 반환 (동률이면 앞선 행 우선)
+
+    candidate_indices는 (단전 x 칭호 x 부적) 순서 행 번호, candidate_rows는 같은 순서의 베이스 스탯 행.
+    """
+
+    if stats is not None:
+        stats.formula_evaluation_count += len(candidate_indices)
 
-    # 필터링된 후보에 대한 정확 평가 루프
+    title_count: int = len(title_entries)
+    talisman_count: int = len(talisman_entries)
     best_result: OptimizationResult | None = None
     best_metric_delta: float | None = None
-    danjeon_state: DanjeonState
-    danjeon_contribution: Contribution
-    for danjeon_state, danjeon_contribution in effective_danjeon:
-        equipped_title_name: str | None
-        title_contribution: Contribution
-        for equipped_title_name, title_contribution in effective_title:
-            equipped_talisman_names: tuple[str, ...]
-            talisman_contribution: Contribution
-            for equipped_talisman_names, talisman_contribution in effective_talisman:
-                # 선택지 기여 병합 (인라인)
-                merged_values: dict[StatKey, float] = (
-                    distribution_contribution.values.copy()
-                )
-                for _contrib in (
-                    danjeon_contribution,
-                    title_contribution,
-                    talisman_contribution,
-                ):
-                    for _sk, _v in _contrib.values.items():
-                        merged_values[_sk] = merged_values.get(_sk, 0.0) + _v
-
-                # 기여 적용 + resolve 통합
-                changed_stats: dict[StatKey, float] = {}
-                for _idx, _sk in enumerate(_STAT_ORDER_KEYS):
-                    _base_val = base_raw_values.get(_STAT_ORDER_VALUES[_idx], 0.0)
-                    changed_stats[_sk] = _base_val + merged_values.get(_sk, 0.0)
-
-                optimized_resolved_stats: FinalStats = _fast_resolve(changed_stats)
-                candidate_skill_speed: float = float(
-                    optimized_resolved_stats.values[_FK_SKILL_SPEED_PERCENT]
-                )
-                speed_cache_key: float = round(candidate_skill_speed, 2)
-                cached_timeline_artifacts: TimelineEvaluationArtifacts | None = (
-                    timeline_cache.get(speed_cache_key)
-                )
-                if cached_timeline_artifacts is None:
-                    cached_hit_events: tuple[HitEvent, ...] = build_calculator_timeline(
-                        server_spec=server_spec,
-                        preset=preset,
-                        skills_info=skills_info,
-                        delay_ms=delay_ms,
-                        cooltime_reduction=candidate_skill_speed,
-                    )
-                    cached_timeline_artifacts = _build_timeline_evaluation_artifacts(
-                        cached_hit_events,
-                        level=preset.info.calculator.level,
-                        skill_slot_variables=(
-                            context.timeline_artifacts.skill_slot_variables
-                        ),
-                    )
-                    timeline_cache[speed_cache_key] = cached_timeline_artifacts
-
-                target_value: float = evaluate_single_metric(
-                    artifacts=cached_timeline_artifacts,
-                    resolved_stats=optimized_resolved_stats,
-                    target_formula_id=target_formula_id,
-                    compiled_custom_formula=context.compiled_custom_formula,
-                )
-                metric_delta: float = target_value - context.baseline_power
+    candidate_index: int
+    candidate_row: np.ndarray
+    for candidate_index, candidate_row in zip(candidate_indices, candidate_rows):
+        changed_stats: dict[StatKey, float] = dict(
+            zip(_STAT_ORDER_KEYS, candidate_row.tolist())
+        )
+        optimized_resolved_stats: FinalStats = _fast_resolve(changed_stats)
+        target_value: float = evaluate_single_metric(
+            artifacts=context.timeline_table.get(
+                float(optimized_resolved_stats.values[_FK_SKILL_SPEED_PERCENT])
+            ),
+            resolved_stats=optimized_resolved_stats,
+            target_formula_id=target_formula_id,
+            compiled_custom_formula=context.compiled_custom_formula,
+        )
+        metric_delta: float = target_value - context.baseline_power
 
-                if best_metric_delta is not None and metric_delta <= best_metric_delta:
-                    continue
+        if best_metric_delta is not None and metric_delta <= best_metric_delta:
+            continue
 
-                best_metric_delta = metric_delta
-                optimized_base_stats: BaseStats = BaseStats.from_stat_map(changed_stats)
-                best_result = OptimizationResult(
-                    candidate=OptimizationCandidate(
-                        distribution=distribution_state,
-                        danjeon=danjeon_state,
-                        equipped_title_name=equipped_title_name,
-                        equipped_talisman_names=equipped_talisman_names,
-                    ),
-                    delta=metric_delta,
-                    base_stats=optimized_base_stats,
-                )
+        # 행 번호를 (단전, 칭호, 부적) 후보 위치로 복원
+        danjeon_index: int
+        remainder_index: int
+        title_index: int
+        talisman_index: int
+        danjeon_index, remainder_index = divmod(
+            candidate_index, title_count * talisman_count
+        )
+        title_index, talisman_index = divmod(remainder_index, talisman_count)
+
+        best_metric_delta = metric_delta
+        best_result = OptimizationResult(
+            candidate=OptimizationCandidate(
+                distribution=distribution_state,
+                danjeon=danjeon_entries[danjeon_index][0],
+                equipped_title_name=title_entries[title_index][0],
+                equipped_talisman_names=talisman_entries[talisman_index][0],
+            ),
+            delta=metric_delta,
+            base_stats=BaseStats.from_stat_map(changed_stats),
+            is_exact=is_exact,
+        )
 
     return best_result
 
 
 def _search_subtree(
-    server_spec: "ServerSpec",
-    preset: "MacroPreset",
-    skills_info: dict[str, "SkillUsageSetting"],
-    delay_ms: int,
     context: EvaluationContext,
     base_state: BaseState,
     danjeon_entries: list[tuple[DanjeonState, Contribution]],
     title_entries: list[tuple[str | None, Contribution]],
     talisman_entries: list[tuple[tuple[str, ...], Contribution]],
     target_formula_id: str,
-    sub_range: DistributionSearchRange,
-    baseline_timeline_entry: tuple[float, TimelineEvaluationArtifacts],
-) -> OptimizationResult | None:
-    """단일 서브트리에 대한 Branch-and-Bound 탐색 (프로세스 워커 호환)"""
+    seed_ranges: tuple[tuple[float | None, DistributionSearchRange], ...],
+    cancel_checker: Callable[[], None] | None = None,
+    incumbent_reader: Callable[[], float | None] | None = None,
+    incumbent_writer: Callable[[float], None] | None = None,
+    time_slice_seconds: float | None = None,
+    dive_for_incumbent: bool = False,
+) -> SubtreeSearchOutcome:
+    """서브트리 묶음에 대한 Branch-and-Bound 탐색 (프로세스 워커 호환)
+
+    seed_ranges의 상계가 None이면 범위 루트를 평가해 상계를 구한다.
+    incumbent_reader가 주어지면 다른 워커가 찾은 해 값도 가지치기 기준에 사용하고,
+    time_slice_seconds가 지나면 남은 탐색 큐를 pending_ranges로 반환한다.
+    dive_for_incumbent이면 상계 우선 탐색 전에 상계가 큰 자식만 따라 내려가
+    초기 해를 먼저 구한다 (anytime 탐색에서 첫 해를 빨리 전달하기 위함).
+    노드/가지치기/캐시 계측 값은 결과의 stats로 함께 반환한다.
+    """
 
-    timeline_cache: dict[float, TimelineEvaluationArtifacts] = {
-        baseline_timeline_entry[0]: baseline_timeline_entry[1]
-    }
     distribution_result_cache: dict[tuple[int, int, int, int], OptimizationResult] = {}
-
-    # 서브트리 루트 상계 계산
-    root_distribution_state: DistributionState = _build_optimistic_distribution_state(
-        sub_range
-    )
-    root_cache_key: tuple[int, int, int, int] = _build_distribution_cache_key(
-        root_distribution_state
+    node_count: int = 0
+    stats: OptimizationStats = OptimizationStats()
+
+    # 타임라인 조회 계측은 프로세스 누적 값의 탐색 전후 차이로 계산
+    timeline_lookup_start: int = context.timeline_table.lookup_count
+    timeline_build_start: int = context.timeline_table.build_count
+    timeline_store_hit_start: int = timeline_store.hit_count
+    timeline_store_miss_start: int = timeline_store.miss_count
+    phase_started_at: float = time.perf_counter()
+
+    # 내부 선택지 기여 배열은 탐색 1회에 1번만 구성해 모든 노드 평가에서 재사용
+    selection_space: InnerSelectionSpace = _build_inner_selection_space(
+        danjeon_entries,
+        title_entries,
+        talisman_entries,
     )
-    root_result: OptimizationResult | None = _evaluate_distribution_selection(
-        server_spec=server_spec,
-        preset=preset,
-        skills_info=skills_info,
-        delay_ms=delay_ms,
+
+    # 내장 공식이면 내부 조합 평가 없이 상계를 구할 구간 연산 데이터 구성
+    bound_model: DistributionBoundModel | None = _build_distribution_bound_model(
         context=context,
         base_state=base_state,
-        distribution_state=root_distribution_state,
-        danjeon_entries=danjeon_entries,
-        title_entries=title_entries,
-        talisman_entries=talisman_entries,
-        timeline_cache=timeline_cache,
+        selection_space=selection_space,
         target_formula_id=target_formula_id,
     )
-    if root_result is None:
-        return None
+    stats.add_phase_seconds("setup", time.perf_counter() - phase_started_at)
+
+    def evaluate_distribution_state(
+        distribution_state: DistributionState,
+    ) -> OptimizationResult | None:
+        """분배 상태 평가 결과를 캐시와 함께 반환"""
+
+        nonlocal node_count
+
+        cache_key: tuple[int, int, int, int] = _build_distribution_cache_key(
+            distribution_state
+        )
+        stats.distribution_cache_lookup_count += 1
+        cached_result: OptimizationResult | None = distribution_result_cache.get(
+            cache_key
+        )
+        if cached_result is not None:
+            stats.distribution_cache_hit_count += 1
+            return cached_result
+
+        node_count += 1
+        evaluation_started_at: float = time.perf_counter()
+        evaluated_result: OptimizationResult | None = _evaluate_distribution_selection(
+            context=context,
+            base_state=base_state,
+            distribution_state=distribution_state,
+            danjeon_entries=danjeon_entries,
+            title_entries=title_entries,
+            talisman_entries=talisman_entries,
+            target_formula_id=target_formula_id,
+            selection_space=selection_space,
+            bound_model=bound_model,
+            stats=stats,
+        )
+        stats.add_phase_seconds("evaluate", time.perf_counter() - evaluation_started_at)
+        if evaluated_result is not None:
+            distribution_result_cache[cache_key] = evaluated_result
+
+        return evaluated_result
+
+    def compute_upper_bound(
+        distribution_range: DistributionSearchRange,
+    ) -> tuple[float, bool] | None:
+        """범위 노드 (상계, 낙관 분배 평가 여부) 반환 (평가 불가 시 None)
+
+        구간 연산 상계를 쓸 수 있으면 내부 조합 평가 없이 반환하고,
+        낙관 분배 평가는 노드를 꺼낼 때까지 미룬다.
+        """
+
+        if bound_model is not None:
+            bound_started_at: float = time.perf_counter()
+            interval_upper_bound: float | None = _estimate_distribution_upper_bound(
+                bound_model,
+                distribution_range,
+                stats,
+            )
+            stats.add_phase_seconds("bound", time.perf_counter() - bound_started_at)
+            if interval_upper_bound is not None:
+                return interval_upper_bound, False
+
+        optimistic_result: OptimizationResult | None = evaluate_distribution_state(
+            _build_optimistic_distribution_state(distribution_range)
+        )
+        if optimistic_result is None:
+            return None
+
+        return optimistic_result.delta, True
+
+    # 상계 우선 탐색 큐 초기화 (상계를 모르는 범위는 상계 계산)
+    # 큐 항목: (-상계, 순번, 범위, 낙관 분배 평가 상계 여부)
+    search_queue: list[tuple[float, int, DistributionSearchRange, bool]] = []
+    node_sequence: int = 0
+    seed_upper_bound: float | None
+    seed_range: DistributionSearchRange
+    for seed_upper_bound, seed_range in seed_ranges:
+        # 다른 작업이 넘긴 범위는 이미 구한 상계를 그대로 사용
+        is_refined: bool = True
+        if seed_upper_bound is None:
+            seed_bound: tuple[float, bool] | None = compute_upper_bound(seed_range)
+            if seed_bound is None:
+                continue
 
-    distribution_result_cache[root_cache_key] = root_result
+            seed_upper_bound, is_refined = seed_bound
 
-    # 상계 우선 탐색 큐 초기화
-    search_queue: list[tuple[float, int, DistributionSearchRange]] = []
-    root_upper_bound: float = root_result.delta
-    heapq.heappush(search_queue, (-root_upper_bound, 0, sub_range))
+        heapq.heappush(
+            search_queue,
+            (-seed_upper_bound, node_sequence, seed_range, is_refined),
+        )
+        node_sequence += 1
 
     best_result: OptimizationResult | None = None
     best_metric_delta: float | None = None
-    node_sequence: int = 1
+    if dive_for_incumbent and search_queue:
+        # 가장 유망한 시드에서 상계가 큰 자식만 따라 잎까지 내려가 초기 해 확보
+        dive_range: DistributionSearchRange | None = search_queue[0][2]
+        while dive_range is not None and not _is_leaf_distribution_search_range(
+            dive_range
+        ):
+            if cancel_checker is not None:
+                cancel_checker()
+
+            next_dive_range: DistributionSearchRange | None = None
+            next_dive_bound: float | None = None
+            child_range: DistributionSearchRange
+            for child_range in _split_distribution_search_range(dive_range):
+                if not _is_distribution_search_range_feasible(child_range):
+                    continue
 
+                dive_bound: tuple[float, bool] | None = compute_upper_bound(child_range)
+                if dive_bound is not None and (
+                    next_dive_bound is None or dive_bound[0] > next_dive_bound
+                ):
+                    next_dive_range = child_range
+                    next_dive_bound = dive_bound[0]
+
+            dive_range = next_dive_range
+
+        if dive_range is not None:
+            stats.leaf_evaluation_count += 1
+            best_result = evaluate_distribution_state(
+                _build_leaf_distribution_state(dive_range)
+            )
+            if best_result is not None:
+                best_metric_delta = best_result.delta
+                if incumbent_writer is not None:
+                    incumbent_writer(best_metric_delta)
+
+    prune_threshold: float | None = None
+    deadline: float | None = None
+    if time_slice_seconds is not None:
+        deadline = time.perf_counter() + time_slice_seconds
+
+    is_node_expanded: bool = False
     while search_queue:
-        priority_item: tuple[float, int, DistributionSearchRange] = heapq.heappop(
+        # 노드 단위 협조적 취소 확인
+        if cancel_checker is not None:
+            cancel_checker()
+
+        # 시간 제한 초과 시 남은 큐를 반환해 유휴 워커가 나눠 가져가도록 함
+        # (노드를 1개 이상 처리한 뒤에만 반환해 작업 진행 보장)
+        if (
+            deadline is not None
+            and is_node_expanded
+            and time.perf_counter() >= deadline
+        ):
+            break
+
+        # 자신의 최고 해와 공유 incumbent 중 큰 값을 가지치기 기준으로 사용
+        prune_threshold = best_metric_delta
+        if incumbent_reader is not None:
+            shared_metric_delta: float | None = incumbent_reader()
+            if shared_metric_delta is not None and (
+                prune_threshold is None or shared_metric_delta > prune_threshold
+            ):
+                prune_threshold = shared_metric_delta
+
+        priority_item: tuple[float, int, DistributionSearchRange, bool] = heapq.heappop(
             search_queue
         )
         node_upper_bound: float = -priority_item[0]
         distribution_range: DistributionSearchRange = priority_item[2]
-        if best_metric_delta is not None and node_upper_bound <= best_metric_delta:
+        if prune_threshold is not None and node_upper_bound <= prune_threshold:
+            stats.pruned_node_count += 1
             continue
 
+        is_node_expanded = True
+        stats.expanded_node_count += 1
         if _is_leaf_distribution_search_range(distribution_range):
-            leaf_distribution_state: DistributionState = _build_leaf_distribution_state(
-                distribution_range
-            )
-            leaf_cache_key: tuple[int, int, int, int] = _build_distribution_cache_key(
-                leaf_distribution_state
-            )
-            leaf_result: OptimizationResult | None = distribution_result_cache.get(
-                leaf_cache_key
+            stats.leaf_evaluation_count += 1
+            leaf_result: OptimizationResult | None = evaluate_distribution_state(
+                _build_leaf_distribution_state(distribution_range)
             )
             if leaf_result is None:
-                leaf_result = _evaluate_distribution_selection(
-                    server_spec=server_spec,
-                    preset=preset,
-                    skills_info=skills_info,
-                    delay_ms=delay_ms,
-                    context=context,
-                    base_state=base_state,
-                    distribution_state=leaf_distribution_state,
-                    danjeon_entries=danjeon_entries,
-                    title_entries=title_entries,
-                    talisman_entries=talisman_entries,
-                    timeline_cache=timeline_cache,
-                    target_formula_id=target_formula_id,
-                )
-                if leaf_result is None:
-                    continue
-                distribution_result_cache[leaf_cache_key] = leaf_result
+                continue
 
             leaf_metric_delta: float = leaf_result.delta
             if best_metric_delta is not None and leaf_metric_delta <= best_metric_delta:
@@ -3753,8 +6364,33 @@ def _search_subtree(
 
             best_metric_delta = leaf_metric_delta
             best_result = leaf_result
+            if incumbent_writer is not None:
+                incumbent_writer(leaf_metric_delta)
+
             continue
 
+        # 구간 상계로 남은 노드는 꺼낸 시점에 낙관 분배 평가로 상계를 좁힘
+        if not priority_item[3]:
+            optimistic_result: OptimizationResult | None = evaluate_distribution_state(
+                _build_optimistic_distribution_state(distribution_range)
+            )
+            if optimistic_result is None:
+                continue
+
+            node_upper_bound = optimistic_result.delta
+            if prune_threshold is not None and node_upper_bound <= prune_threshold:
+                stats.pruned_node_count += 1
+                continue
+
+            # 좁힌 상계가 다음 노드보다 작으면 큐에 되돌려 상계 우선 순서 유지
+            if search_queue and node_upper_bound < -search_queue[0][0]:
+                heapq.heappush(
+                    search_queue,
+                    (-node_upper_bound, node_sequence, distribution_range, True),
+                )
+                node_sequence += 1
+                continue
+
         child_ranges: tuple[DistributionSearchRange, DistributionSearchRange] = (
             _split_distribution_search_range(distribution_range)
         )
@@ -3763,103 +6399,427 @@ def _search_subtree(
             if not _is_distribution_search_range_feasible(child_range):
                 continue
 
-            optimistic_distribution_state: DistributionState = (
-                _build_optimistic_distribution_state(child_range)
+            child_bound: tuple[float, bool] | None = compute_upper_bound(child_range)
+            if child_bound is None:
+                continue
+
+            child_upper_bound: float
+            is_child_refined: bool
+            child_upper_bound, is_child_refined = child_bound
+            if prune_threshold is not None and child_upper_bound <= prune_threshold:
+                stats.pruned_node_count += 1
+                continue
+
+            heapq.heappush(
+                search_queue,
+                (-child_upper_bound, node_sequence, child_range, is_child_refined),
             )
-            optimistic_cache_key: tuple[int, int, int, int] = (
-                _build_distribution_cache_key(optimistic_distribution_state)
+            node_sequence += 1
+
+    # 반환 시점 기준으로도 가지치기되는 범위는 제외
+    pending_ranges: tuple[tuple[float, DistributionSearchRange], ...] = tuple(
+        (-negative_upper_bound, pending_range)
+        for negative_upper_bound, _, pending_range, _ in sorted(search_queue)
+        if prune_threshold is None or -negative_upper_bound > prune_threshold
+    )
+
+    # 서브트리 탐색 중 구성한 스킬속도별 타임라인을 다른 워커/다음 실행과 공유
+    timeline_store.flush()
+
+    stats.timeline_lookup_count = (
+        context.timeline_table.lookup_count - timeline_lookup_start
+    )
+    stats.timeline_build_count = (
+        context.timeline_table.build_count - timeline_build_start
+    )
+    stats.timeline_store_hit_count = timeline_store.hit_count - timeline_store_hit_start
+    stats.timeline_rebuild_count = timeline_store.miss_count - timeline_store_miss_start
+    stats.add_phase_seconds("subtree", time.perf_counter() - phase_started_at)
+
+    return SubtreeSearchOutcome(
+        best_result=best_result,
+        pending_ranges=pending_ranges,
+        node_count=node_count,
+        stats=stats,
+    )
+
+
+def _search_subtree_task(
+    context_handle: SharedContextHandle,
+    generation: int,
+    seed_ranges: tuple[tuple[float | None, DistributionSearchRange], ...],
+    time_slice_seconds: float | None,
+    dive_for_incumbent: bool = False,
+) -> SubtreeSearchOutcome | None:
+    """영속 워커 풀 서브트리 작업 (공유 컨텍스트 1회 적재, 취소 세대/incumbent 공유)"""
+
+    try:
+        # 이미 취소된 세대 작업은 컨텍스트 적재 없이 종료
+        check_generation_cancelled(generation)
+        shared_args: tuple = cast(tuple, load_shared_context(context_handle))
+        return _search_subtree(
+            *shared_args,
+            seed_ranges=seed_ranges,
+            cancel_checker=lambda: check_generation_cancelled(generation),
+            incumbent_reader=lambda: read_shared_incumbent(generation),
+            incumbent_writer=lambda value: offer_shared_incumbent(generation, value),
+            time_slice_seconds=time_slice_seconds,
+            dive_for_incumbent=dive_for_incumbent,
+        )
+
+    except OptimizationCancelledError:
+        return None
+
+
+def _warm_up_optimization_worker() -> None:
+    """워커 프로세스의 계산 모듈 import 예열용 빈 작업"""
+
+
+def start_optimization_worker_pool() -> None:
+    """앱 시작 시 최적화 워커 풀을 백그라운드로 미리 생성"""
+
+    # 작업 함수 역직렬화 과정에서 워커가 이 모듈을 import
+    optimization_pool.start(_warm_up_optimization_worker)
+
+
+def shutdown_optimization_worker_pool() -> None:
+    """앱 종료 시 최적화 워커 풀의 진행 작업 취소 및 종료"""
+
+    optimization_pool.shutdown()
+
+
+def _generate_sub_ranges(
+    root_range: DistributionSearchRange,
+    target_count: int,
+) -> list[DistributionSearchRange]:
+    """탐색 루트를 target_count 개 이상의 서브 범위로 분할"""
+
+    ranges: list[DistributionSearchRange] = [root_range]
+    while len(ranges) < target_count:
+        # 가장 넓은 축 폭을 가진 범위를 선택하여 분할
+        best_idx: int = 0
+        best_span: int = 0
+        for idx, search_range in enumerate(ranges):
+            span: int = max(
+                search_range.strength_max - search_range.strength_min,
+                search_range.dexterity_max - search_range.dexterity_min,
+                search_range.vitality_max - search_range.vitality_min,
             )
-            optimistic_result: OptimizationResult | None = (
-                distribution_result_cache.get(optimistic_cache_key)
+            if span > best_span:
+                best_span = span
+                best_idx = idx
+
+        if best_span == 0:
+            break
+
+        target_range: DistributionSearchRange = ranges.pop(best_idx)
+        child_a: DistributionSearchRange
+        child_b: DistributionSearchRange
+        child_a, child_b = _split_distribution_search_range(target_range)
+        if _is_distribution_search_range_feasible(child_a):
+            ranges.append(child_a)
+        if _is_distribution_search_range_feasible(child_b):
+            ranges.append(child_b)
+
+    return ranges
+
+
+def _split_pending_ranges(
+    pending_ranges: tuple[tuple[float, DistributionSearchRange], ...],
+    chunk_count: int,
+) -> list[tuple[tuple[float, DistributionSearchRange], ...]]:
+    """남은 탐색 범위를 상계 순으로 번갈아 나눠 chunk_count 개 작업으로 분할"""
+
+    # 상계 내림차순으로 돌아가며 배정해 각 작업이 유망한 범위를 고르게 받도록 함
+    sorted_ranges: list[tuple[float, DistributionSearchRange]] = sorted(
+        pending_ranges,
+        key=lambda item: -item[0],
+    )
+    chunks: list[list[tuple[float, DistributionSearchRange]]] = [
+        [] for _ in range(max(1, min(chunk_count, len(sorted_ranges))))
+    ]
+    index: int
+    pending_item: tuple[float, DistributionSearchRange]
+    for index, pending_item in enumerate(sorted_ranges):
+        chunks[index % len(chunks)].append(pending_item)
+
+    return [tuple(chunk) for chunk in chunks]
+
+
+@dataclass(slots=True)
+class _AnytimeSearchTracker:
+    """anytime 탐색의 최고 해 전달과 조기 종료 조건 판정 상태
+
+    최고 해가 개선되거나 증명된 상계가 좁혀질 때만 호출자에게 전달하고,
+    시간 예산 초과/상계 차이 허용치 도달/호출자 수락 요청 시 종료를 알린다.
+    """
+
+    incumbent_callback: Callable[[OptimizationIncumbent], None] | None = None
+    time_budget_seconds: float | None = None
+    gap_tolerance: float | None = None
+    stop_checker: Callable[[], bool] | None = None
+    started_at: float = field(default_factory=time.perf_counter)
+    # 마지막으로 전달한 (지표 변화량, 상계)
+    last_reported: tuple[float, float | None] | None = None
+    last_incumbent: OptimizationIncumbent | None = None
+
+    @property
+    def is_active(self) -> bool:
+        """중간 결과 전달 또는 조기 종료 조건이 하나라도 설정되었는지 여부"""
+
+        return (
+            self.incumbent_callback is not None
+            or self.time_budget_seconds is not None
+            or self.gap_tolerance is not None
+            or self.stop_checker is not None
+        )
+
+    def report(
+        self,
+        best_result: OptimizationResult | None,
+        upper_bound: float | None,
+        is_complete: bool = False,
+    ) -> bool:
+        """현재 최고 해와 상계 반영 후 탐색을 멈춰야 하는지 여부 반환"""
+
+        if best_result is not None:
+            # 상계는 최고 해보다 작을 수 없으므로 아래로 고정
+            if upper_bound is not None:
+                upper_bound = max(upper_bound, best_result.delta)
+
+            incumbent: OptimizationIncumbent = OptimizationIncumbent(
+                result=best_result,
+                upper_bound=upper_bound,
+                elapsed_seconds=time.perf_counter() - self.started_at,
+                is_complete=is_complete,
             )
-            if optimistic_result is None:
-                optimistic_result = _evaluate_distribution_selection(
-                    server_spec=server_spec,
-                    preset=preset,
-                    skills_info=skills_info,
-                    delay_ms=delay_ms,
-                    context=context,
-                    base_state=base_state,
-                    distribution_state=optimistic_distribution_state,
-                    danjeon_entries=danjeon_entries,
-                    title_entries=title_entries,
-                    talisman_entries=talisman_entries,
-                    timeline_cache=timeline_cache,
-                    target_formula_id=target_formula_id,
-                )
-                if optimistic_result is None:
-                    continue
-                distribution_result_cache[optimistic_cache_key] = optimistic_result
+            self.last_incumbent = incumbent
+
+            # 최고 해 개선 또는 상계 축소 시에만 전달
+            reported_key: tuple[float, float | None] = (best_result.delta, upper_bound)
+            if self.incumbent_callback is not None and (
+                is_complete or reported_key != self.last_reported
+            ):
+                self.last_reported = reported_key
+                self.incumbent_callback(incumbent)
+
+            incumbent_gap: float | None = incumbent.gap
+            if (
+                self.gap_tolerance is not None
+                and incumbent_gap is not None
+                and incumbent_gap <= self.gap_tolerance
+            ):
+                return True
+
+            # 수락 요청은 보여줄 해가 있을 때만 반영
+            if self.stop_checker is not None and self.stop_checker():
+                return True
+
+        return (
+            self.time_budget_seconds is not None
+            and best_result is not None
+            and time.perf_counter() - self.started_at >= self.time_budget_seconds
+        )
+
+
+def _run_parallel_subtree_search(
+    pool: OptimizationWorkerPool,
+    shared_args: tuple[object, ...],
+    sub_ranges: list[DistributionSearchRange],
+    progress_callback: Callable[[str, int], None] | None = None,
+    cancel_checker: Callable[[], None] | None = None,
+    time_slice_seconds: float = _SUBTREE_TIME_SLICE_SECONDS,
+    tracker: _AnytimeSearchTracker | None = None,
+    initial_result: OptimizationResult | None = None,
+) -> ParallelSearchOutcome:
+    """영속 워커 풀에서 incumbent를 공유하며 작업을 재분배하는 병렬 분기 한정 탐색
+
+    각 작업은 time_slice_seconds 동안만 탐색하고 남은 큐를 돌려주며,
+    부모는 이를 유휴 워커 수만큼 나눠 다시 제출한다 (공유 작업 큐를 통한 작업 훔치기).
+    tracker가 주어지면 진행 중 작업들의 시드 상계 최댓값을 증명된 상계로 함께 전달하고,
+    조기 종료 조건을 만족하면 남은 작업을 취소한 뒤 현재 최고 해를 반환한다.
+    initial_result가 주어지면 그 값을 첫 incumbent로 공유해 가지치기에 사용한다.
+    """
+
+    # 영속 워커 풀에 공유 컨텍스트를 1회 게시하고 작업에는 식별자만 전달
+    executor: ProcessPoolExecutor = pool.acquire()
+    generation: int = pool.new_generation()
+    context_handle: SharedContextHandle = publish_shared_context(shared_args)
+    pending_futures: set[Future[SubtreeSearchOutcome | None]] = set()
+    # 작업별 시드 범위 상계 최댓값 (상계를 모르는 시드가 있으면 None)
+    future_upper_bounds: dict[Future[SubtreeSearchOutcome | None], float | None] = {}
+    is_completed: bool = False
+
+    best_result: OptimizationResult | None = initial_result
+    best_metric_delta: float | None = None
+    if initial_result is not None:
+        best_metric_delta = initial_result.delta
+        pool.offer_incumbent(generation, initial_result.delta)
+
+    node_count: int = 0
+    task_count: int = 0
+    completed_task_count: int = 0
+    last_progress_value: int = 5
+    stats: OptimizationStats = OptimizationStats()
+
+    def submit_task(
+        seed_ranges: tuple[tuple[float | None, DistributionSearchRange], ...],
+    ) -> None:
+        """탐색 작업 제출"""
+
+        nonlocal task_count
+
+        future: Future[SubtreeSearchOutcome | None] = executor.submit(
+            _search_subtree_task,
+            context_handle,
+            generation,
+            seed_ranges,
+            time_slice_seconds,
+            # 처음 제출하는 작업은 anytime 탐색이면 첫 해를 빨리 구하도록 잠수 탐색
+            tracker is not None and best_metric_delta is None,
+        )
+        pending_futures.add(future)
+        seed_upper_bounds: list[float | None] = [
+            seed_upper_bound for seed_upper_bound, _ in seed_ranges
+        ]
+        future_upper_bounds[future] = (
+            None
+            if None in seed_upper_bounds
+            else max(cast(list[float], seed_upper_bounds))
+        )
+
+        task_count += 1
+
+    def compute_proven_upper_bound() -> float | None:
+        """진행 중 작업 전체의 증명된 상계 (상계를 모르는 작업이 있으면 None)"""
+
+        upper_bound: float | None = best_metric_delta
+        future: Future[SubtreeSearchOutcome | None]
+        for future in pending_futures:
+            future_upper_bound: float | None = future_upper_bounds[future]
+            if future_upper_bound is None:
+                return None
+
+            if upper_bound is None or future_upper_bound > upper_bound:
+                upper_bound = future_upper_bound
+
+        return upper_bound
+
+    try:
+        sub_range: DistributionSearchRange
+        for sub_range in sub_ranges:
+            submit_task(((None, sub_range),))
 
-            child_upper_bound: float = optimistic_result.delta
-            if best_metric_delta is not None and child_upper_bound <= best_metric_delta:
-                continue
+        while pending_futures:
+            if cancel_checker is not None:
+                cancel_checker()
 
-            heapq.heappush(
-                search_queue,
-                (-child_upper_bound, node_sequence, child_range),
+            done_futures: set[Future[SubtreeSearchOutcome | None]]
+            done_futures, _ = wait(
+                pending_futures,
+                timeout=0.1,
+                return_when=FIRST_COMPLETED,
             )
-            node_sequence += 1
-
-    return best_result
+            if not done_futures:
+                # 새 결과가 없어도 시간 예산과 수락 요청은 계속 확인
+                if tracker is not None and tracker.report(
+                    best_result, compute_proven_upper_bound()
+                ):
+                    break
 
+                continue
 
-def _generate_sub_ranges(
-    root_range: DistributionSearchRange,
-    target_count: int,
-) -> list[DistributionSearchRange]:
-    """탐색 루트를 target_count 개 이상의 서브 범위로 분할"""
+            pending_futures.difference_update(done_futures)
+            future: Future[SubtreeSearchOutcome | None]
+            for future in done_futures:
+                future_upper_bounds.pop(future, None)
+                outcome: SubtreeSearchOutcome | None = future.result()
+                completed_task_count += 1
+                if outcome is None:
+                    continue
 
-    ranges: list[DistributionSearchRange] = [root_range]
-    while len(ranges) < target_count:
-        # 가장 넓은 축 폭을 가진 범위를 선택하여 분할
-        best_idx: int = 0
-        best_span: int = 0
-        for idx, search_range in enumerate(ranges):
-            span: int = max(
-                search_range.strength_max - search_range.strength_min,
-                search_range.dexterity_max - search_range.dexterity_min,
-                search_range.vitality_max - search_range.vitality_min,
-            )
-            if span > best_span:
-                best_span = span
-                best_idx = idx
+                node_count += outcome.node_count
+                stats.merge(outcome.stats)
+                result: OptimizationResult | None = outcome.best_result
+                if result is not None:
+                    delta: float = result.delta
+                    if best_metric_delta is None or delta > best_metric_delta:
+                        best_metric_delta = delta
+                        best_result = result
+                        pool.offer_incumbent(generation, delta)
+
+                # 남은 범위 중 현재 최고 해로 가지치기되지 않는 것만 재분배
+                remaining_ranges: tuple[tuple[float, DistributionSearchRange], ...] = (
+                    tuple(
+                        pending_item
+                        for pending_item in outcome.pending_ranges
+                        if best_metric_delta is None
+                        or pending_item[0] > best_metric_delta
+                    )
+                )
+                if not remaining_ranges:
+                    continue
 
-        if best_span == 0:
-            break
+                idle_worker_count: int = pool.max_workers - len(pending_futures)
+                chunk: tuple[tuple[float, DistributionSearchRange], ...]
+                for chunk in _split_pending_ranges(remaining_ranges, idle_worker_count):
+                    submit_task(chunk)
 
-        target_range: DistributionSearchRange = ranges.pop(best_idx)
-        child_a: DistributionSearchRange
-        child_b: DistributionSearchRange
-        child_a, child_b = _split_distribution_search_range(target_range)
-        if _is_distribution_search_range_feasible(child_a):
-            ranges.append(child_a)
-        if _is_distribution_search_range_feasible(child_b):
-            ranges.append(child_b)
+            # 병렬 탐색 진행률 반영 (재분배로 작업 수가 늘어나도 감소하지 않도록 유지)
+            if progress_callback is not None:
+                progress_value: int = 5 + int(
+                    (
+                        completed_task_count
+                        / (completed_task_count + len(pending_futures))
+                    )
+                    * 90
+                )
+                last_progress_value = max(last_progress_value, progress_value)
+                progress_callback("최적화 계산 중...", last_progress_value)
+
+            # 조기 종료 시 남은 작업은 finally에서 세대 취소로 정리
+            if (
+                pending_futures
+                and tracker is not None
+                and tracker.report(best_result, compute_proven_upper_bound())
+            ):
+                break
 
-    return ranges
+        else:
+            is_completed = True
+            if tracker is not None:
+                tracker.report(best_result, best_metric_delta, is_complete=True)
+
+    except BrokenProcessPool:
+        # 워커 비정상 종료 시 다음 계산에서 새 풀 생성
+        pool.discard()
+        raise
+
+    finally:
+        if not is_completed:
+            # 취소 또는 예외 발생 시 워커가 스스로 중단하도록 세대 취소 표시
+            pool.cancel_generation(generation)
+            for future in pending_futures:
+                future.cancel()
+
+        release_shared_context(context_handle)
+
+    stats.task_count = task_count
+    return ParallelSearchOutcome(
+        best_result=best_result,
+        node_count=node_count,
+        task_count=task_count,
+        stats=stats,
+    )
 
 
-def optimize_current_selection(
-    server_spec: "ServerSpec",
-    preset: "MacroPreset",
-    skills_info: dict[str, "SkillUsageSetting"],
-    delay_ms: int,
+def _prepare_optimization_search(
     context: EvaluationContext,
     base_stats: BaseStats,
     calculator_input: CalculatorPresetInput,
     target_formula_id: str,
-    progress_callback: Callable[[str, int], None] | None = None,
-    cancel_checker: Callable[[], None] | None = None,
-) -> OptimizationResult | OptimizationFailure:
-    """현재 선택 조합 최적화"""
-
-    # 최적화 진입 직전 취소와 진행 상태 확인
-    if cancel_checker is not None:
-        cancel_checker()
-
-    if progress_callback is not None:
-        progress_callback("최적화 후보 준비 중...", 0)
+) -> tuple[tuple[object, ...], DistributionSearchRange] | OptimizationFailure:
+    """최적화 탐색 공유 인자와 스탯 분배 탐색 루트 구성 (불가 시 실패 결과)"""
 
     # 기준 베이스 분리 검증 실패 시 최적화 중단
     validation: BaseValidation = validate_base_state(
@@ -3946,26 +6906,7 @@ def optimize_current_selection(
         )
     )
 
-    # 기준 스킬속도 타임라인 캐시 시드
-    baseline_speed_cache_key: float = round(
-        context.baseline_final_stats.values[StatKey.SKILL_SPEED_PERCENT], 2
-    )
-    baseline_timeline_entry: tuple[float, TimelineEvaluationArtifacts] = (
-        baseline_speed_cache_key,
-        context.timeline_artifacts,
-    )
-
-    # 탐색 공간 분할 및 병렬 실행
-    worker_count: int = os.cpu_count() or 4
-    sub_ranges: list[DistributionSearchRange] = _generate_sub_ranges(
-        distribution_root, worker_count * 2
-    )
-
     shared_args: tuple[object, ...] = (
-        server_spec,
-        preset,
-        skills_info,
-        delay_ms,
         context,
         base_state,
         danjeon_entries,
@@ -3973,10 +6914,404 @@ def optimize_current_selection(
         talisman_entries,
         target_formula_id,
     )
+    return shared_args, distribution_root
+
+
+def _canonical_contribution(
+    contribution: Contribution,
+) -> tuple[tuple[str, float], ...]:
+    """기여 값을 스탯 이름 순서로 고정한 튜플 반환"""
+
+    return tuple(
+        sorted(
+            (stat_key.value, value) for stat_key, value in contribution.values.items()
+        )
+    )
+
+
+def _build_optimization_store_keys(
+    shared_args: tuple[object, ...],
+    distribution_root: DistributionSearchRange,
+    danjeon_root: DanjeonSearchRange,
+) -> tuple[str, str] | None:
+    """최적화 결과 캐시의 (정확 키, 완화 키) 구성 (지문을 만들 수 없으면 None)
+
+    완화 키는 스탯 분배/단전 탐색 루트의 하한을 제외한 탐색 입력 지문이고,
+    정확 키는 여기에 하한과 하한으로 정해지는 단전 후보 목록을 더한 지문이다.
+    """
+
+    context: EvaluationContext = cast(EvaluationContext, shared_args[0])
+    base_state: BaseState = cast(BaseState, shared_args[1])
+    danjeon_entries: list[tuple[DanjeonState, Contribution]] = cast(
+        list[tuple[DanjeonState, Contribution]], shared_args[2]
+    )
+    title_entries: list[tuple[str | None, Contribution]] = cast(
+        list[tuple[str | None, Contribution]], shared_args[3]
+    )
+    talisman_entries: list[tuple[tuple[str, ...], Contribution]] = cast(
+        list[tuple[tuple[str, ...], Contribution]], shared_args[4]
+    )
+    target_formula_id: str = cast(str, shared_args[5])
+
+    # 프리셋/스킬 설정 지문은 타임라인 캐시 키를 스킬속도 0 기준으로 재사용
+    try:
+        preset_fingerprint: bytes = _build_timeline_cache_key(
+            server_spec=context.server_spec,
+            preset=context.preset,
+            skills_info=context.skills_info,
+            delay_ms=context.delay_ms,
+            cooltime_reduction=0.0,
+        )
+        skill_slot_variables: dict[str, float | int] = (
+            _build_skill_slot_formula_variables(context.server_spec, context.preset)
+        )
+
+    except KeyError:
+        return None
+
+    custom_formula_fingerprint: tuple[str, str] | None = None
+    if context.compiled_custom_formula is not None:
+        custom_formula_fingerprint = (
+            "".join(
+                ast.dump(statement)
+                for statement in context.compiled_custom_formula.statements
+            ),
+            (
+                ""
+                if context.compiled_custom_formula.result_expression is None
+                else ast.dump(context.compiled_custom_formula.result_expression)
+            ),
+        )
+
+    relaxed_fingerprint: tuple = (
+        OPTIMIZATION_SEMANTICS_VERSION,
+        preset_fingerprint.hex(),
+        context.preset.info.calculator.level,
+        tuple(sorted(skill_slot_variables.items())),
+        custom_formula_fingerprint,
+        tuple(sorted(context.baseline_base_stats.values.items())),
+        float(context.baseline_power).hex(),
+        tuple(sorted(base_state.base_stats.values.items())),
+        _canonical_contribution(base_state.contribution),
+        target_formula_id,
+        tuple(
+            (title_name, _canonical_contribution(contribution))
+            for title_name, contribution in title_entries
+        ),
+        tuple(
+            (talisman_names, _canonical_contribution(contribution))
+            for talisman_names, contribution in talisman_entries
+        ),
+        (
+            distribution_root.strength_max,
+            distribution_root.dexterity_max,
+            distribution_root.vitality_max,
+            distribution_root.target_points,
+            distribution_root.is_locked,
+            distribution_root.use_reset,
+        ),
+        (
+            danjeon_root.upper_max,
+            danjeon_root.middle_max,
+            danjeon_root.target_points,
+            danjeon_root.is_locked,
+            danjeon_root.use_reset,
+        ),
+    )
+    exact_fingerprint: tuple = (
+        relaxed_fingerprint,
+        _get_distribution_minimums(distribution_root),
+        _get_danjeon_minimums(danjeon_root),
+        tuple(
+            (
+                (danjeon_state.upper, danjeon_state.middle, danjeon_state.lower),
+                _canonical_contribution(contribution),
+            )
+            for danjeon_state, contribution in danjeon_entries
+        ),
+    )
+
+    return (
+        hashlib.sha256(repr(exact_fingerprint).encode("utf-8")).hexdigest(),
+        hashlib.sha256(repr(relaxed_fingerprint).encode("utf-8")).hexdigest(),
+    )
+
+
+def _get_distribution_minimums(
+    distribution_range: DistributionSearchRange,
+) -> tuple[int, int, int, int]:
+    """스탯 분배 범위의 (힘, 민첩, 생명력, 행운) 하한"""
+
+    return (
+        distribution_range.strength_min,
+        distribution_range.dexterity_min,
+        distribution_range.vitality_min,
+        distribution_range.luck_min,
+    )
+
+
+def _get_danjeon_minimums(danjeon_range: DanjeonSearchRange) -> tuple[int, int, int]:
+    """단전 범위의 (상, 중, 하) 하한"""
+
+    return (danjeon_range.upper_min, danjeon_range.middle_min, danjeon_range.lower_min)
+
+
+def _encode_optimization_record(
+    result: OptimizationResult,
+    distribution_root: DistributionSearchRange,
+    danjeon_root: DanjeonSearchRange,
+) -> OptimizationRecord:
+    """최적화 결과와 탐색 하한을 캐시 레코드로 직렬화"""
+
+    return {
+        "distribution_min": list(_get_distribution_minimums(distribution_root)),
+        "danjeon_min": list(_get_danjeon_minimums(danjeon_root)),
+        "distribution": result.candidate.distribution.to_dict(),
+        "danjeon": result.candidate.danjeon.to_dict(),
+        "title": result.candidate.equipped_title_name,
+        "talismans": list(result.candidate.equipped_talisman_names),
+        "delta": result.delta,
+        "base_stats": result.base_stats.to_dict(),
+        "is_exact": result.is_exact,
+    }
+
+
+def _decode_optimization_record(
+    record: OptimizationRecord,
+) -> tuple[OptimizationResult, tuple[int, ...], tuple[int, ...]] | None:
+    """캐시 레코드를 (최적화 결과, 분배 하한, 단전 하한)으로 복원 (손상 시 None)"""
+
+    try:
+        title_name: object = record["title"]
+        result: OptimizationResult = OptimizationResult(
+            candidate=OptimizationCandidate(
+                distribution=DistributionState.from_dict(
+                    cast(dict[str, int | bool], record["distribution"])
+                ),
+                danjeon=DanjeonState.from_dict(
+                    cast(dict[str, int | bool], record["danjeon"])
+                ),
+                equipped_title_name=None if title_name is None else str(title_name),
+                equipped_talisman_names=tuple(
+                    str(name) for name in cast(list[object], record["talismans"])
+                ),
+            ),
+            delta=float(cast(float, record["delta"])),
+            base_stats=BaseStats.from_dict(
+                cast(dict[str, float], record["base_stats"])
+            ),
+            is_exact=bool(record["is_exact"]),
+        )
+        distribution_minimums: tuple[int, ...] = tuple(
+            int(value) for value in cast(list[int], record["distribution_min"])
+        )
+        danjeon_minimums: tuple[int, ...] = tuple(
+            int(value) for value in cast(list[int], record["danjeon_min"])
+        )
+
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+    return result, distribution_minimums, danjeon_minimums
+
+
+def _is_candidate_within_roots(
+    candidate: OptimizationCandidate,
+    distribution_root: DistributionSearchRange,
+    danjeon_root: DanjeonSearchRange,
+) -> bool:
+    """후보 분배/단전이 탐색 루트 하한과 총 포인트를 만족하는지 여부"""
+
+    distribution: DistributionState = candidate.distribution
+    danjeon: DanjeonState = candidate.danjeon
+    distribution_values: tuple[int, int, int, int] = (
+        distribution.strength,
+        distribution.dexterity,
+        distribution.vitality,
+        distribution.luck,
+    )
+    danjeon_values: tuple[int, int, int] = (
+        danjeon.upper,
+        danjeon.middle,
+        danjeon.lower,
+    )
+    return (
+        sum(distribution_values) == distribution_root.target_points
+        and sum(danjeon_values) == danjeon_root.target_points
+        and all(
+            value >= minimum
+            for value, minimum in zip(
+                distribution_values, _get_distribution_minimums(distribution_root)
+            )
+        )
+        and all(
+            value >= minimum
+            for value, minimum in zip(
+                danjeon_values, _get_danjeon_minimums(danjeon_root)
+            )
+        )
+    )
+
+
+def _find_stored_optimization(
+    store_keys: tuple[str, str],
+    distribution_root: DistributionSearchRange,
+    danjeon_root: DanjeonSearchRange,
+) -> tuple[OptimizationResult | None, bool]:
+    """이전 실행 결과 중 재사용 가능한 해와 탐색 생략 가능 여부 반환
+
+    정확 키가 같으면 그대로 재사용한다. 하한만 달라진 이전 결과는 해가 새 하한을
+    만족할 때만 사용하며, 새 탐색 공간이 이전 공간에 포함되고 정확 탐색 결과였다면
+    이전 최적해가 새 공간의 최적해이므로 탐색을 생략하고, 아니면 초기 해로만 쓴다.
+    """
+
+    exact_key: str
+    relaxed_key: str
+    exact_key, relaxed_key = store_keys
+
+    exact_record: OptimizationRecord | None = optimization_store.get(exact_key)
+    if exact_record is not None:
+        decoded_exact: (
+            tuple[OptimizationResult, tuple[int, ...], tuple[int, ...]] | None
+        ) = _decode_optimization_record(exact_record)
+        if decoded_exact is not None:
+            return decoded_exact[0], True
+
+    new_distribution_minimums: tuple[int, ...] = _get_distribution_minimums(
+        distribution_root
+    )
+    new_danjeon_minimums: tuple[int, ...] = _get_danjeon_minimums(danjeon_root)
+    seed_result: OptimizationResult | None = None
+    record: OptimizationRecord
+    for record in optimization_store.find_relaxed(relaxed_key):
+        decoded: tuple[OptimizationResult, tuple[int, ...], tuple[int, ...]] | None = (
+            _decode_optimization_record(record)
+        )
+        if decoded is None:
+            continue
+
+        stored_result: OptimizationResult
+        stored_distribution_minimums: tuple[int, ...]
+        stored_danjeon_minimums: tuple[int, ...]
+        stored_result, stored_distribution_minimums, stored_danjeon_minimums = decoded
+        if not _is_candidate_within_roots(
+            stored_result.candidate, distribution_root, danjeon_root
+        ):
+            continue
+
+        # 하한이 모두 같거나 높아졌으면 새 탐색 공간은 이전 공간의 부분집합
+        is_subspace: bool = all(
+            new_minimum >= stored_minimum
+            for new_minimum, stored_minimum in zip(
+                new_distribution_minimums + new_danjeon_minimums,
+                stored_distribution_minimums + stored_danjeon_minimums,
+            )
+        )
+        if is_subspace and stored_result.is_exact:
+            return stored_result, True
+
+        if seed_result is None or stored_result.delta > seed_result.delta:
+            seed_result = stored_result
+
+    return seed_result, False
+
+
+def optimize_current_selection(
+    server_spec: "ServerSpec",
+    preset: "MacroPreset",
+    skills_info: dict[str, "SkillUsageSetting"],
+    delay_ms: int,
+    context: EvaluationContext,
+    base_stats: BaseStats,
+    calculator_input: CalculatorPresetInput,
+    target_formula_id: str,
+    progress_callback: Callable[[str, int], None] | None = None,
+    cancel_checker: Callable[[], None] | None = None,
+    incumbent_callback: Callable[[OptimizationIncumbent], None] | None = None,
+    time_budget_seconds: float | None = None,
+    gap_tolerance: float | None = None,
+    stop_checker: Callable[[], bool] | None = None,
+) -> OptimizationResult | OptimizationFailure:
+    """현재 선택 조합 최적화
+
+    anytime 인자가 주어지면 최고 해가 개선될 때마다 증명된 상계와 함께
+    incumbent_callback으로 전달하고, 시간 예산(time_budget_seconds) 초과,
+    상계 차이 허용치(gap_tolerance) 도달, stop_checker 수락 요청 중 하나가 먼저 오면
+    남은 탐색을 중단하고 현재 최고 해를 반환한다.
+    반환 결과의 stats에는 모든 작업의 탐색 계측 값과 단계별 소요 시간을 합산한다.
+    """
+
+    # 최적화 진입 직전 취소와 진행 상태 확인
+    if cancel_checker is not None:
+        cancel_checker()
+
+    if progress_callback is not None:
+        progress_callback("최적화 후보 준비 중...", 0)
+
+    started_at: float = time.perf_counter()
+    stats: OptimizationStats = OptimizationStats()
+    prepared_search: (
+        tuple[tuple[object, ...], DistributionSearchRange] | OptimizationFailure
+    ) = _prepare_optimization_search(
+        context=context,
+        base_stats=base_stats,
+        calculator_input=calculator_input,
+        target_formula_id=target_formula_id,
+    )
+    if isinstance(prepared_search, OptimizationFailure):
+        return prepared_search
+
+    shared_args: tuple[object, ...]
+    distribution_root: DistributionSearchRange
+    shared_args, distribution_root = prepared_search
+    stats.add_phase_seconds("prepare", time.perf_counter() - started_at)
+    tracker: _AnytimeSearchTracker = _AnytimeSearchTracker(
+        incumbent_callback=incumbent_callback,
+        time_budget_seconds=time_budget_seconds,
+        gap_tolerance=gap_tolerance,
+        stop_checker=stop_checker,
+    )
+
+    # 이전 실행 결과 조회 (최적성이 보장되면 탐색 생략, 아니면 초기 해로 사용)
+    danjeon_root: DanjeonSearchRange = _build_danjeon_search_root(calculator_input)
+    store_keys: tuple[str, str] | None = _build_optimization_store_keys(
+        shared_args,
+        distribution_root,
+        danjeon_root,
+    )
+    stored_result: OptimizationResult | None = None
+    is_search_skipped: bool = False
+    if store_keys is not None:
+        stored_result, is_search_skipped = _find_stored_optimization(
+            store_keys,
+            distribution_root,
+            danjeon_root,
+        )
+
+    if stored_result is not None:
+        stats.result_store_hit_count += 1
+
+    if stored_result is not None and is_search_skipped:
+        tracker.report(stored_result, stored_result.delta, is_complete=True)
+        _store_optimization_result(
+            store_keys, stored_result, distribution_root, danjeon_root
+        )
+        stats.add_phase_seconds("total", time.perf_counter() - started_at)
+        return replace(stored_result, stats=stats)
+
+    # 탐색 공간 분할 및 병렬 실행
+    worker_count: int = optimization_pool.max_workers
+    sub_ranges: list[DistributionSearchRange] = _generate_sub_ranges(
+        distribution_root, worker_count * 2
+    )
 
     # 서브 범위가 적으면 직렬 실행, 충분하면 병렬 실행
-    best_result: OptimizationResult | None = None
+    best_result: OptimizationResult | None = stored_result
     best_metric_delta: float | None = None
+    if stored_result is not None:
+        best_metric_delta = stored_result.delta
+        tracker.report(stored_result, None)
+
     total_sub_ranges: int = max(1, len(sub_ranges))
     completed_sub_ranges: int = 0
 
@@ -3984,19 +7319,64 @@ def optimize_current_selection(
     if progress_callback is not None:
         progress_callback("최적화 계산 중...", 5)
 
-    if len(sub_ranges) <= 2:
+    if len(sub_ranges) <= 2 and tracker.is_active:
+        # anytime 직렬 실행: 모든 서브 범위를 한 큐에서 시간 단위로 나눠 탐색하며
+        # 단위마다 남은 큐 상계로 증명된 상계를 구해 최고 해와 함께 전달
+        seed_ranges: tuple[tuple[float | None, DistributionSearchRange], ...] = tuple(
+            (None, sub_range) for sub_range in sub_ranges
+        )
+        while seed_ranges:
+            if cancel_checker is not None:
+                cancel_checker()
+
+            slice_outcome: SubtreeSearchOutcome = _search_subtree(
+                *shared_args,
+                seed_ranges=seed_ranges,
+                cancel_checker=cancel_checker,
+                incumbent_reader=lambda: best_metric_delta,
+                time_slice_seconds=_SUBTREE_TIME_SLICE_SECONDS,
+                dive_for_incumbent=best_metric_delta is None,
+            )
+            stats.merge(slice_outcome.stats)
+            stats.task_count += 1
+            slice_result: OptimizationResult | None = slice_outcome.best_result
+            if slice_result is not None and (
+                best_metric_delta is None or slice_result.delta > best_metric_delta
+            ):
+                best_metric_delta = slice_result.delta
+                best_result = slice_result
+
+            seed_ranges = tuple(
+                pending_item
+                for pending_item in slice_outcome.pending_ranges
+                if best_metric_delta is None or pending_item[0] > best_metric_delta
+            )
+            if not seed_ranges:
+                tracker.report(best_result, best_metric_delta, is_complete=True)
+                break
+
+            if tracker.report(
+                best_result, max(pending_item[0] for pending_item in seed_ranges)
+            ):
+                break
+
+    elif len(sub_ranges) <= 2:
         # 탐색 공간이 작으면 직렬 실행
         for sub_range in sub_ranges:
             if cancel_checker is not None:
                 cancel_checker()
 
-            result: OptimizationResult | None = _search_subtree(
+            outcome: SubtreeSearchOutcome = _search_subtree(
                 *shared_args,
-                sub_range=sub_range,
-                baseline_timeline_entry=baseline_timeline_entry,
+                seed_ranges=((None, sub_range),),
+                cancel_checker=cancel_checker,
+                incumbent_reader=lambda: best_metric_delta,
             )
+            stats.merge(outcome.stats)
+            stats.task_count += 1
             completed_sub_ranges += 1
 
+            result: OptimizationResult | None = outcome.best_result
             if result is not None:
                 # 선택 공식 ID 기준 최적 후보 갱신
                 delta: float = result.delta
@@ -4011,62 +7391,17 @@ def optimize_current_selection(
                 )
                 progress_callback("최적화 계산 중...", progress_value)
     else:
-        # 병렬 탐색 중 취소 응답성 확보
-        pool: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=worker_count)
-        pending_futures: set[Future[OptimizationResult | None]] = set()
-        should_wait_for_pool: bool = True
-
-        try:
-            pending_futures = {
-                pool.submit(
-                    _search_subtree,
-                    *shared_args,
-                    sub_range=sub_range,
-                    baseline_timeline_entry=baseline_timeline_entry,
-                )
-                for sub_range in sub_ranges
-            }
-            while pending_futures:
-                if cancel_checker is not None:
-                    cancel_checker()
-
-                done_futures: set[Future[OptimizationResult | None]]
-                done_futures, pending_futures = wait(
-                    pending_futures,
-                    timeout=0.1,
-                    return_when=FIRST_COMPLETED,
-                )
-                if not done_futures:
-                    continue
-
-                future: Future[OptimizationResult | None]
-                for future in done_futures:
-                    result: OptimizationResult | None = future.result()
-                    completed_sub_ranges += 1
-                    if result is not None:
-                        delta: float = result.delta
-                        if best_metric_delta is None or delta > best_metric_delta:
-                            best_metric_delta = delta
-                            best_result = result
-
-                    # 병렬 탐색 진행률 반영
-                    if progress_callback is not None:
-                        progress_value: int = 5 + int(
-                            (completed_sub_ranges / total_sub_ranges) * 90
-                        )
-                        progress_callback("최적화 계산 중...", progress_value)
-        except Exception:
-            should_wait_for_pool = False
-            raise
-        finally:
-            if not should_wait_for_pool:
-                # 취소 또는 예외 발생 시 실행 중인 워커 계산 즉시 종료
-                _terminate_process_pool_workers(pool)
-
-            pool.shutdown(
-                wait=should_wait_for_pool,
-                cancel_futures=not should_wait_for_pool,
-            )
+        parallel_outcome: ParallelSearchOutcome = _run_parallel_subtree_search(
+            pool=optimization_pool,
+            shared_args=shared_args,
+            sub_ranges=sub_ranges,
+            progress_callback=progress_callback,
+            cancel_checker=cancel_checker,
+            tracker=tracker if tracker.is_active else None,
+            initial_result=best_result,
+        )
+        stats.merge(parallel_outcome.stats)
+        best_result = parallel_outcome.best_result
 
     if best_result is None:
         return OptimizationFailure(
@@ -4074,4 +7409,32 @@ def optimize_current_selection(
             message="최적화 불가: 계산 가능한 조합이 없습니다.",
         )
 
-    return best_result
+    # 조기 종료하지 않고 탐색을 마친 결과만 다음 실행용으로 저장
+    if not tracker.is_active or (
+        tracker.last_incumbent is not None and tracker.last_incumbent.is_complete
+    ):
+        _store_optimization_result(
+            store_keys, best_result, distribution_root, danjeon_root
+        )
+
+    stats.add_phase_seconds("total", time.perf_counter() - started_at)
+    return replace(best_result, stats=stats)
+
+
+def _store_optimization_result(
+    store_keys: tuple[str, str] | None,
+    result: OptimizationResult,
+    distribution_root: DistributionSearchRange,
+    danjeon_root: DanjeonSearchRange,
+) -> None:
+    """완료된 최적화 결과를 탐색 입력 지문과 함께 영속 캐시에 저장"""
+
+    if store_keys is None:
+        return
+
+    optimization_store.put(
+        store_keys[0],
+        store_keys[1],
+        _encode_optimization_record(result, distribution_root, danjeon_root),
+    )
+    optimization_store.flush()
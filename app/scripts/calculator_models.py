@@ -3,8 +3,11 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
 from uuid import uuid4
 
+import numpy as np
+
 from app.scripts.registry.resource_registry import convert_resource_path
 
 
@@ -516,6 +519,14 @@ class BaseStats:
             stat_key: self.values[stat_key.value] for stat_key in OVERALL_STAT_ORDER
         }
 
+    def to_vector(self) -> np.ndarray:
+        """OVERALL_STAT_ORDER 순서 베이스 스탯 벡터 반환 (누락 스탯은 0)"""
+
+        return np.array(
+            [self.values.get(stat_key.value, 0.0) for stat_key in OVERALL_STAT_ORDER],
+            dtype=np.float64,
+        )
+
     def with_changes(
         self,
         changes: dict[StatKey, float] | None,
@@ -541,25 +552,6 @@ class BaseStats:
     ) -> "FinalStats":
         """베이스 스탯을 최종 스탯으로 변환"""
 
-        # enum 키 상수를 로컬 변수로 캐시하여 반복 descriptor 접근 제거
-        _STR: StatKey = StatKey.STR
-        _STR_PERCENT: StatKey = StatKey.STR_PERCENT
-        _DEXTERITY: StatKey = StatKey.DEXTERITY
-        _DEXTERITY_PERCENT: StatKey = StatKey.DEXTERITY_PERCENT
-        _VITALITY: StatKey = StatKey.VITALITY
-        _VITALITY_PERCENT: StatKey = StatKey.VITALITY_PERCENT
-        _LUCK: StatKey = StatKey.LUCK
-        _LUCK_PERCENT: StatKey = StatKey.LUCK_PERCENT
-        _ATTACK: StatKey = StatKey.ATTACK
-        _ATTACK_PERCENT: StatKey = StatKey.ATTACK_PERCENT
-        _HP: StatKey = StatKey.HP
-        _HP_PERCENT: StatKey = StatKey.HP_PERCENT
-        _CRIT_RATE_PERCENT: StatKey = StatKey.CRIT_RATE_PERCENT
-        _CRIT_DAMAGE_PERCENT: StatKey = StatKey.CRIT_DAMAGE_PERCENT
-        _DROP_RATE_PERCENT: StatKey = StatKey.DROP_RATE_PERCENT
-        _EXP_PERCENT: StatKey = StatKey.EXP_PERCENT
-        _DODGE_PERCENT: StatKey = StatKey.DODGE_PERCENT
-        _POTION_HEAL_PERCENT: StatKey = StatKey.POTION_HEAL_PERCENT
         # stat_changes=None 최적화: with_changes + to_stat_map 우회
         if stat_changes is None:
             raw: dict[str, float] = self.values
@@ -570,61 +562,7 @@ class BaseStats:
         else:
             changed_stats = self.with_changes(stat_changes).to_stat_map()
 
-        # 스탯% 적용
-        final_strength: float = changed_stats[_STR] * (
-            1.0 + (changed_stats[_STR_PERCENT] * 0.01)
-        )
-        final_dexterity: float = changed_stats[_DEXTERITY] * (
-            1.0 + (changed_stats[_DEXTERITY_PERCENT] * 0.01)
-        )
-        final_vitality: float = changed_stats[_VITALITY] * (
-            1.0 + (changed_stats[_VITALITY_PERCENT] * 0.01)
-        )
-        final_luck: float = changed_stats[_LUCK] * (
-            1.0 + (changed_stats[_LUCK_PERCENT] * 0.01)
-        )
-
-        resolved_values: dict[StatKey, float] = changed_stats.copy()
-
-        resolved_values[_STR] = final_strength
-        resolved_values[_DEXTERITY] = final_dexterity
-        resolved_values[_VITALITY] = final_vitality
-        resolved_values[_LUCK] = final_luck
-
-        attack_percent: float = changed_stats[_ATTACK_PERCENT] + (final_dexterity * 0.3)
-        resolved_values[_ATTACK_PERCENT] = attack_percent
-
-        resolved_values[_ATTACK] = (changed_stats[_ATTACK] + final_strength) * (
-            1.0 + (attack_percent * 0.01)
-        )
-
-        resolved_values[_HP] = (changed_stats[_HP] + (final_vitality * 5.0)) * (
-            1.0 + (changed_stats[_HP_PERCENT] * 0.01)
-        )
-
-        resolved_values[_CRIT_RATE_PERCENT] = changed_stats[_CRIT_RATE_PERCENT] + (
-            final_dexterity * 0.05
-        )
-
-        resolved_values[_CRIT_DAMAGE_PERCENT] = changed_stats[_CRIT_DAMAGE_PERCENT] + (
-            final_strength * 0.1
-        )
-
-        resolved_values[_DROP_RATE_PERCENT] = changed_stats[_DROP_RATE_PERCENT] + (
-            final_luck * 0.2
-        )
-
-        resolved_values[_EXP_PERCENT] = changed_stats[_EXP_PERCENT] + (final_luck * 0.2)
-
-        resolved_values[_DODGE_PERCENT] = changed_stats[_DODGE_PERCENT] + (
-            final_vitality * 0.03
-        )
-
-        resolved_values[_POTION_HEAL_PERCENT] = changed_stats[_POTION_HEAL_PERCENT] + (
-            final_vitality * 0.5
-        )
-
-        return FinalStats(values=resolved_values)
+        return FinalStats(values=derive_final_stat_values(changed_stats))
 
 
 @dataclass(frozen=True, slots=True)
@@ -642,6 +580,14 @@ class FinalStats:
 
         object.__setattr__(self, "values", rounded_values)
 
+    def to_vector(self) -> np.ndarray:
+        """OVERALL_STAT_ORDER 순서 최종 스탯 벡터 반환"""
+
+        return np.array(
+            [self.values[stat_key] for stat_key in OVERALL_STAT_ORDER],
+            dtype=np.float64,
+        )
+
 
 @dataclass(slots=True)
 class CustomPowerFormula:
@@ -860,6 +806,181 @@ OVERALL_STAT_ORDER: tuple[StatKey, ...] = tuple(
     if stat_key is not None
 )
 
+# 스탯 벡터(배열) 표현의 열 위치 (OVERALL_STAT_ORDER 순서 고정)
+STAT_INDEX: dict[StatKey, int] = {
+    stat_key: stat_index for stat_index, stat_key in enumerate(OVERALL_STAT_ORDER)
+}
+STAT_COUNT: int = len(OVERALL_STAT_ORDER)
+
+# 최종 스탯 표시 자릿수와 파이썬 round 결과를 개별 계산할 배율 적용 값 범위
+FINAL_STAT_ROUND_DIGITS: int = 2
+_ROUND_EXACT_LIMIT: float = 1e9
+# 곱셈 반올림 오차를 정확히 구하기 위한 Dekker 분할 상수 (2^27 + 1)
+_ROUND_SPLIT_FACTOR: float = 134217729.0
+# 분할 상위 26비트와 10^n 곱이 정확히 표현되는 최대 자릿수 (5^11 < 2^26)
+_ROUND_MAX_VECTOR_DIGITS: int = 11
+
+
+def round_float_values(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    배열을 원소별 파이썬 round(value, digits)와 동일한 결과로 반올림
+    배율 곱셈이 정확한 자릿수(0~11)는 벡터 연산으로 계산하고,
+    그 외 자릿수나 배율 적용 값이 매우 큰 원소는 파이썬 round로 개별 계산한다.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    # 음수/큰 자릿수는 배율이 정확하지 않아 전체를 개별 round로 계산
+    if not 0 <= digits <= _ROUND_MAX_VECTOR_DIGITS:
+        return np.array(
+            [round(float(value), digits) for value in values.reshape(-1)],
+            dtype=np.float64,
+        ).reshape(values.shape)
+
+    scale: float = 10.0**digits
+
+    # 배율 곱셈이 정확히 .5에 떨어진 값은 곱셈 반올림 오차 부호로 실제 값의 방향 결정
+    # (Dekker 분할로 values * scale == scaled + error 인 오차를 정확히 계산)
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled: np.ndarray = values * scale
+        rounded: np.ndarray = np.rint(scaled)
+        tie_mask: np.ndarray = (scaled - np.floor(scaled)) == 0.5
+        if np.any(tie_mask):
+            split: np.ndarray = values * _ROUND_SPLIT_FACTOR
+            high: np.ndarray = split - (split - values)
+            error: np.ndarray = (high * scale - scaled) + ((values - high) * scale)
+            rounded = np.where(tie_mask & (error > 0.0), np.ceil(scaled), rounded)
+            rounded = np.where(tie_mask & (error < 0.0), np.floor(scaled), rounded)
+
+        large_mask: np.ndarray = np.abs(scaled) >= _ROUND_EXACT_LIMIT
+
+    rounded = rounded / scale
+
+    # 배율 적용 값이 매우 큰 경우만 개별 round로 계산
+    if np.any(large_mask):
+        flat_values: np.ndarray = values.reshape(-1)
+        flat_rounded: np.ndarray = rounded.reshape(-1)
+        flat_index: int
+        for flat_index in np.flatnonzero(large_mask).tolist():
+            flat_rounded[flat_index] = round(float(flat_values[flat_index]), digits)
+
+    return rounded
+
+
+def round_stat_values(values: np.ndarray) -> np.ndarray:
+    """스탯 배열을 파이썬 round(value, 2)와 동일한 결과로 반올림"""
+
+    return round_float_values(values, FINAL_STAT_ROUND_DIGITS)
+
+
+# derive_final_stat_values 용 enum 키 모듈 수준 캐시 (매 호출마다 enum descriptor 접근 제거)
+_DK_STR: StatKey = StatKey.STR
+_DK_STR_PERCENT: StatKey = StatKey.STR_PERCENT
+_DK_DEXTERITY: StatKey = StatKey.DEXTERITY
+_DK_DEXTERITY_PERCENT: StatKey = StatKey.DEXTERITY_PERCENT
+_DK_VITALITY: StatKey = StatKey.VITALITY
+_DK_VITALITY_PERCENT: StatKey = StatKey.VITALITY_PERCENT
+_DK_LUCK: StatKey = StatKey.LUCK
+_DK_LUCK_PERCENT: StatKey = StatKey.LUCK_PERCENT
+_DK_ATTACK: StatKey = StatKey.ATTACK
+_DK_ATTACK_PERCENT: StatKey = StatKey.ATTACK_PERCENT
+_DK_HP: StatKey = StatKey.HP
+_DK_HP_PERCENT: StatKey = StatKey.HP_PERCENT
+_DK_CRIT_RATE_PERCENT: StatKey = StatKey.CRIT_RATE_PERCENT
+_DK_CRIT_DAMAGE_PERCENT: StatKey = StatKey.CRIT_DAMAGE_PERCENT
+_DK_DROP_RATE_PERCENT: StatKey = StatKey.DROP_RATE_PERCENT
+_DK_EXP_PERCENT: StatKey = StatKey.EXP_PERCENT
+_DK_DODGE_PERCENT: StatKey = StatKey.DODGE_PERCENT
+_DK_POTION_HEAL_PERCENT: StatKey = StatKey.POTION_HEAL_PERCENT
+
+
+def derive_final_stat_values(changed_stats: dict[StatKey, Any]) -> dict[StatKey, Any]:
+    """
+    베이스 스탯 → 최종 스탯 파생 규칙 적용 (반올림 전 값)
+    사칙 연산만 사용하므로 단일 값, 스탯 열 배열(일괄 resolve), 기울기 계산용 이원수가
+    모두 같은 규칙과 연산 순서로 계산된다.
+    """
+
+    # 스탯% 적용
+    final_strength: Any = changed_stats[_DK_STR] * (
+        1.0 + (changed_stats[_DK_STR_PERCENT] * 0.01)
+    )
+    final_dexterity: Any = changed_stats[_DK_DEXTERITY] * (
+        1.0 + (changed_stats[_DK_DEXTERITY_PERCENT] * 0.01)
+    )
+    final_vitality: Any = changed_stats[_DK_VITALITY] * (
+        1.0 + (changed_stats[_DK_VITALITY_PERCENT] * 0.01)
+    )
+    final_luck: Any = changed_stats[_DK_LUCK] * (
+        1.0 + (changed_stats[_DK_LUCK_PERCENT] * 0.01)
+    )
+
+    resolved_values: dict[StatKey, Any] = changed_stats.copy()
+
+    resolved_values[_DK_STR] = final_strength
+    resolved_values[_DK_DEXTERITY] = final_dexterity
+    resolved_values[_DK_VITALITY] = final_vitality
+    resolved_values[_DK_LUCK] = final_luck
+
+    attack_percent: Any = changed_stats[_DK_ATTACK_PERCENT] + (final_dexterity * 0.3)
+    resolved_values[_DK_ATTACK_PERCENT] = attack_percent
+
+    resolved_values[_DK_ATTACK] = (changed_stats[_DK_ATTACK] + final_strength) * (
+        1.0 + (attack_percent * 0.01)
+    )
+
+    resolved_values[_DK_HP] = (changed_stats[_DK_HP] + (final_vitality * 5.0)) * (
+        1.0 + (changed_stats[_DK_HP_PERCENT] * 0.01)
+    )
+
+    resolved_values[_DK_CRIT_RATE_PERCENT] = changed_stats[_DK_CRIT_RATE_PERCENT] + (
+        final_dexterity * 0.05
+    )
+
+    resolved_values[_DK_CRIT_DAMAGE_PERCENT] = changed_stats[
+        _DK_CRIT_DAMAGE_PERCENT
+    ] + (final_strength * 0.1)
+
+    resolved_values[_DK_DROP_RATE_PERCENT] = changed_stats[_DK_DROP_RATE_PERCENT] + (
+        final_luck * 0.2
+    )
+
+    resolved_values[_DK_EXP_PERCENT] = changed_stats[_DK_EXP_PERCENT] + (
+        final_luck * 0.2
+    )
+
+    resolved_values[_DK_DODGE_PERCENT] = changed_stats[_DK_DODGE_PERCENT] + (
+        final_vitality * 0.03
+    )
+
+    resolved_values[_DK_POTION_HEAL_PERCENT] = changed_stats[
+        _DK_POTION_HEAL_PERCENT
+    ] + (final_vitality * 0.5)
+
+    return resolved_values
+
+
+def resolve_stat_rows(base_rows: np.ndarray) -> np.ndarray:
+    """(N x 스탯) 베이스 스탯 배열을 최종 스탯 배열로 일괄 변환
+
+    스탯 열마다 BaseStats.resolve와 같은 파생 규칙을 적용한 뒤 FinalStats와 동일하게 반올림한다.
+    """
+
+    if base_rows.ndim != 2 or base_rows.shape[1] != STAT_COUNT:
+        raise ValueError("스탯 배열은 (N, 전체 스탯 수) 형태여야 합니다.")
+
+    rows: np.ndarray = np.asarray(base_rows, dtype=np.float64)
+    resolved_columns: dict[StatKey, np.ndarray] = derive_final_stat_values(
+        {
+            stat_key: rows[:, stat_index]
+            for stat_index, stat_key in enumerate(OVERALL_STAT_ORDER)
+        }
+    )
+    resolved_rows: np.ndarray = np.column_stack(
+        [resolved_columns[stat_key] for stat_key in OVERALL_STAT_ORDER]
+    )
+    return round_stat_values(resolved_rows)
+
 
 # 계산기 스탯 표시 스펙
 STAT_SPECS: dict[StatKey, str] = {
@@ -6,6 +6,7 @@ import os
 from datetime import datetime
 from typing import Any
 
+from app.scripts.app_paths import data_path
 from app.scripts.app_state import app_state
 from app.scripts.character_engine import validate_character_store
 from app.scripts.character_models import CHARACTER_DATA_VERSION, CharacterStore
@@ -25,10 +26,6 @@ from app.scripts.registry.skill_registry import ScrollDef, SkillDef
 
 CUSTOM_SKILLS_DATA_VERSION: int = 2
 
-# todo: 라이브러리를 통해 경로를 설정하도록 변경
-local_appdata: str = os.environ.get("LOCALAPPDATA", default="")
-
-data_path: str = os.path.join(local_appdata, "ProDays", "SkillMacro")
 file_dir: str = os.path.join(data_path, "macros.json")
 custom_skills_file_dir: str = os.path.join(data_path, "custom_skills.json")
 characters_file_dir: str = os.path.join(data_path, "characters.json")
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+StoreKey = TypeVar("StoreKey")
+StoreValue = TypeVar("StoreValue")
+
+
+class LruFileStore(Generic[StoreKey, StoreValue]):
+    """메모리 LRU + 단일 디스크 파일 영속 캐시 공통 구현
+
+    메모리 LRU를 우선 사용하고, flush 시 디스크 파일과 병합해 저장한다.
+    여러 프로세스가 같은 파일을 공유할 수 있으므로 저장은 임시 파일 교체로 원자적으로 수행하며,
+    캐시 파일 손상/접근 실패는 캐시 미사용으로 취급한다.
+    하위 클래스는 파일 바이트와 (키, 값) 목록 사이의 변환만 구현한다.
+    """
+
+    def __init__(self, file_path: str, capacity: int) -> None:
+        self.file_path: str = file_path
+        self.capacity: int = capacity
+        self._entries: OrderedDict[StoreKey, StoreValue] = OrderedDict()
+        self._is_loaded: bool = False
+        self._is_dirty: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        # 프로세스 내 누적 조회 적중/실패 수 (최적화 통계용)
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+
+    def _lookup(self, key: StoreKey) -> StoreValue | None:
+        """키에 해당하는 값 반환 및 최근 사용 갱신"""
+
+        with self._lock:
+            self._ensure_loaded()
+            value: StoreValue | None = self._entries.get(key)
+            if value is None:
+                self.miss_count += 1
+                return None
+
+            self.hit_count += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: StoreKey, value: StoreValue) -> None:
+        """값 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+            self._is_dirty = True
+
+    def _snapshot(self) -> list[tuple[StoreKey, StoreValue]]:
+        """메모리 항목 목록 반환 (오래된 순)"""
+
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._entries.items())
+
+    def flush(self) -> None:
+        """변경된 메모리 항목을 디스크 파일과 병합해 저장"""
+
+        with self._lock:
+            if not self._is_dirty:
+                return
+
+            # 다른 프로세스가 그 사이 저장한 항목을 오래된 쪽으로 병합
+            merged_entries: OrderedDict[StoreKey, StoreValue] = OrderedDict(
+                self._read_file_entries()
+            )
+            key: StoreKey
+            value: StoreValue
+            for key, value in self._entries.items():
+                merged_entries.pop(key, None)
+                merged_entries[key] = value
+
+            while len(merged_entries) > self.capacity:
+                merged_entries.popitem(last=False)
+
+            # 임시 파일 작성 후 교체로 부분 기록 파일 노출 방지
+            temp_path: str = f"{self.file_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+                with open(temp_path, "wb") as f:
+                    f.write(self._encode_entries(list(merged_entries.items())))
+
+                os.replace(temp_path, self.file_path)
+
+            except OSError:
+                return
+
+            self._entries = merged_entries
+            self._is_dirty = False
+
+    def clear(self) -> None:
+        """메모리와 디스크의 캐시 항목 모두 삭제"""
+
+        with self._lock:
+            self._entries.clear()
+            self._is_loaded = True
+            self._is_dirty = False
+            try:
+                os.remove(self.file_path)
+
+            except OSError:
+                pass
+
+    def _ensure_loaded(self) -> None:
+        """최초 접근 시 디스크 항목을 메모리 LRU로 적재"""
+
+        if self._is_loaded:
+            return
+
+        self._is_loaded = True
+        self._entries = OrderedDict(self._read_file_entries())
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def _read_file_entries(self) -> list[tuple[StoreKey, StoreValue]]:
+        """디스크 캐시 파일 항목 읽기 (없음/손상 시 빈 목록)"""
+
+        try:
+            with open(self.file_path, "rb") as f:
+                data: bytes = f.read()
+
+        except OSError:
+            return []
+
+        try:
+            return self._decode_entries(data)
+
+        except ValueError:
+            return []
+
+    def _encode_entries(self, entries: list[tuple[StoreKey, StoreValue]]) -> bytes:
+        """(키, 값) 목록을 파일 바이트로 직렬화 (오래된 순)"""
+
+        raise NotImplementedError
+
+    def _decode_entries(self, data: bytes) -> list[tuple[StoreKey, StoreValue]]:
+        """파일 바이트를 (키, 값) 목록으로 역직렬화 (형식 불일치 시 ValueError)"""
+
+        raise NotImplementedError
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.sharedctypes import Synchronized, SynchronizedArray
+
+# 워커별로 보관할 최근 공유 컨텍스트 수
+_WORKER_CONTEXT_CACHE_SIZE: int = 2
+# 공유 컨텍스트 임시 파일 이름 접두사
+_SHARED_CONTEXT_FILE_PREFIX: str = "skillmacro_optimization_"
+# 공유 incumbent 배열 슬롯: [기록 세대, 최고 지표 변화량]
+_INCUMBENT_GENERATION_SLOT: int = 0
+_INCUMBENT_VALUE_SLOT: int = 1
+
+# 워커 프로세스 전역 상태 (initializer에서 설정)
+_worker_cancel_generation: Synchronized | None = None
+_worker_incumbent: SynchronizedArray | None = None
+_worker_shared_contexts: OrderedDict[str, object] = OrderedDict()
+
+
+class OptimizationCancelledError(Exception):
+    """협조적 취소 요청으로 워커 작업을 중단할 때 사용하는 예외"""
+
+
+@dataclass(frozen=True, slots=True)
+class SharedContextHandle:
+    """워커가 1회 적재할 공유 탐색 컨텍스트 식별자"""
+
+    # 직렬화 내용 해시 (워커 캐시 키)
+    key: str
+    # 직렬화 내용 파일 경로
+    file_path: str
+
+
+def _initialize_worker(
+    cancel_generation: Synchronized,
+    incumbent: SynchronizedArray,
+) -> None:
+    """워커 프로세스 시작 시 공유 취소 세대 값과 incumbent 배열 연결"""
+
+    global _worker_cancel_generation, _worker_incumbent
+    _worker_cancel_generation = cancel_generation
+    _worker_incumbent = incumbent
+
+
+def _read_incumbent(incumbent: SynchronizedArray, generation: int) -> float | None:
+    """incumbent 배열에서 지정 세대의 최고 지표 변화량 읽기 (없으면 None)"""
+
+    with incumbent.get_lock():
+        if incumbent[_INCUMBENT_GENERATION_SLOT] != generation:
+            return None
+
+        return incumbent[_INCUMBENT_VALUE_SLOT]
+
+
+def _offer_incumbent(
+    incumbent: SynchronizedArray,
+    generation: int,
+    value: float,
+) -> None:
+    """지정 세대 incumbent를 더 큰 값으로 갱신 (이전 세대 기록은 덮어씀)"""
+
+    with incumbent.get_lock():
+        stored_generation: float = incumbent[_INCUMBENT_GENERATION_SLOT]
+        if stored_generation > generation:
+            return
+
+        if (
+            stored_generation == generation
+            and value <= incumbent[_INCUMBENT_VALUE_SLOT]
+        ):
+            return
+
+        incumbent[_INCUMBENT_GENERATION_SLOT] = generation
+        incumbent[_INCUMBENT_VALUE_SLOT] = value
+
+
+def read_shared_incumbent(generation: int) -> float | None:
+    """워커 간 공유 중인 현재 세대 최고 지표 변화량 반환 (풀 밖에서는 None)"""
+
+    if _worker_incumbent is None:
+        return None
+
+    return _read_incumbent(_worker_incumbent, generation)
+
+
+def offer_shared_incumbent(generation: int, value: float) -> None:
+    """워커가 찾은 해의 지표 변화량을 공유 incumbent에 게시 (풀 밖에서는 무시)"""
+
+    if _worker_incumbent is None:
+        return
+
+    _offer_incumbent(_worker_incumbent, generation, value)
+
+
+def is_generation_cancelled(generation: int) -> bool:
+    """작업 세대가 취소되었는지 여부 반환 (풀 밖에서는 항상 False)"""
+
+    if _worker_cancel_generation is None:
+        return False
+
+    return generation < _worker_cancel_generation.value
+
+
+def check_generation_cancelled(generation: int) -> None:
+    """작업 세대가 취소되었으면 OptimizationCancelledError 발생"""
+
+    if is_generation_cancelled(generation):
+        raise OptimizationCancelledError()
+
+
+def publish_shared_context(payload: object) -> SharedContextHandle:
+    """공유 컨텍스트를 1회 직렬화해 내용 해시 이름의 임시 파일로 게시"""
+
+    data: bytes = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    key: str = hashlib.sha256(data).hexdigest()
+    file_path: str = os.path.join(
+        tempfile.gettempdir(),
+        f"{_SHARED_CONTEXT_FILE_PREFIX}{os.getpid()}_{key[:32]}.pkl",
+    )
+
+    # 동일 내용이 이미 게시되어 있으면 재기록 생략
+    if not os.path.isfile(file_path):
+        temp_path: str = f"{file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+
+        os.replace(temp_path, file_path)
+
+    return SharedContextHandle(key=key, file_path=file_path)
+
+
+def release_shared_context(handle: SharedContextHandle) -> None:
+    """게시한 공유 컨텍스트 파일 삭제 (실패는 무시)"""
+
+    try:
+        os.remove(handle.file_path)
+
+    except OSError:
+        pass
+
+
+def load_shared_context(handle: SharedContextHandle) -> object:
+    """워커에서 공유 컨텍스트를 해시 기준으로 1회만 적재해 재사용"""
+
+    payload: object | None = _worker_shared_contexts.get(handle.key)
+    if payload is not None:
+        _worker_shared_contexts.move_to_end(handle.key)
+        return payload
+
+    with open(handle.file_path, "rb") as f:
+        payload = pickle.load(f)
+
+    _worker_shared_contexts[handle.key] = payload
+    while len(_worker_shared_contexts) > _WORKER_CONTEXT_CACHE_SIZE:
+        _worker_shared_contexts.popitem(last=False)
+
+    return payload
+
+
+class OptimizationWorkerPool:
+    """앱 수명 동안 유지하는 최적화 워커 프로세스 풀
+
+    작업마다 세대 번호를 부여하고, 취소는 공유 값에 취소 세대를 기록해
+    워커가 스스로 확인 후 중단하는 협조적 방식으로 처리한다.
+    분기 한정 탐색의 incumbent(현재 최고 해 값)도 세대 번호와 함께 공유 배열에 기록해
+    모든 워커가 같은 가지치기 기준을 사용한다.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers: int = max_workers or os.cpu_count() or 4
+        self._executor: ProcessPoolExecutor | None = None
+        self._cancel_generation: Synchronized | None = None
+        self._incumbent: SynchronizedArray | None = None
+        self._next_generation: int = 1
+        self._lock: threading.Lock = threading.Lock()
+
+    def start(self, warm_up: Callable[[], None] | None = None) -> list[Future[None]]:
+        """워커 프로세스를 미리 띄우고 계산 모듈 import 예열 (예열 작업 목록 반환)"""
+
+        executor: ProcessPoolExecutor = self.acquire()
+        if warm_up is None:
+            return []
+
+        # 워커 수만큼 예열 작업을 제출해 모든 워커의 시작 비용을 선지불
+        return [executor.submit(warm_up) for _ in range(self.max_workers)]
+
+    def acquire(self) -> ProcessPoolExecutor:
+        """실행 중인 풀 반환 (없으면 생성)"""
+
+        with self._lock:
+            if self._executor is None:
+                self._cancel_generation = multiprocessing.Value("q", 0)
+                self._incumbent = multiprocessing.Array("d", [0.0, float("-inf")])
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_initialize_worker,
+                    initargs=(self._cancel_generation, self._incumbent),
+                )
+
+            return self._executor
+
+    def new_generation(self) -> int:
+        """새 계산 작업 세대 번호 발급"""
+
+        with self._lock:
+            generation: int = self._next_generation
+            self._next_generation += 1
+            return generation
+
+    def cancel_generation(self, generation: int) -> None:
+        """지정 세대 이하 작업 모두 취소 표시"""
+
+        with self._lock:
+            if self._cancel_generation is None:
+                return
+
+            with self._cancel_generation.get_lock():
+                self._cancel_generation.value = max(
+                    self._cancel_generation.value,
+                    generation + 1,
+                )
+
+    def offer_incumbent(self, generation: int, value: float) -> None:
+        """부모 프로세스에서 확정한 해의 지표 변화량을 공유 incumbent에 게시"""
+
+        with self._lock:
+            incumbent: SynchronizedArray | None = self._incumbent
+
+        if incumbent is not None:
+            _offer_incumbent(incumbent, generation, value)
+
+    def discard(self) -> None:
+        """손상된 풀 폐기 (다음 acquire에서 재생성)"""
+
+        with self._lock:
+            executor: ProcessPoolExecutor | None = self._executor
+            self._executor = None
+            self._cancel_generation = None
+            self._incumbent = None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """진행 중인 모든 작업 취소 후 풀 종료"""
+
+        self.cancel_generation(self._next_generation)
+        self.discard()
+
+
+optimization_pool: OptimizationWorkerPool = OptimizationWorkerPool()
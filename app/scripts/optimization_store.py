@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+
+from app.scripts.app_paths import data_path
+from app.scripts.lru_file_store import LruFileStore
+
+# 파일 형식 버전 (형식 변경 시 버전 증가로 기존 파일 무시)
+OPTIMIZATION_STORE_VERSION: int = 1
+# 보관할 최대 결과 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+OPTIMIZATION_STORE_CAPACITY: int = 64
+
+optimization_cache_file_dir: str = os.path.join(data_path, "optimization_cache.json")
+
+# 최적화 결과 레코드: JSON 직렬화 가능한 사전 (구성/해석은 계산 엔진이 담당)
+OptimizationRecord = dict[str, object]
+
+
+def _decode_entries(
+    data: str,
+) -> list[tuple[str, str, OptimizationRecord]]:
+    """파일 내용을 (정확 키, 완화 키, 레코드) 목록으로 역직렬화 (형식 불일치 시 ValueError)"""
+
+    try:
+        payload: object = json.loads(data)
+
+    except json.JSONDecodeError as error:
+        raise ValueError("최적화 결과 캐시 형식이 손상되었습니다.") from error
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != OPTIMIZATION_STORE_VERSION
+    ):
+        raise ValueError("지원하지 않는 최적화 결과 캐시 형식입니다.")
+
+    raw_entries: object = payload.get("entries")
+    if not isinstance(raw_entries, list):
+        raise ValueError("최적화 결과 캐시 항목이 손상되었습니다.")
+
+    entries: list[tuple[str, str, OptimizationRecord]] = []
+    raw_entry: object
+    for raw_entry in raw_entries:
+        if (
+            not isinstance(raw_entry, dict)
+            or not isinstance(raw_entry.get("key"), str)
+            or not isinstance(raw_entry.get("relaxed_key"), str)
+            or not isinstance(raw_entry.get("record"), dict)
+        ):
+            raise ValueError("최적화 결과 캐시 항목이 손상되었습니다.")
+
+        entries.append(
+            (raw_entry["key"], raw_entry["relaxed_key"], raw_entry["record"])
+        )
+
+    return entries
+
+
+class OptimizationStore(LruFileStore[str, tuple[str, OptimizationRecord]]):
+    """최적화 탐색 입력 지문 기준 결과 LRU 영속 캐시
+
+    정확 키는 탐색 입력 전체, 완화 키는 최소분배 하한을 제외한 입력 지문이다.
+    정확 키가 같으면 결과를 그대로 재사용하고, 완화 키만 같으면
+    하한이 바뀐 이전 실행의 해를 새 탐색의 초기 해 후보로 제공한다.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        capacity: int = OPTIMIZATION_STORE_CAPACITY,
+    ) -> None:
+        super().__init__(file_path, capacity)
+
+    def get(self, key: str) -> OptimizationRecord | None:
+        """정확 키에 해당하는 레코드 반환 및 최근 사용 갱신"""
+
+        entry: tuple[str, OptimizationRecord] | None = self._lookup(key)
+        if entry is None:
+            return None
+
+        return entry[1]
+
+    def find_relaxed(self, relaxed_key: str) -> list[OptimizationRecord]:
+        """완화 키가 같은 레코드 목록 반환 (최근 사용 순)"""
+
+        return [
+            record
+            for _, (entry_relaxed_key, record) in reversed(self._snapshot())
+            if entry_relaxed_key == relaxed_key
+        ]
+
+    def put(self, key: str, relaxed_key: str, record: OptimizationRecord) -> None:
+        """레코드 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+
+        self._store(key, (relaxed_key, record))
+
+    def _encode_entries(
+        self,
+        entries: list[tuple[str, tuple[str, OptimizationRecord]]],
+    ) -> bytes:
+        """버전 + 항목 목록 JSON으로 직렬화"""
+
+        payload: dict[str, object] = {
+            "version": OPTIMIZATION_STORE_VERSION,
+            "entries": [
+                {"key": key, "relaxed_key": relaxed_key, "record": record}
+                for key, (relaxed_key, record) in entries
+            ],
+        }
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def _decode_entries(
+        self,
+        data: bytes,
+    ) -> list[tuple[str, tuple[str, OptimizationRecord]]]:
+        """파일 바이트를 (정확 키, (완화 키, 레코드)) 목록으로 역직렬화"""
+
+        try:
+            text: str = data.decode("utf-8")
+
+        except UnicodeDecodeError as error:
+            raise ValueError("최적화 결과 캐시 형식이 손상되었습니다.") from error
+
+        return [
+            (key, (relaxed_key, record))
+            for key, relaxed_key, record in _decode_entries(text)
+        ]
+
+
+optimization_store: OptimizationStore = OptimizationStore(optimization_cache_file_dir)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import random
+from dataclasses import dataclass
+from enum import Enum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from app.scripts.calculator_engine import (
     DamageEvent,
     GraphAnalysis,
@@ -20,15 +23,392 @@ if TYPE_CHECKING:
     from app.scripts.registry.server_registry import ServerSpec
 
 
+# 확률 분석 반복 횟수 기본값과 허용 범위
+DEFAULT_SIMULATION_RUN_COUNT: int = 10000
+MIN_SIMULATION_RUN_COUNT: int = 10000
+MAX_SIMULATION_RUN_COUNT: int = 100000
+
+# 그래프 위젯에 전달할 반복별 타격 이벤트 표본 수
+GRAPH_SAMPLE_RUN_COUNT: int = 1000
+
+# 난수 행렬 메모리 상한 유지를 위한 1회 배치 반복 수
+_SIMULATION_CHUNK_RUN_COUNT: int = 8192
+
+# 해석적 분포 계산 시 총 피해량 범위를 나누는 목표 격자 수
+_ANALYTIC_GRID_SIZE: int = 1 << 16
+
+# 해석적 분포에서 최소/최대 카드로 사용할 양 끝 백분위수
+# (기본 반복 횟수 표본의 기대 극값 수준)
+ANALYTIC_MIN_PERCENTILE: float = 0.01
+ANALYTIC_MAX_PERCENTILE: float = 99.99
+
+# 해석적 모드 그래프 표본 생성용 고정 시드 (결과 재현성 보장)
+_ANALYTIC_GRAPH_SAMPLE_SEED: int = 0
+
+
+class SimulationMode(str, Enum):
+    """확률 분석 계산 방식"""
+
+    # 난수 반복 시뮬레이션
+    MONTE_CARLO = "monte_carlo"
+    # 타격별 분포 합성곱 기반 해석적 계산
+    ANALYTIC = "analytic"
+
+
+@dataclass(frozen=True, slots=True)
+class HitEventArrays:
+    """배치 시뮬레이션용 타격 이벤트 배열"""
+
+    # 스킬 인덱스별 스킬 ID
+    skill_ids: tuple[str, ...]
+    # 타격별 시점 (hits,)
+    times: np.ndarray
+    # 타격별 스킬 계수 (hits,)
+    multipliers: np.ndarray
+    # 타격별 skill_ids 인덱스 (hits,)
+    skill_indices: np.ndarray
+
+    @classmethod
+    def from_hit_events(cls, hit_events: tuple[HitEvent, ...]) -> "HitEventArrays":
+        """타격 이벤트 목록을 배열 구조로 1회 변환"""
+
+        # 첫 등장 순서 기준 스킬 인덱스 부여
+        skill_index_map: dict[str, int] = {}
+        skill_indices: list[int] = []
+        hit_event: HitEvent
+        for hit_event in hit_events:
+            skill_index: int = skill_index_map.setdefault(
+                hit_event.skill_id, len(skill_index_map)
+            )
+            skill_indices.append(skill_index)
+
+        return cls(
+            skill_ids=tuple(skill_index_map),
+            times=np.fromiter(
+                (hit_event.time for hit_event in hit_events),
+                dtype=np.float64,
+                count=len(hit_events),
+            ),
+            multipliers=np.fromiter(
+                (hit_event.multiplier for hit_event in hit_events),
+                dtype=np.float64,
+                count=len(hit_events),
+            ),
+            skill_indices=np.asarray(skill_indices, dtype=np.intp),
+        )
+
+    @property
+    def hit_count(self) -> int:
+        """타격 수"""
+
+        return int(self.times.shape[0])
+
+
+@dataclass(frozen=True, slots=True)
+class MonteCarloSummary:
+    """배치 몬테카를로 시뮬레이션 집계 결과"""
+
+    # 반복별 총 피해량 (runs,)
+    totals: np.ndarray
+    # 반복별 스킬 피해량 합계 (runs, skills), 열 순서는 HitEventArrays.skill_ids
+    skill_totals: np.ndarray
+    # 그래프 표본 반복의 타격별 피해량 (samples, hits)
+    sample_damages: np.ndarray
+
+    @property
+    def run_count(self) -> int:
+        """반복 횟수"""
+
+        return int(self.totals.shape[0])
+
+    def percentile(self, percentile: float) -> float:
+        """총 피해량 백분위수 반환 (선형 보간)"""
+
+        return float(np.percentile(self.totals, percentile))
+
+    def skill_percentiles(self, percentile: float) -> np.ndarray:
+        """스킬별 피해량 백분위수 반환 (선형 보간)"""
+
+        return np.percentile(self.skill_totals, percentile, axis=0)
+
+
+@dataclass(frozen=True, slots=True)
+class DamageDistribution:
+    """등간격 격자로 이산화한 총 피해량 확률 분포"""
+
+    # 격자 0번 칸의 피해량
+    start: float
+    # 격자 간격
+    step: float
+    # 격자 칸별 확률 질량 (합계 1)
+    pmf: np.ndarray
+    # 해석적 기댓값
+    mean: float
+    # 해석적 분산
+    variance: float
+
+    def percentile(self, percentile: float) -> float:
+        """총 피해량 백분위수 반환"""
+
+        # 누적 분포에서 목표 확률을 처음 넘는 칸 위치를 피해량으로 환산
+        cdf: np.ndarray = np.cumsum(self.pmf)
+        target: float = min(max(percentile * 0.01, 0.0), 1.0) * float(cdf[-1])
+        index: int = min(int(np.searchsorted(cdf, target)), cdf.shape[0] - 1)
+        return self.start + (index * self.step)
+
+
+def _build_base_hit_damages(
+    hit_arrays: HitEventArrays,
+    resolved_stats: FinalStats,
+    is_boss: bool,
+) -> np.ndarray:
+    """랜덤 폭과 치명타를 제외한 타격별 기본 피해량 배열 구성"""
+
+    # 타격 공통 배율을 스칼라로 1회 계산 후 스킬 계수 배열에 적용
+    values: dict[StatKey, float] = resolved_stats.values
+    attack_power: float = float(values[StatKey.ATTACK])
+    attack_power *= 1.0 + (float(values[StatKey.FINAL_ATTACK_PERCENT]) * 0.01)
+    if is_boss:
+        attack_power *= 1.0 + (float(values[StatKey.BOSS_ATTACK_PERCENT]) * 0.01)
+
+    attack_power *= 1.0 + (float(values[StatKey.SKILL_DAMAGE_PERCENT]) * 0.01)
+    return hit_arrays.multipliers * attack_power
+
+
+def run_monte_carlo_simulation(
+    hit_arrays: HitEventArrays,
+    resolved_stats: FinalStats,
+    is_boss: bool,
+    run_count: int,
+    rng: np.random.Generator,
+    sample_count: int = 0,
+) -> MonteCarloSummary:
+    """(반복 x 타격) 난수 행렬 기반 확률론 피해량 일괄 시뮬레이션"""
+
+    if run_count < 1:
+        raise ValueError("시뮬레이션 반복 횟수는 1 이상이어야 합니다.")
+
+    # 반복 간 공유되는 타격별 기본 피해량과 치명타 배율 구성
+    base_damages: np.ndarray = _build_base_hit_damages(
+        hit_arrays=hit_arrays,
+        resolved_stats=resolved_stats,
+        is_boss=is_boss,
+    )
+    crit_rate: float = min(
+        float(resolved_stats.values[StatKey.CRIT_RATE_PERCENT]), 100.0
+    )
+    crit_probability: float = crit_rate * 0.01
+    crit_multiplier: float = (
+        1.0 + (float(resolved_stats.values[StatKey.CRIT_DAMAGE_PERCENT]) - 100.0) * 0.01
+    )
+
+    # 스킬별 합계를 행렬곱 1회로 구하기 위한 원-핫 사상 행렬
+    hit_count: int = hit_arrays.hit_count
+    skill_count: int = len(hit_arrays.skill_ids)
+    skill_one_hot: np.ndarray = np.zeros((hit_count, skill_count), dtype=np.float64)
+    skill_one_hot[np.arange(hit_count), hit_arrays.skill_indices] = 1.0
+
+    totals: np.ndarray = np.empty(run_count, dtype=np.float64)
+    skill_totals: np.ndarray = np.empty((run_count, skill_count), dtype=np.float64)
+    sample_count = min(max(sample_count, 0), run_count)
+    sample_damages: np.ndarray = np.empty((sample_count, hit_count), dtype=np.float64)
+
+    # 메모리 상한 유지를 위해 반복을 고정 크기 배치로 나눠 난수 행렬 생성
+    chunk_start: int
+    for chunk_start in range(0, run_count, _SIMULATION_CHUNK_RUN_COUNT):
+        chunk_stop: int = min(chunk_start + _SIMULATION_CHUNK_RUN_COUNT, run_count)
+        chunk_rows: int = chunk_stop - chunk_start
+
+        # 랜덤 최소/최대 데미지 폭과 치명타 발생 여부 일괄 추첨
+        damages: np.ndarray = rng.uniform(0.95, 1.05, size=(chunk_rows, hit_count))
+        damages *= base_damages
+        crit_mask: np.ndarray = rng.random((chunk_rows, hit_count)) < crit_probability
+        damages[crit_mask] *= crit_multiplier
+
+        totals[chunk_start:chunk_stop] = damages.sum(axis=1)
+        skill_totals[chunk_start:chunk_stop] = damages @ skill_one_hot
+
+        # 그래프 표본 구간에 해당하는 반복의 타격별 피해량만 보존
+        if chunk_start < sample_count:
+            sample_stop: int = min(chunk_stop, sample_count)
+            sample_damages[chunk_start:sample_stop] = damages[
+                : sample_stop - chunk_start
+            ]
+
+    return MonteCarloSummary(
+        totals=totals,
+        skill_totals=skill_totals,
+        sample_damages=sample_damages,
+    )
+
+
+def _build_hit_offset_pmf(
+    base_damage: float,
+    crit_probability: float,
+    crit_multiplier: float,
+    step: float,
+    bin_count: int,
+) -> np.ndarray:
+    """단일 타격 피해량 분포를 하한 기준 격자 확률 질량으로 이산화"""
+
+    # 비치명/치명 두 균등분포의 혼합 분포 구간
+    normal_low: float = base_damage * 0.95
+    normal_high: float = base_damage * 1.05
+    crit_low: float = normal_low * crit_multiplier
+    crit_high: float = normal_high * crit_multiplier
+    lower_bound: float = min(normal_low, crit_low)
+
+    # 각 격자 칸 경계에서 혼합 누적분포를 구해 칸별 확률 질량으로 차분
+    edges: np.ndarray = (np.arange(bin_count + 1, dtype=np.float64) - 0.5) * step
+    edges += lower_bound
+    normal_cdf: np.ndarray = np.clip(
+        (edges - normal_low) / (normal_high - normal_low), 0.0, 1.0
+    )
+    crit_cdf: np.ndarray = np.clip(
+        (edges - crit_low) / (crit_high - crit_low), 0.0, 1.0
+    )
+    mixture_cdf: np.ndarray = ((1.0 - crit_probability) * normal_cdf) + (
+        crit_probability * crit_cdf
+    )
+    return np.diff(mixture_cdf)
+
+
+def build_damage_distribution(
+    hit_arrays: HitEventArrays,
+    resolved_stats: FinalStats,
+    is_boss: bool,
+) -> DamageDistribution:
+    """타격별 독립 분포의 FFT 합성곱으로 총 피해량 분포 계산"""
+
+    base_damages: np.ndarray = _build_base_hit_damages(
+        hit_arrays=hit_arrays,
+        resolved_stats=resolved_stats,
+        is_boss=is_boss,
+    )
+    crit_rate: float = min(
+        float(resolved_stats.values[StatKey.CRIT_RATE_PERCENT]), 100.0
+    )
+    crit_probability: float = crit_rate * 0.01
+    crit_multiplier: float = (
+        1.0 + (float(resolved_stats.values[StatKey.CRIT_DAMAGE_PERCENT]) - 100.0) * 0.01
+    )
+
+    # 단일 타격 배율(균등 x 치명) 1, 2차 모멘트로 기댓값/분산 계산
+    factor_mean: float = 1.0 + (crit_probability * (crit_multiplier - 1.0))
+    factor_square_mean: float = (1.0 + (0.1**2 / 12.0)) * (
+        (1.0 - crit_probability) + (crit_probability * crit_multiplier**2)
+    )
+    mean: float = float(base_damages.sum()) * factor_mean
+    variance: float = float(np.square(base_damages).sum()) * (
+        factor_square_mean - factor_mean**2
+    )
+
+    # 동일 기본 피해량 타격끼리 묶어 스펙트럼 거듭제곱으로 합성곱 횟수 축소
+    unique_damages: np.ndarray
+    hit_counts: np.ndarray
+    unique_damages, hit_counts = np.unique(
+        base_damages[base_damages > 0.0], return_counts=True
+    )
+    low_factor: float = 0.95 * min(1.0, crit_multiplier)
+    high_factor: float = 1.05 * max(1.0, crit_multiplier)
+    start: float = float((unique_damages * hit_counts).sum()) * low_factor
+    total_width: float = float((unique_damages * hit_counts).sum()) * (
+        high_factor - low_factor
+    )
+    if total_width <= 0.0:
+        return DamageDistribution(
+            start=start,
+            step=0.0,
+            pmf=np.ones(1, dtype=np.float64),
+            mean=mean,
+            variance=variance,
+        )
+
+    # 순환 합성곱 겹침이 없도록 전체 지지 구간을 덮는 2의 거듭제곱 격자 구성
+    step: float = total_width / _ANALYTIC_GRID_SIZE
+    bin_counts: np.ndarray = (
+        np.ceil(unique_damages * (high_factor - low_factor) / step).astype(np.intp) + 1
+    )
+    support_bin_count: int = int(((bin_counts - 1) * hit_counts).sum()) + 1
+    grid_size: int = 1 << (support_bin_count - 1).bit_length()
+
+    spectrum: np.ndarray = np.ones((grid_size // 2) + 1, dtype=np.complex128)
+    unique_damage: float
+    hit_count: int
+    bin_count: int
+    for unique_damage, hit_count, bin_count in zip(
+        unique_damages.tolist(), hit_counts.tolist(), bin_counts.tolist()
+    ):
+        hit_pmf: np.ndarray = _build_hit_offset_pmf(
+            base_damage=unique_damage,
+            crit_probability=crit_probability,
+            crit_multiplier=crit_multiplier,
+            step=step,
+            bin_count=bin_count,
+        )
+        spectrum *= np.fft.rfft(hit_pmf, n=grid_size) ** hit_count
+
+    # 역변환 수치 오차로 생긴 음수 질량 제거 후 정규화
+    pmf: np.ndarray = np.clip(np.fft.irfft(spectrum, n=grid_size), 0.0, None)
+    pmf = pmf[:support_bin_count]
+    pmf /= pmf.sum()
+
+    return DamageDistribution(
+        start=start,
+        step=step,
+        pmf=pmf,
+        mean=mean,
+        variance=variance,
+    )
+
+
+def _summarize_monte_carlo(
+    summary: MonteCarloSummary,
+) -> tuple[float, float, float, float]:
+    """반복 표본 기준 (최소, 최대, 25퍼센타일, 75퍼센타일) 반환"""
+
+    return (
+        float(summary.totals.min()),
+        float(summary.totals.max()),
+        summary.percentile(25),
+        summary.percentile(75),
+    )
+
+
+def _summarize_distribution(
+    distribution: DamageDistribution,
+) -> tuple[float, float, float, float]:
+    """해석적 분포 기준 (최소, 최대, 25퍼센타일, 75퍼센타일) 반환"""
+
+    return (
+        distribution.percentile(ANALYTIC_MIN_PERCENTILE),
+        distribution.percentile(ANALYTIC_MAX_PERCENTILE),
+        distribution.percentile(25),
+        distribution.percentile(75),
+    )
+
+
 def simulate_random_from_calculator(
     server_spec: "ServerSpec",
     preset: "MacroPreset",
     skills_info: dict[str, SkillUsageSetting],
     delay_ms: int,
     base_stats: BaseStats,
+    run_count: int = DEFAULT_SIMULATION_RUN_COUNT,
+    random_seed: int | None = None,
+    mode: SimulationMode = SimulationMode.MONTE_CARLO,
 ) -> GraphReport:
     """계산기 입력 기준 그래프용 시뮬레이션 결과 구성"""
 
+    if (
+        mode == SimulationMode.MONTE_CARLO
+        and not MIN_SIMULATION_RUN_COUNT <= run_count <= MAX_SIMULATION_RUN_COUNT
+    ):
+        raise ValueError(
+            f"시뮬레이션 반복 횟수는 {MIN_SIMULATION_RUN_COUNT:,}~"
+            f"{MAX_SIMULATION_RUN_COUNT:,} 사이여야 합니다."
+        )
+
     # 계산기 기준 최종 스탯 resolve 및 타임라인 구성
     resolved_stats: FinalStats = base_stats.resolve()
     hit_events: tuple[HitEvent, ...] = build_calculator_timeline(
@@ -63,39 +443,63 @@ def simulate_random_from_calculator(
         for event in deterministic_boss_events
     )
 
-    # 확률 분포 분석용 랜덤 보스/일반 공격 이벤트 반복 생성
-    random_boss_attacks: list[tuple[GraphDamageEvent, ...]] = []
-    random_normal_attacks: list[list[float]] = []
-    for _ in range(1000):
-        boss_seed: float = random.random()
-        normal_seed: float = random.random()
-        boss_events: list[DamageEvent] = build_damage_events(
-            hit_events=hit_events,
+    # 타임라인을 배열로 1회 변환
+    hit_arrays: HitEventArrays = HitEventArrays.from_hit_events(hit_events)
+
+    # 카드 통계 (최소, 최대, 25퍼센타일, 75퍼센타일)
+    boss_card_stats: tuple[float, float, float, float]
+    normal_card_stats: tuple[float, float, float, float]
+    boss_sample_damages: np.ndarray
+    if mode == SimulationMode.ANALYTIC:
+        # 분포 합성곱으로 카드 통계를 계산하고 그래프 표본만 고정 시드로 생성
+        boss_card_stats = _summarize_distribution(
+            build_damage_distribution(hit_arrays, resolved_stats, is_boss=True)
+        )
+        normal_card_stats = _summarize_distribution(
+            build_damage_distribution(hit_arrays, resolved_stats, is_boss=False)
+        )
+        boss_sample_damages = run_monte_carlo_simulation(
+            hit_arrays=hit_arrays,
             resolved_stats=resolved_stats,
             is_boss=True,
-            deterministic=False,
-            random_seed=boss_seed,
+            run_count=GRAPH_SAMPLE_RUN_COUNT,
+            rng=np.random.default_rng(_ANALYTIC_GRAPH_SAMPLE_SEED),
+            sample_count=GRAPH_SAMPLE_RUN_COUNT,
+        ).sample_damages
+
+    else:
+        # 보스/일반 확률 분포 일괄 시뮬레이션
+        rng: np.random.Generator = np.random.default_rng(random_seed)
+        boss_summary: MonteCarloSummary = run_monte_carlo_simulation(
+            hit_arrays=hit_arrays,
+            resolved_stats=resolved_stats,
+            is_boss=True,
+            run_count=run_count,
+            rng=rng,
+            sample_count=GRAPH_SAMPLE_RUN_COUNT,
         )
-        normal_events: list[DamageEvent] = build_damage_events(
-            hit_events=hit_events,
+        normal_summary: MonteCarloSummary = run_monte_carlo_simulation(
+            hit_arrays=hit_arrays,
             resolved_stats=resolved_stats,
             is_boss=False,
-            deterministic=False,
-            random_seed=normal_seed,
+            run_count=run_count,
+            rng=rng,
         )
-        # 그래프 출력용 보스 공격 이벤트만 새 DTO로 누적
-        random_boss_attacks.append(
-            tuple(
-                GraphDamageEvent(
-                    skill_id=event.skill_id,
-                    time=event.time,
-                    damage=event.damage,
-                )
-                for event in boss_events
-            )
+        boss_card_stats = _summarize_monte_carlo(boss_summary)
+        normal_card_stats = _summarize_monte_carlo(normal_summary)
+        boss_sample_damages = boss_summary.sample_damages
+
+    # 그래프 출력용 표본 반복만 보스 공격 DTO로 변환
+    hit_keys: list[tuple[str, float]] = [
+        (hit_event.skill_id, hit_event.time) for hit_event in hit_events
+    ]
+    random_boss_attacks: tuple[tuple[GraphDamageEvent, ...], ...] = tuple(
+        tuple(
+            GraphDamageEvent(skill_id=skill_id, time=time, damage=damage)
+            for (skill_id, time), damage in zip(hit_keys, sample_row)
         )
-        # 분석 카드 계산용 일반 공격 총합만 유지
-        random_normal_attacks.append([event.damage for event in normal_events])
+        for sample_row in boss_sample_damages.tolist()
+    )
 
     # 확률 통계 계산용 총 피해량 집계
     total_boss_damage: float = sum(
@@ -104,28 +508,6 @@ def simulate_random_from_calculator(
     total_normal_damage: float = sum(
         event.damage for event in deterministic_normal_events
     )
-    total_boss_damages: list[float] = [
-        sum(attack.damage for attack in attack_list)
-        for attack_list in random_boss_attacks
-    ]
-    total_normal_damages: list[float] = [
-        sum(attack_damage for attack_damage in attack_list)
-        for attack_list in random_normal_attacks
-    ]
-
-    # 백분위수 계산용 내부 정렬 기반 보간 함수
-    def calculate_percentile(data: list[float], percentile: int) -> float:
-        sorted_data: list[float] = sorted(data)
-        rank: float = (percentile * 0.01) * (len(data) - 1) + 1
-        lower_index: int = int(rank) - 1
-        fraction: float = rank - int(rank)
-        if lower_index + 1 < len(data):
-            result: float = sorted_data[lower_index] + fraction * (
-                sorted_data[lower_index + 1] - sorted_data[lower_index]
-            )
-            return result
-
-        return sorted_data[lower_index]
 
     # 정수형 수치 카드 문자열 포맷 구성
     def format_card_int(value: float) -> str:
@@ -135,44 +517,32 @@ def simulate_random_from_calculator(
     def format_card_float(value: float) -> str:
         return f"{value:,.1f}"
 
+    # 분석 카드 1행 구성 (scale로 초당/총합 표기 전환)
+    def build_card(
+        title: str,
+        value: float,
+        card_stats: tuple[float, float, float, float],
+        scale: float,
+    ) -> GraphAnalysis:
+        return GraphAnalysis(
+            title=title,
+            value=format_card_int(value / scale),
+            min=format_card_int(card_stats[0] / scale),
+            max=format_card_int(card_stats[1] / scale),
+            p25=format_card_int(card_stats[2] / scale),
+            p75=format_card_int(card_stats[3] / scale),
+        )
+
     # 보스/일반 피해량 분석 카드 데이터 구성
     analysis: tuple[GraphAnalysis, ...] = (
-        GraphAnalysis(
-            title="초당 보스피해량",
-            value=format_card_int(total_boss_damage / 60),
-            min=format_card_int(min(total_boss_damages) / 60),
-            max=format_card_int(max(total_boss_damages) / 60),
-            p25=format_card_int(calculate_percentile(total_boss_damages, 25) / 60),
-            p75=format_card_int(calculate_percentile(total_boss_damages, 75) / 60),
-        ),
-        GraphAnalysis(
-            title="총 보스피해량",
-            value=format_card_int(total_boss_damage),
-            min=format_card_int(min(total_boss_damages)),
-            max=format_card_int(max(total_boss_damages)),
-            p25=format_card_int(calculate_percentile(total_boss_damages, 25)),
-            p75=format_card_int(calculate_percentile(total_boss_damages, 75)),
-        ),
-        GraphAnalysis(
-            title="초당 피해량",
-            value=format_card_int(total_normal_damage / 60),
-            min=format_card_int(min(total_normal_damages) / 60),
-            max=format_card_int(max(total_normal_damages) / 60),
-            p25=format_card_int(calculate_percentile(total_normal_damages, 25) / 60),
-            p75=format_card_int(calculate_percentile(total_normal_damages, 75) / 60),
-        ),
-        GraphAnalysis(
-            title="총 피해량",
-            value=format_card_int(total_normal_damage),
-            min=format_card_int(min(total_normal_damages)),
-            max=format_card_int(max(total_normal_damages)),
-            p25=format_card_int(calculate_percentile(total_normal_damages, 25)),
-            p75=format_card_int(calculate_percentile(total_normal_damages, 75)),
-        ),
+        build_card("초당 보스피해량", total_boss_damage, boss_card_stats, 60),
+        build_card("총 보스피해량", total_boss_damage, boss_card_stats, 1),
+        build_card("초당 피해량", total_normal_damage, normal_card_stats, 60),
+        build_card("총 피해량", total_normal_damage, normal_card_stats, 1),
     )
 
     return GraphReport(
         analysis=analysis,
         deterministic_boss_attacks=deterministic_boss_attacks,
-        random_boss_attacks=tuple(random_boss_attacks),
+        random_boss_attacks=random_boss_attacks,
     )
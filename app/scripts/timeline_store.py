@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import os
+import struct
+
+from app.scripts.app_paths import data_path
+from app.scripts.lru_file_store import LruFileStore
+
+# 파일 형식 식별자와 버전 (형식 변경 시 버전 증가로 기존 파일 무시)
+TIMELINE_STORE_MAGIC: bytes = b"SMTL"
+TIMELINE_STORE_VERSION: int = 1
+# 보관할 최대 타임라인 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+TIMELINE_STORE_CAPACITY: int = 128
+# 캐시 키 바이트 길이 (sha256 digest)
+TIMELINE_STORE_KEY_SIZE: int = 32
+
+timeline_cache_file_dir: str = os.path.join(data_path, "timeline_cache.bin")
+
+# 헤더: 식별자, 버전, 항목 수
+_HEADER_STRUCT: struct.Struct = struct.Struct("<4sHI")
+# 항목 머리: 키, 스킬 ID 수, 이벤트 수
+_ENTRY_STRUCT: struct.Struct = struct.Struct(f"<{TIMELINE_STORE_KEY_SIZE}sHI")
+_LENGTH_STRUCT: struct.Struct = struct.Struct("<H")
+
+# 타임라인 레코드: (스킬 ID, 시각, 스킬 계수) 시간순 튜플
+TimelineRecord = tuple[tuple[str, float, float], ...]
+
+
+def _encode_record(key: bytes, record: TimelineRecord) -> bytes:
+    """단일 타임라인 항목을 스킬 ID 테이블 + 열 단위 배열로 직렬화"""
+
+    # 반복되는 스킬 ID는 테이블 인덱스로 치환
+    skill_indices: dict[str, int] = {}
+    index_column: list[int] = []
+    time_column: list[float] = []
+    multiplier_column: list[float] = []
+    skill_id: str
+    hit_time: float
+    multiplier: float
+    for skill_id, hit_time, multiplier in record:
+        index_column.append(skill_indices.setdefault(skill_id, len(skill_indices)))
+        time_column.append(hit_time)
+        multiplier_column.append(multiplier)
+
+    event_count: int = len(record)
+    chunks: list[bytes] = [_ENTRY_STRUCT.pack(key, len(skill_indices), event_count)]
+    for skill_id in skill_indices:
+        encoded_id: bytes = skill_id.encode("utf-8")
+        chunks.append(_LENGTH_STRUCT.pack(len(encoded_id)))
+        chunks.append(encoded_id)
+
+    chunks.append(struct.pack(f"<{event_count}H", *index_column))
+    chunks.append(struct.pack(f"<{event_count}d", *time_column))
+    chunks.append(struct.pack(f"<{event_count}d", *multiplier_column))
+    return b"".join(chunks)
+
+
+def _decode_entries(data: bytes) -> list[tuple[bytes, TimelineRecord]]:
+    """파일 바이트를 (키, 레코드) 목록으로 역직렬화 (형식 불일치 시 ValueError)"""
+
+    if len(data) < _HEADER_STRUCT.size:
+        raise ValueError("타임라인 캐시 헤더가 손상되었습니다.")
+
+    magic: bytes
+    version: int
+    entry_count: int
+    magic, version, entry_count = _HEADER_STRUCT.unpack_from(data, 0)
+    if magic != TIMELINE_STORE_MAGIC or version != TIMELINE_STORE_VERSION:
+        raise ValueError("지원하지 않는 타임라인 캐시 형식입니다.")
+
+    entries: list[tuple[bytes, TimelineRecord]] = []
+    offset: int = _HEADER_STRUCT.size
+    try:
+        for _ in range(entry_count):
+            key: bytes
+            skill_count: int
+            event_count: int
+            key, skill_count, event_count = _ENTRY_STRUCT.unpack_from(data, offset)
+            offset += _ENTRY_STRUCT.size
+
+            skill_ids: list[str] = []
+            for _ in range(skill_count):
+                id_length: int = _LENGTH_STRUCT.unpack_from(data, offset)[0]
+                offset += _LENGTH_STRUCT.size
+                skill_ids.append(data[offset : offset + id_length].decode("utf-8"))
+                offset += id_length
+
+            index_column: tuple[int, ...] = struct.unpack_from(
+                f"<{event_count}H", data, offset
+            )
+            offset += 2 * event_count
+            time_column: tuple[float, ...] = struct.unpack_from(
+                f"<{event_count}d", data, offset
+            )
+            offset += 8 * event_count
+            multiplier_column: tuple[float, ...] = struct.unpack_from(
+                f"<{event_count}d", data, offset
+            )
+            offset += 8 * event_count
+
+            record: TimelineRecord = tuple(
+                zip(
+                    [skill_ids[index] for index in index_column],
+                    time_column,
+                    multiplier_column,
+                )
+            )
+            entries.append((key, record))
+
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise ValueError("타임라인 캐시 항목이 손상되었습니다.") from error
+
+    return entries
+
+
+class TimelineStore(LruFileStore[bytes, TimelineRecord]):
+    """프리셋 지문 + 스킬속도 키 기준 타임라인 LRU 영속 캐시"""
+
+    def __init__(
+        self,
+        file_path: str,
+        capacity: int = TIMELINE_STORE_CAPACITY,
+    ) -> None:
+        super().__init__(file_path, capacity)
+
+    def get(self, key: bytes) -> TimelineRecord | None:
+        """키에 해당하는 타임라인 반환 및 최근 사용 갱신"""
+
+        return self._lookup(key)
+
+    def put(self, key: bytes, record: TimelineRecord) -> None:
+        """타임라인 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+
+        self._store(key, record)
+
+    def _encode_entries(self, entries: list[tuple[bytes, TimelineRecord]]) -> bytes:
+        """헤더 + 항목별 열 단위 배열로 직렬화"""
+
+        chunks: list[bytes] = [
+            _HEADER_STRUCT.pack(
+                TIMELINE_STORE_MAGIC,
+                TIMELINE_STORE_VERSION,
+                len(entries),
+            )
+        ]
+        chunks.extend(_encode_record(key, record) for key, record in entries)
+        return b"".join(chunks)
+
+    def _decode_entries(self, data: bytes) -> list[tuple[bytes, TimelineRecord]]:
+        """파일 바이트를 (키, 레코드) 목록으로 역직렬화"""
+
+        return _decode_entries(data)
+
+
+timeline_store: TimelineStore = TimelineStore(timeline_cache_file_dir)
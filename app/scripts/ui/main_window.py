@@ -22,6 +22,10 @@ from PySide6.QtWidgets import (
 )
 
 from app.scripts.app_state import app_state
+from app.scripts.calculator_engine import (
+    shutdown_optimization_worker_pool,
+    start_optimization_worker_pool,
+)
 from app.scripts.config import config
 from app.scripts.custom_classes import CustomFont
 from app.scripts.data_manager import (
@@ -210,6 +214,9 @@ class MainWindow(QWidget):
         # 키보드 입력 감지 쓰레드
         Thread(target=checking_kb_thread, daemon=True).start()
 
+        # 최적화 워커 풀 예열 쓰레드 (프로세스 생성 비용을 첫 계산 전에 선지불)
+        Thread(target=start_optimization_worker_pool, daemon=True).start()
+
         # 버전 확인 쓰레드
         if config.macro.is_version_check_enabled:
             # 초기 화면 표시 이후 백그라운드 버전 확인 시작
@@ -446,6 +453,9 @@ class MainWindow(QWidget):
 
         # 창 종료 전에 계산기 백그라운드 작업 중단 요청
         self.sim_ui.cancel_results_calculation_for_shutdown()
+
+        # 최적화 워커 풀 진행 작업 취소 및 종료
+        shutdown_optimization_worker_pool()
         super().closeEvent(event)
 
     def _on_theme_changed(self, dark: bool) -> None:
@@ -1033,6 +1033,212 @@ class DMGCanvas(pg.PlotWidget):
         self.parent().wheelEvent(event)  # type: ignore
 
 
+class LevelUpCurveCanvas(pg.PlotWidget):
+    """다음 N레벨업 누적 최적 분배 기준 전투력 변화량 선 그래프"""
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self.setObjectName("levelUpCurveCanvas")
+
+        # 현재 테마 기준 그래프 팔레트 고정
+        self.graph_palette: GraphPalette = get_graph_palette()
+
+        # i번째 값은 i + 1 레벨업 전투력 변화량
+        self.deltas: list[float] = []
+
+        # 안티 에일리어싱 활성화
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        self.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        pg.setConfigOptions(antialias=True)
+
+        # 하단 축 텍스트 설정
+        font_properties = {
+            "font-size": "10pt",
+            "font-family": "Noto Sans KR",
+        }
+        self.setLabel("bottom", "레벨업", units="회", **font_properties)
+
+        # 축 폰트와 색상 설정
+        axis_font = CustomFont(point_size=10)
+        axis_bottom: pg.AxisItem = self.getAxis("bottom")
+        axis_bottom.setStyle(tickFont=axis_font)
+        axis_bottom.setTextPen(self.graph_palette.axis_text)
+
+        axis_left: pg.AxisItem = self.getAxis("left")
+        axis_left.setStyle(tickFont=axis_font)
+        axis_left.setTextPen(self.graph_palette.axis_text)
+        axis_left.setPen(None)
+
+        # 지수 표기법 대신 천 단위 콤마 사용하도록 tickStrings 메서드 오버라이드
+        def tickStrings(values, scale, spacing):
+            return [f"{v:,.0f}" for v in values]
+
+        axis_left.tickStrings = tickStrings
+
+        # 배경 색상 설정
+        self.setBackground(self.graph_palette.canvas_background)
+
+        # 마우스 상호작용 비활성화 (드래그, 줌, 우클릭 메뉴 등)
+        self.setMouseEnabled(x=False, y=False)
+        self.setMenuEnabled(False)
+        self.hideButtons()
+
+        # X축 그리드만 표시, ViewBox 여백 제거
+        self.showGrid(x=True, y=False, alpha=0.5)
+        self.getViewBox().setDefaultPadding(0.0)
+
+        self.create_line_graph()
+
+        # 테마 전환 시 현재 그래프 색상 동기화
+        theme_manager.theme_changed.connect(self._on_theme_changed)
+
+    def set_deltas(self, deltas: list[float]) -> None:
+        """레벨업 횟수별 전투력 변화량 교체 후 그래프 재구성"""
+
+        self.deltas = list(deltas)
+        self._rebuild()
+
+    def _on_theme_changed(self, _dark: bool) -> None:
+        """테마 전환 시 선 그래프 색상 재구성"""
+
+        # 현재 테마 기준 팔레트 재적용
+        self.graph_palette = get_graph_palette()
+        self.getAxis("bottom").setTextPen(self.graph_palette.axis_text)
+        self.getAxis("left").setTextPen(self.graph_palette.axis_text)
+        self.setBackground(self.graph_palette.canvas_background)
+
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """기존 그래프 아이템과 툴팁 제거 후 재생성"""
+
+        self.clear()
+        self.tooltip_label.hide()
+        self.tooltip_label.deleteLater()
+
+        self.create_line_graph()
+
+    def create_line_graph(self) -> None:
+        # 0레벨업(변화 없음)부터 시작하는 선 그래프 그리기
+        level_count: int = len(self.deltas)
+        if level_count:
+            self.plot(
+                list(range(level_count + 1)),
+                [0.0] + self.deltas,
+                pen=pg.mkPen(self.graph_palette.damage_mean_line, width=2),
+            )
+
+            # 축 범위를 0 기준선과 데이터가 모두 보이도록 설정
+            low: float = min(0.0, min(self.deltas))
+            high: float = max(0.0, max(self.deltas))
+            margin: float = (high - low) * 0.1 or 1.0
+            self.setXRange(0, level_count)
+            self.setYRange(low if low >= 0.0 else low - margin, high + margin)
+
+            # x축 눈금 설정 (전체 레벨 수를 10칸으로 나눈 간격)
+            tick_step: int = max(1, level_count // 10)
+            bottom_axis: pg.AxisItem = self.getAxis("bottom")
+            bottom_axis.setTicks(
+                [[(i, f"{i}") for i in range(0, level_count + 1, tick_step)]]
+            )
+            bottom_axis.setTickPen(
+                pg.mkPen(
+                    self.graph_palette.guide_line, width=2, style=Qt.PenStyle.DashLine
+                )
+            )
+
+        # 툴팁 선
+        self.tooltip_line = pg.InfiniteLine(
+            angle=90,
+            movable=False,
+            pen=pg.mkPen(
+                self.graph_palette.guide_line, width=2, style=Qt.PenStyle.DashLine
+            ),
+        )
+        self.addItem(self.tooltip_line)
+
+        # 툴팁 점
+        self.tooltip_point = pg.ScatterPlotItem(pen=pg.mkPen(None), size=8)
+        self.addItem(self.tooltip_point)
+
+        # 툴팁 레이블 설정
+        self.tooltip_label = QLabel(parent=self)
+        self.tooltip_label.setObjectName("graphTooltipLabel")
+        self.tooltip_label.setFont(CustomFont(point_size=10))
+        self.tooltip_label.setAttribute(
+            Qt.WidgetAttribute.WA_TransparentForMouseEvents, True
+        )
+
+        # 처음에는 숨김
+        self.tooltip_line.hide()
+        self.tooltip_point.hide()
+        self.tooltip_label.hide()
+
+    def mouseMoveEvent(self, event) -> None:  # type: ignore
+        """
+        마우스 이동 이벤트 핸들러
+        """
+
+        # 마우스 위치를 ViewBox 좌표로 변환
+        pos_converted: QPointF = self.getViewBox().mapSceneToView(QPointF(event.pos()))
+        x: float = pos_converted.x()
+
+        # 가장 가까운 레벨업 횟수 계산
+        level: int = int(x + 0.5)
+        level_count: int = len(self.deltas)
+
+        # 마우스가 데이터 범위 내에 있는지 확인
+        if 1 <= level <= level_count:
+            delta: float = self.deltas[level - 1]
+            self.tooltip_line.setPos(level)
+            self.tooltip_line.show()
+
+            # 툴팁 레이블 위치 및 내용 설정
+            self.tooltip_label.setText(f"레벨 {level}업\n전투력 변화: {delta:+,.1f}")
+            local_pos = self.mapFromGlobal(event.globalPosition().toPoint())
+            self.tooltip_label.adjustSize()
+            if x <= level_count / 2:
+                self.tooltip_label.move(local_pos + QPoint(15, -30))
+            else:
+                self.tooltip_label.move(
+                    local_pos - QPoint(self.tooltip_label.width() + 15, 30)
+                )
+            self.tooltip_label.raise_()
+            self.tooltip_label.show()
+
+            # 툴팁 점 위치 설정 (실제 데이터 포인트)
+            self.tooltip_point.setData(
+                pos=[[level, delta]],
+                brush=[self.graph_palette.damage_mean_line],
+            )
+            self.tooltip_point.show()
+
+        # 범위를 벗어난 경우 툴팁 숨김
+        else:
+            self.tooltip_line.hide()
+            self.tooltip_label.hide()
+            self.tooltip_point.hide()
+
+        # 부모 클래스의 mouseMoveEvent 호출
+        super().mouseMoveEvent(event)
+
+    def wheelEvent(self, event) -> None:  # type: ignore
+        """
+        이 위젯의 wheelEvent를 부모 위젯으로 전달하는 메서드
+        """
+
+        # 이벤트 무시
+        event.ignore()
+
+        # 툴팁 숨김
+        self.tooltip_line.hide()
+        self.tooltip_label.hide()
+        self.tooltip_point.hide()
+
+        # 부모 위젯의 wheelEvent 호출
+        self.parent().wheelEvent(event)  # type: ignore
+
+
 class SkillContributionCanvas(pg.PlotWidget):
     def __init__(
         self,
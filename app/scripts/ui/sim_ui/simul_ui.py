@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import copy
 import json
+import threading
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from enum import Enum
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -53,18 +57,22 @@ from PySide6.QtWidgets import (
 from app.scripts.app_state import app_state
 from app.scripts.calculator_engine import (
     DISPLAY_POWER_METRICS,
+    LEVEL_UP_PLAN_MAX_LEVELS,
     POWER_METRIC_LABELS,
+    SCROLL_UPGRADE_PLAN_STEPS,
     build_calculator_timeline,
     build_calculator_context,
     build_damage_events,
     build_internal_base_stats,
     evaluate_arbitrary_stat_delta,
-    evaluate_level_up_delta,
     evaluate_next_realm_delta,
+    evaluate_power_gradient,
     evaluate_scroll_upgrade_deltas,
-    evaluate_single_stat_delta,
+    evaluate_stat_probe_deltas,
     OptimizationFailure,
     optimize_current_selection,
+    plan_level_ups,
+    plan_scroll_upgrades,
 )
 from app.scripts.calculator_models import (
     OVERALL_STAT_GRID_ROWS,
@@ -108,7 +116,7 @@ from app.scripts.registry.resource_registry import (
     get_theme_image_path,
     resource_registry,
 )
-from app.scripts.simulate_macro import simulate_random_from_calculator
+from app.scripts.simulate_macro import SimulationMode, simulate_random_from_calculator
 from app.scripts.ui.popup import (
     CustomPowerFormulaManageDialog,
     NoticeKind,
@@ -118,6 +126,7 @@ from app.scripts.ui.sim_ui.graph import (
     DamageGraphMode,
     DMGCanvas,
     DpmDistributionCanvas,
+    LevelUpCurveCanvas,
     SkillContributionCanvas,
     SkillDpsRatioCanvas,
 )
@@ -136,9 +145,14 @@ if TYPE_CHECKING:
         GraphReport,
         HitEvent,
         LevelUpEvaluation,
+        OptimizationCandidate,
+        OptimizationIncumbent,
         OptimizationResult,
+        OptimizationStats,
         RealmAdvanceEvaluation,
         ScrollUpgradeEvaluation,
+        ScrollUpgradePlanStep,
+        StatProbeEvaluation,
     )
     from app.scripts.calculator_models import (
         RealmTier,
@@ -262,6 +276,7 @@ class SimUI:
         self._results_overlay: _CalculationOverlay = _CalculationOverlay(
             self.parent,
             self._cancel_results_calculation,
+            self._accept_results_calculation_incumbent,
         )
         self._input_confirm_overlay: _CalculationInputConfirmOverlay = (
             _CalculationInputConfirmOverlay(
@@ -284,6 +299,8 @@ class SimUI:
         )
         self._pending_character_fill: CalculatorInputFill | None = None
         self._calc_thread: _CalculatorThread | None = None
+        # 결과 행 스트리밍으로 결과 페이지에 먼저 진입한 경우 취소 시 돌아갈 페이지
+        self._results_return_page_index: int | None = None
         self._results_cache_key: _CalculatorResultsCacheKey | None = None
         self._results_cache_output_rows: ResultsPage.OutputRows | None = None
         self._pending_results_cache_key: _CalculatorResultsCacheKey | None = None
@@ -516,7 +533,9 @@ class SimUI:
             return
 
         # 저장된 계산기 입력 기준 계산 인자 복원
-        preset: MacroPreset = app_state.macro.current_preset
+        # 결과 묶음은 여러 스레드에서 동시에 계산되므로 계산 중 화면 편집이
+        # 섞이지 않도록 프리셋 사본을 모든 작업이 공유하는 읽기 전용 입력으로 사용
+        preset: MacroPreset = copy.deepcopy(app_state.macro.current_preset)
         calculator_input: CalculatorPresetInput = preset.info.calculator
         base_stats: BaseStats = calculator_input.base_stats
         level: int = calculator_input.level
@@ -544,6 +563,10 @@ class SimUI:
             custom_formulas=custom_formulas,
         )
         self._calc_thread.progress_signal.connect(self._on_results_calculation_progress)
+        self._calc_thread.incumbent_signal.connect(
+            self._on_results_calculation_incumbent
+        )
+        self._calc_thread.rows_signal.connect(self._on_results_calculation_rows)
         self._calc_thread.finished_signal.connect(self._on_results_calculation_finished)
         self._calc_thread.finished.connect(self._cleanup_calc_thread)
         self._calc_thread.start()
@@ -661,6 +684,16 @@ class SimUI:
         self._results_overlay.set_cancelling()
         self._calc_thread.cancel()
 
+    def _accept_results_calculation_incumbent(self) -> None:
+        """진행 중인 최적화의 현재 최고 조합으로 결과 확정 요청"""
+
+        # 실행 중인 계산이 없으면 요청 무시
+        if self._calc_thread is None or not self._calc_thread.isRunning():
+            return
+
+        self._results_overlay.set_accepting()
+        self._calc_thread.accept_current_best()
+
     def cancel_results_calculation_for_shutdown(self) -> None:
         """프로그램 종료 중 진행 계산 취소 및 스레드 정리"""
 
@@ -678,6 +711,33 @@ class SimUI:
         # 백그라운드 계산 단계 문구와 진행률 반영
         self._results_overlay.update_progress(message, value)
 
+    def _on_results_calculation_incumbent(
+        self,
+        incumbent: "OptimizationIncumbent",
+    ) -> None:
+        """최적화 중간 결과 (현재 최고 조합) 표시 갱신"""
+
+        self._results_overlay.update_incumbent(
+            ResultsPage._format_incumbent_summary(incumbent)
+        )
+
+    def _on_results_calculation_rows(
+        self,
+        group: ResultsPage.OutputGroup,
+        output_rows: ResultsPage.OutputRows,
+    ) -> None:
+        """먼저 끝난 결과 행 묶음을 결과 페이지에 즉시 반영"""
+
+        self.results_page.set_output_group(group, output_rows)
+
+        # 첫 묶음 도착 시 결과 페이지로 전환 (오버레이는 남은 계산 동안 유지)
+        if self.stacked_layout.currentWidget() is not self.results_page:
+            self._results_return_page_index = self.stacked_layout.currentIndex()
+            self.update_nav(2)
+            self.stacked_layout.setCurrentIndex(2)
+
+        self.adjust_main_frame_height()
+
     def _on_results_calculation_finished(
         self,
         output_rows: ResultsPage.OutputRows | None,
@@ -688,9 +748,17 @@ class SimUI:
         # 오버레이 정리 (스레드 참조 해제는 finished 시그널에서 처리)
         self._results_overlay.hide()
 
-        # 사용자 취소 요청이면 현재 페이지 유지
+        # 사용자 취소 요청이면 계산 시작 전 페이지 유지
+        return_page_index: int | None = self._results_return_page_index
+        self._results_return_page_index = None
         if is_cancelled:
             self._pending_results_cache_key = None
+            if return_page_index is not None:
+                self.update_nav(return_page_index)
+                self.stacked_layout.setCurrentIndex(return_page_index)
+                self.adjust_main_frame_height()
+                QTimer.singleShot(0, self.adjust_main_frame_height)
+
             return
 
         # 계산 실패 시 오류 결과 표시 후 결과 페이지 진입
@@ -704,8 +772,11 @@ class SimUI:
             return
 
         # 성공한 계산 결과를 동일 입력 재진입용 캐시에 저장
-        self._results_cache_key = self._pending_results_cache_key
-        self._results_cache_output_rows = output_rows
+        # (최적화를 조기 수락한 결과는 재진입 시 다시 탐색하도록 캐시하지 않음)
+        if self._calc_thread is None or not self._calc_thread.is_accept_requested():
+            self._results_cache_key = self._pending_results_cache_key
+            self._results_cache_output_rows = output_rows
+
         self._pending_results_cache_key = None
 
         # 계산 성공 결과 반영 후 결과 페이지 진입
@@ -1075,6 +1146,7 @@ class _CalculationOverlay(QFrame):
         self,
         parent: QWidget,
         cancel_handler: Callable[[], None],
+        accept_handler: Callable[[], None] | None = None,
     ) -> None:
         super().__init__(parent)
 
@@ -1116,6 +1188,23 @@ class _CalculationOverlay(QFrame):
         self._progress_bar.setTextVisible(False)
         self._progress_bar.setFixedHeight(12)
 
+        # 최적화 중간 결과 (현재 최고 조합) 표시
+        self._incumbent_label: QLabel = QLabel(container)
+        self._incumbent_label.setObjectName("calcOverlayDetail")
+        self._incumbent_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._incumbent_label.setWordWrap(True)
+        self._incumbent_label.setFont(CustomFont(10))
+        self._incumbent_label.hide()
+
+        self._accept_button: QPushButton = QPushButton("현재 결과 사용", container)
+        self._accept_button.setObjectName("calcConfirmBtn")
+        self._accept_button.setFont(CustomFont(11, bold=True))
+        self._accept_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._accept_button.setFixedHeight(40)
+        self._accept_button.hide()
+        if accept_handler is not None:
+            self._accept_button.clicked.connect(accept_handler)
+
         self._cancel_button: QPushButton = QPushButton("취소", container)
         self._cancel_button.setObjectName("calcCancelBtn")
         self._cancel_button.setFont(CustomFont(11, bold=True))
@@ -1132,7 +1221,9 @@ class _CalculationOverlay(QFrame):
         container_layout.addWidget(self._detail_label)
         container_layout.addWidget(self._progress_bar)
         container_layout.addWidget(self._progress_label)
+        container_layout.addWidget(self._incumbent_label)
         container_layout.addSpacing(4)
+        container_layout.addWidget(self._accept_button)
         container_layout.addWidget(self._cancel_button)
         container.setLayout(container_layout)
 
@@ -1157,8 +1248,11 @@ class _CalculationOverlay(QFrame):
     def show_overlay(self, message: str, detail: str, value: int) -> None:
         """초기 진행 상태와 함께 오버레이 표시"""
 
-        # 취소 버튼 활성화와 초기 진행 상태 반영
+        # 취소 버튼 활성화와 초기 진행 상태 반영 (이전 중간 결과는 숨김)
         self._cancel_button.setEnabled(True)
+        self._accept_button.setEnabled(True)
+        self._accept_button.hide()
+        self._incumbent_label.hide()
         self._message_label.setText(message)
         self.update_progress(detail, value)
 
@@ -1180,8 +1274,23 @@ class _CalculationOverlay(QFrame):
 
         # 중복 취소 방지와 취소 진행 상태 표기
         self._cancel_button.setEnabled(False)
+        self._accept_button.setEnabled(False)
         self._detail_label.setText("취소 요청 처리 중...")
 
+    def update_incumbent(self, summary: str) -> None:
+        """최적화 중간 결과 문구 갱신 및 현재 결과 사용 버튼 표시"""
+
+        self._incumbent_label.setText(summary)
+        self._incumbent_label.show()
+        self._accept_button.show()
+
+    def set_accepting(self) -> None:
+        """현재 결과 사용 요청 직후 오버레이 상태 갱신"""
+
+        # 남은 탐색 중단 후 결과 정리까지 중복 요청 방지
+        self._accept_button.setEnabled(False)
+        self._detail_label.setText("현재 최적 후보로 결과 정리 중...")
+
 
 class _CalculationInputConfirmOverlay(QFrame):
     _SUMMARY_VALUE_WIDTH: int = 250
@@ -1457,6 +1566,8 @@ class GraphPage(QFrame):
             skills_info=app_state.macro.current_preset.usage_settings,
             delay_ms=app_state.macro.current_delay,
             base_stats=calculator_input.base_stats,
+            # 분석 카드는 분포 합성곱으로 즉시, 결정론적으로 계산
+            mode=SimulationMode.ANALYTIC,
         )
         analysis: list[GraphAnalysis] = list(graph_report.analysis)
         deterministic_attacks: list[GraphDamageEvent] = list(
@@ -1615,6 +1726,9 @@ class _CalculatorThread(QThread):
 
     finished_signal = Signal(object, bool)
     progress_signal = Signal(str, int)
+    incumbent_signal = Signal(object)
+    # (완료된 행 묶음, 지금까지 누적된 결과 행)
+    rows_signal = Signal(object, object)
 
     def __init__(
         self,
@@ -1637,6 +1751,7 @@ class _CalculatorThread(QThread):
         self._selected_formula_id = selected_formula_id
         self._custom_formulas: tuple[CustomPowerFormula, ...] = custom_formulas
         self._is_cancel_requested: bool = False
+        self._is_accept_requested: bool = False
 
     def cancel(self) -> None:
         """계산 취소 요청 기록"""
@@ -1645,6 +1760,16 @@ class _CalculatorThread(QThread):
         self._is_cancel_requested = True
         self.requestInterruption()
 
+    def accept_current_best(self) -> None:
+        """최적화 현재 최고 조합으로 탐색 조기 종료 요청 기록"""
+
+        self._is_accept_requested = True
+
+    def is_accept_requested(self) -> bool:
+        """현재 최고 조합 수락 요청 여부"""
+
+        return self._is_accept_requested
+
     def _emit_progress(self, message: str, value: int) -> None:
         """진행 상태 시그널 방출"""
 
@@ -1673,7 +1798,7 @@ class _CalculatorThread(QThread):
                 custom_formulas=self._custom_formulas,
             )
 
-            # 결과 행 전체 계산
+            # 결과 행 묶음 병렬 계산 (끝난 묶음부터 화면에 전달)
             self._emit_progress("결과 정리 준비 중...", 0)
             output_rows: ResultsPage.OutputRows = ResultsPage._build_output_rows(
                 server_spec=self._server_spec,
@@ -1687,6 +1812,9 @@ class _CalculatorThread(QThread):
                 context=context,
                 progress_callback=self._emit_progress,
                 cancel_checker=self._ensure_not_cancelled,
+                incumbent_callback=self.incumbent_signal.emit,
+                stop_checker=self.is_accept_requested,
+                group_callback=self.rows_signal.emit,
             )
 
             # 완료 직전 취소 여부 재확인
@@ -1706,9 +1834,12 @@ class ResultsPage(QFrame):
 
         current_power: tuple[str, str]
         stat_efficiency: list[tuple[str, str]]
+        stat_marginal_value: list[tuple[str, str]]
         level_up: list[tuple[str, str]]
+        level_up_curve: list[float]
         realm_up: list[tuple[str, str]]
         scroll_efficiency: list[tuple[str, str]]
+        scroll_upgrade_plan: list[tuple[str, str]]
         custom_delta: tuple[str, str] | None
         target_distribution_summary: tuple[str, str] | None
         target_delta: tuple[str, str] | None
@@ -1720,6 +1851,33 @@ class ResultsPage(QFrame):
         target_danjeon_base_stats: BaseStats | None
         optimized_base_stats: BaseStats | None
 
+    class OutputGroup(Enum):
+        """결과 카드 단위로 독립 계산되는 출력 행 묶음"""
+
+        CURRENT_POWER = "current_power"
+        STAT_EFFICIENCY = "stat_efficiency"
+        LEVEL_UP = "level_up"
+        REALM_UP = "realm_up"
+        SCROLL_EFFICIENCY = "scroll_efficiency"
+        CUSTOM_DELTA = "custom_delta"
+        TARGET_DISTRIBUTION = "target_distribution"
+        TARGET_DANJEON = "target_danjeon"
+        OPTIMIZATION = "optimization"
+
+    @dataclass(frozen=True)
+    class OutputJobInput:
+        """행 묶음 계산 작업들이 공유하는 입력 (평가 컨텍스트는 1회만 구성)"""
+
+        server_spec: "ServerSpec"
+        preset: "MacroPreset"
+        delay_ms: int
+        base_stats: BaseStats
+        level: int
+        selected_formula_id: str
+        current_realm: "RealmTier"
+        calculator_input: CalculatorPresetInput
+        context: "EvaluationContext"
+
     def __init__(
         self,
         parent: QFrame,
@@ -1757,12 +1915,52 @@ class ResultsPage(QFrame):
         # 계산 완료 결과 행을 결과 카드에 반영
         self.view.set_output_rows(output_rows)
 
+    def set_output_group(
+        self,
+        group: "ResultsPage.OutputGroup",
+        output_rows: "ResultsPage.OutputRows",
+    ) -> None:
+        """먼저 끝난 결과 행 묶음 반영"""
+
+        self.view.set_output_group(group, output_rows)
+
     @staticmethod
     def _format_delta(value: float) -> str:
         """전투력 변화량 표시 문자열 생성"""
 
         return f"{value:+,.2f}".rstrip("0").rstrip(".")
 
+    @classmethod
+    def _format_incumbent_summary(cls, incumbent: "OptimizationIncumbent") -> str:
+        """최적화 중간 결과 요약 문자열 생성"""
+
+        candidate: OptimizationCandidate = incumbent.result.candidate
+        summary_lines: list[str] = [
+            f"현재 최적 후보 {cls._format_delta(incumbent.result.delta)}",
+            (
+                f"힘 {candidate.distribution.strength}, "
+                f"민첩 {candidate.distribution.dexterity}, "
+                f"생명력 {candidate.distribution.vitality}, "
+                f"행운 {candidate.distribution.luck}"
+            ),
+            (
+                f"단전 상 {candidate.danjeon.upper}, "
+                f"중 {candidate.danjeon.middle}, "
+                f"하 {candidate.danjeon.lower}"
+            ),
+            (
+                f"칭호 {candidate.equipped_title_name or '없음'}, "
+                f"부적 {', '.join(candidate.equipped_talisman_names) or '없음'}"
+            ),
+        ]
+
+        # 증명된 상계를 아는 경우에만 남은 개선 여지 표시
+        incumbent_gap: float | None = incumbent.gap
+        if incumbent_gap is not None:
+            summary_lines.append(f"최대 개선 여지 {cls._format_delta(incumbent_gap)}")
+
+        return "\n".join(summary_lines)
+
     @staticmethod
     def _format_current_power(value: float) -> str:
         """현재 전투력 표시 문자열 생성"""
@@ -1776,6 +1974,33 @@ class ResultsPage(QFrame):
         # 결과 문자열을 정렬용 숫자로 직접 변환
         return float(row[1].replace(",", ""))
 
+    @classmethod
+    def _build_loading_output_rows(cls) -> "ResultsPage.OutputRows":
+        """행 묶음 스트리밍 시작 시점의 로딩 출력 행 구성"""
+
+        loading_rows: list[tuple[str, str]] = [("상태", "계산 중...")]
+        loading_row: tuple[str, str] = ("상태", "계산 중...")
+        return cls.OutputRows(
+            current_power=loading_row,
+            stat_efficiency=loading_rows,
+            stat_marginal_value=loading_rows,
+            level_up=loading_rows,
+            level_up_curve=[],
+            realm_up=loading_rows,
+            scroll_efficiency=loading_rows,
+            scroll_upgrade_plan=loading_rows,
+            custom_delta=None,
+            target_distribution_summary=None,
+            target_delta=None,
+            target_danjeon_summary=None,
+            target_danjeon_delta=None,
+            optimization_result=loading_rows,
+            custom_base_stats=None,
+            target_base_stats=None,
+            target_danjeon_base_stats=None,
+            optimized_base_stats=None,
+        )
+
     @classmethod
     def _build_output_rows(
         cls,
@@ -1790,99 +2015,253 @@ class ResultsPage(QFrame):
         context: "EvaluationContext",
         progress_callback: Callable[[str, int], None] | None = None,
         cancel_checker: Callable[[], None] | None = None,
+        incumbent_callback: Callable[["OptimizationIncumbent"], None] | None = None,
+        stop_checker: Callable[[], bool] | None = None,
+        group_callback: (
+            Callable[["ResultsPage.OutputGroup", "ResultsPage.OutputRows"], None] | None
+        ) = None,
     ) -> "ResultsPage.OutputRows":
-        """공용 계산기 결과 행 구성"""
+        """
+        공용 계산기 결과 행 구성
+        카드 단위 행 묶음을 하나의 평가 컨텍스트를 공유하는 독립 작업으로 나눠
+        스레드 풀에서 동시에 계산하고, 끝난 묶음부터 `group_callback`으로 전달한다.
+        모든 작업은 프리셋/컨텍스트를 읽기만 하며, 레벨/무공비급 변경 평가는
+        프리셋을 바꾸지 않는 엔진 경로를 사용한다.
+        """
+
+        job_input: ResultsPage.OutputJobInput = cls.OutputJobInput(
+            server_spec=server_spec,
+            preset=preset,
+            delay_ms=delay_ms,
+            base_stats=base_stats,
+            level=level,
+            selected_formula_id=selected_formula_id,
+            current_realm=current_realm,
+            calculator_input=calculator_input,
+            context=context,
+        )
+
+        # 오래 걸리는 최적화를 가장 먼저 제출해 나머지 묶음과 겹쳐 실행
+        jobs: list[
+            tuple[
+                ResultsPage.OutputGroup,
+                Callable[
+                    [ResultsPage.OutputJobInput, Callable[[], None]],
+                    dict[str, object],
+                ],
+            ]
+        ] = [
+            (
+                cls.OutputGroup.OPTIMIZATION,
+                partial(
+                    cls._build_optimization_group,
+                    progress_callback=progress_callback,
+                    incumbent_callback=incumbent_callback,
+                    stop_checker=stop_checker,
+                ),
+            ),
+            (cls.OutputGroup.CURRENT_POWER, cls._build_current_power_group),
+            (cls.OutputGroup.STAT_EFFICIENCY, cls._build_stat_efficiency_group),
+            (cls.OutputGroup.LEVEL_UP, cls._build_level_up_group),
+            (cls.OutputGroup.REALM_UP, cls._build_realm_up_group),
+            (cls.OutputGroup.SCROLL_EFFICIENCY, cls._build_scroll_efficiency_group),
+            (cls.OutputGroup.CUSTOM_DELTA, cls._build_custom_delta_group),
+            (
+                cls.OutputGroup.TARGET_DISTRIBUTION,
+                cls._build_target_distribution_group,
+            ),
+            (cls.OutputGroup.TARGET_DANJEON, cls._build_target_danjeon_group),
+        ]
+
+        # 한 작업이 실패/취소되면 나머지 작업도 다음 취소 확인 지점에서 중단
+        abort_event: threading.Event = threading.Event()
 
-        # 현재 전투력 구성 직전 진행 단계 반영
+        def job_cancel_checker() -> None:
+            """작업 공용 취소 확인 (다른 작업 중단 요청 포함)"""
+
+            if abort_event.is_set():
+                raise _CalculationCancelledError()
+
+            if cancel_checker is not None:
+                cancel_checker()
+
+        if progress_callback is not None:
+            progress_callback("결과 계산 중...", 0)
+
+        output_rows: ResultsPage.OutputRows = cls._build_loading_output_rows()
+        # 최적화는 자체 프로세스 풀을 쓰므로 작업당 스레드 1개로 가벼운 묶음이
+        # 최적화 뒤에 대기하지 않도록 구성
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=len(jobs),
+            thread_name_prefix="results",
+        )
+        pending: dict[Future[dict[str, object]], ResultsPage.OutputGroup] = {}
+        try:
+            group: ResultsPage.OutputGroup
+            job: Callable[
+                [ResultsPage.OutputJobInput, Callable[[], None]],
+                dict[str, object],
+            ]
+            for group, job in jobs:
+                pending[executor.submit(job, job_input, job_cancel_checker)] = group
+
+            # 끝난 묶음부터 누적 결과에 반영해 호출자에게 전달
+            while pending:
+                done: set[Future[dict[str, object]]]
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future: Future[dict[str, object]]
+                for future in done:
+                    group = pending.pop(future)
+                    output_rows = replace(output_rows, **future.result())
+                    if group_callback is not None:
+                        group_callback(group, output_rows)
+
+        except BaseException:
+            abort_event.set()
+            raise
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # 결과 반환 직전 완료 단계 반영
         if progress_callback is not None:
-            progress_callback("현재 전투력 정리 중...", 0)
+            progress_callback("결과 화면 준비 중...", 100)
 
         if cancel_checker is not None:
             cancel_checker()
 
-        # 현재 전투력 출력 행 구성
+        return output_rows
+
+    @classmethod
+    def _build_current_power_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """현재 전투력 출력 행 구성"""
+
+        cancel_checker()
+
         formula_labels: dict[str, str] = _build_formula_label_map(
             app_state.macro.custom_power_formulas
         )
         current_power_row: tuple[str, str] = (
-            formula_labels[selected_formula_id],
-            cls._format_current_power(context.baseline_power),
+            formula_labels[job_input.selected_formula_id],
+            cls._format_current_power(job_input.context.baseline_power),
         )
 
-        # 스탯 효율 계산 시작 단계 반영
-        if progress_callback is not None:
-            progress_callback("스탯 효율 계산 중...", 0)
-
-        # 스탯 1당 효율 출력 행 구성
-        stat_rows: list[tuple[str, str]] = []
-        stat_count: int = len(STAT_SPECS)
-        stat_index: int
-        stat_key: StatKey
-        stat_label: str
-        for stat_index, (stat_key, stat_label) in enumerate(
-            STAT_SPECS.items(), start=1
-        ):
-            if cancel_checker is not None:
-                cancel_checker()
+        return {"current_power": current_power_row}
 
-            metric_delta: float = evaluate_single_stat_delta(
-                context=context,
-                stat_key=stat_key,
-                amount=1.0,
-                target_formula_id=selected_formula_id,
+    @classmethod
+    def _build_stat_efficiency_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """스탯 1당 효율 출력 행 구성"""
+
+        cancel_checker()
+
+        # 전체 스탯 +1 프로브를 한 번에 일괄 평가
+        probe_results: list[StatProbeEvaluation] = evaluate_stat_probe_deltas(
+            context=job_input.context,
+            probes=[(stat_key, 1.0) for stat_key in STAT_SPECS.keys()],
+            target_formula_id=job_input.selected_formula_id,
+        )
+        stat_rows: list[tuple[str, str]] = [
+            (
+                f"{STAT_SPECS[probe_result.stat_key]} +1",
+                cls._format_delta(probe_result.delta),
             )
-            label: str = f"{stat_label} +1"
-
-            stat_rows.append((label, cls._format_delta(metric_delta)))
-
-            if progress_callback is not None:
-                stat_progress: int = 0
-                progress_callback("스탯 효율 계산 중...", stat_progress)
+            for probe_result in probe_results
+        ]
 
         stat_rows.sort(
             key=cls._result_sort_key,
             reverse=True,
         )
 
-        # 레벨업 효율 계산 단계 반영
-        if progress_callback is not None:
-            progress_callback("레벨 효율 계산 중...", 0)
-
-        if cancel_checker is not None:
-            cancel_checker()
+        cancel_checker()
 
-        # 레벨 1업 효율 출력 행 구성
-        level_up: LevelUpEvaluation = evaluate_level_up_delta(
-            context=context,
-            target_formula_id=selected_formula_id,
+        # 스탯 1포인트당 한계 가치 (이원수 기울기 1회 평가, floor/round 계단 무시)
+        marginal_values: dict[StatKey, float] = evaluate_power_gradient(
+            context=job_input.context,
+            target_formula_id=job_input.selected_formula_id,
+            stat_keys=tuple(STAT_SPECS.keys()),
         )
-        level_distribution_text: str = (
-            f"힘 {level_up.stat_distribution[StatKey.STR]}, "
-            f"민첩 {level_up.stat_distribution[StatKey.DEXTERITY]}, "
-            f"생명력 {level_up.stat_distribution[StatKey.VITALITY]}, "
-            f"행운 {level_up.stat_distribution[StatKey.LUCK]}"
-        )
-        level_up_rows: list[tuple[str, str]] = [
-            (
-                "레벨 1업",
-                cls._format_delta(level_up.delta),
-            ),
-            ("최적 분배", level_distribution_text),
+        marginal_rows: list[tuple[str, str]] = [
+            (STAT_SPECS[stat_key], cls._format_delta(marginal_value))
+            for stat_key, marginal_value in marginal_values.items()
         ]
+        marginal_rows.sort(
+            key=cls._result_sort_key,
+            reverse=True,
+        )
 
-        # 경지 효율 계산 단계 반영
-        if progress_callback is not None:
-            progress_callback("경지 효율 계산 중...", 0)
+        return {"stat_efficiency": stat_rows, "stat_marginal_value": marginal_rows}
 
-        if cancel_checker is not None:
-            cancel_checker()
+    @classmethod
+    def _build_level_up_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """다음 N레벨업 계획 출력 행과 전투력 변화 곡선 구성"""
+
+        cancel_checker()
+
+        # 1레벨부터 최대 레벨 수까지 누적 최적 분배 계획을 한 번에 계산
+        level_up_plan: list[LevelUpEvaluation] = plan_level_ups(
+            context=job_input.context,
+            target_formula_id=job_input.selected_formula_id,
+            level_count=LEVEL_UP_PLAN_MAX_LEVELS,
+            cancel_checker=cancel_checker,
+        )
+
+        # 대표 레벨 수별 전투력 변화량과 누적 분배 행 구성
+        level_up_rows: list[tuple[str, str]] = []
+        level_count: int
+        for level_count in (1, 10, LEVEL_UP_PLAN_MAX_LEVELS):
+            level_up: LevelUpEvaluation = level_up_plan[level_count - 1]
+            level_distribution_text: str = (
+                f"힘 {level_up.stat_distribution[StatKey.STR]}, "
+                f"민첩 {level_up.stat_distribution[StatKey.DEXTERITY]}, "
+                f"생명력 {level_up.stat_distribution[StatKey.VITALITY]}, "
+                f"행운 {level_up.stat_distribution[StatKey.LUCK]}"
+            )
+            level_up_rows.append(
+                (
+                    f"레벨 {level_count}업",
+                    cls._format_delta(level_up.delta),
+                )
+            )
+            level_up_rows.append(
+                (
+                    "최적 분배" if level_count == 1 else f"{level_count}업 분배",
+                    level_distribution_text,
+                )
+            )
+
+        return {
+            "level_up": level_up_rows,
+            "level_up_curve": [level_up.delta for level_up in level_up_plan],
+        }
+
+    @classmethod
+    def _build_realm_up_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """다음 경지 효율 출력 행 구성"""
+
+        cancel_checker()
 
-        # 다음 경지 효율 출력 행 구성
         realm_result: RealmAdvanceEvaluation | None = evaluate_next_realm_delta(
-            context=context,
-            current_realm=current_realm,
-            level=level,
-            target_formula_id=selected_formula_id,
+            context=job_input.context,
+            current_realm=job_input.current_realm,
+            level=job_input.level,
+            target_formula_id=job_input.selected_formula_id,
         )
         if realm_result is None:
             realm_rows: list[tuple[str, str]] = [
@@ -1903,29 +2282,27 @@ class ResultsPage(QFrame):
                 ("최적 분배", danjeon_text),
             ]
 
-        # 무공비급 효율 계산 단계 반영
-        if progress_callback is not None:
-            progress_callback("무공비급 효율 계산 중...", 0)
+        return {"realm_up": realm_rows}
 
-        if cancel_checker is not None:
-            cancel_checker()
+    @classmethod
+    def _build_scroll_efficiency_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """무공비급 +1 효율과 다음 강화 순서 출력 행 구성"""
+
+        cancel_checker()
 
-        # 무공비급 +1 효율 출력 행 구성
         scroll_rows: list[tuple[str, str]] = []
         scroll_results: list[ScrollUpgradeEvaluation] = evaluate_scroll_upgrade_deltas(
-            server_spec=server_spec,
-            preset=preset,
-            skills_info=preset.usage_settings,
-            delay_ms=delay_ms,
-            baseline_context=context,
-            target_formula_id=selected_formula_id,
+            server_spec=job_input.server_spec,
+            preset=job_input.preset,
+            baseline_context=job_input.context,
+            target_formula_id=job_input.selected_formula_id,
         )
-        scroll_index: int
         scroll_result: ScrollUpgradeEvaluation
-        for scroll_index, scroll_result in enumerate(scroll_results, start=1):
-            if cancel_checker is not None:
-                cancel_checker()
-
+        for scroll_result in scroll_results:
             scroll_rows.append(
                 (
                     f"{scroll_result.scroll_name} Lv.{scroll_result.next_level}",
@@ -1933,72 +2310,117 @@ class ResultsPage(QFrame):
                 )
             )
 
-            if progress_callback is not None:
-                scroll_progress: int = 0
-                progress_callback("무공비급 효율 계산 중...", scroll_progress)
-
         scroll_rows.sort(
             key=cls._result_sort_key,
             reverse=True,
         )
 
-        # 사용자 지정 변화량 계산 단계 반영
-        if progress_callback is not None:
-            progress_callback("사용자 지정 변화량 계산 중...", 0)
+        # 다음 강화 순서는 단계별 무공비급과 계획 시작 대비 누적 증가량으로 표시
+        plan_steps: list[ScrollUpgradePlanStep] = plan_scroll_upgrades(
+            server_spec=job_input.server_spec,
+            preset=job_input.preset,
+            baseline_context=job_input.context,
+            target_formula_id=job_input.selected_formula_id,
+            upgrade_count=SCROLL_UPGRADE_PLAN_STEPS,
+            cancel_checker=cancel_checker,
+        )
+        plan_rows: list[tuple[str, str]] = [
+            (
+                f"{step_index}. {plan_step.scroll_name} Lv.{plan_step.next_level}",
+                cls._format_delta(plan_step.total_delta),
+            )
+            for step_index, plan_step in enumerate(plan_steps, start=1)
+        ]
 
-        if cancel_checker is not None:
-            cancel_checker()
+        return {"scroll_efficiency": scroll_rows, "scroll_upgrade_plan": plan_rows}
+
+    @classmethod
+    def _build_custom_delta_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """사용자 지정 변화량 출력 행 구성"""
+
+        cancel_checker()
 
         # 사용자 지정 변화량 맵 1회 구성 및 빈 입력 분기
         custom_changes: dict[StatKey, float] = cls._build_custom_stat_change_map(
-            calculator_input
+            job_input.calculator_input
         )
         custom_delta_row: tuple[str, str] | None = None
         custom_base_stats: BaseStats | None = None
         if custom_changes:
             custom_delta_row = cls._build_custom_delta_row(
-                context=context,
-                selected_formula_id=selected_formula_id,
+                context=job_input.context,
+                selected_formula_id=job_input.selected_formula_id,
                 custom_changes=custom_changes,
             )
-            custom_base_stats = base_stats.with_changes(custom_changes)
+            custom_base_stats = job_input.base_stats.with_changes(custom_changes)
+
+        return {
+            "custom_delta": custom_delta_row,
+            "custom_base_stats": custom_base_stats,
+        }
+
+    @classmethod
+    def _build_target_distribution_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """목표 분배 결과 표시 행 구성"""
+
+        cancel_checker()
 
         target_changes: dict[StatKey, float] = cls._build_target_distribution_delta(
-            calculator_input
+            job_input.calculator_input
         )
         target_distribution_summary: tuple[str, str] | None = None
         target_delta_row: tuple[str, str] | None = None
         target_base_stats: BaseStats | None = None
-
-        # 목표 분배 결과 표시 행 구성
         if target_changes:
             # 목표 분배 수치 요약 행 구성
             target_distribution_summary = cls._build_target_distribution_summary_row(
-                calculator_input
+                job_input.calculator_input
             )
 
             # 목표 분배 기준 전투력 변화량 행 구성
             target_delta_row = cls._build_target_distribution_row(
-                context=context,
-                selected_formula_id=selected_formula_id,
+                context=job_input.context,
+                selected_formula_id=job_input.selected_formula_id,
                 target_changes=target_changes,
             )
 
             # 목표 분배 적용 후 전체 스탯 구성
-            target_base_stats = base_stats.with_changes(target_changes)
+            target_base_stats = job_input.base_stats.with_changes(target_changes)
+
+        return {
+            "target_distribution_summary": target_distribution_summary,
+            "target_delta": target_delta_row,
+            "target_base_stats": target_base_stats,
+        }
+
+    @classmethod
+    def _build_target_danjeon_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+    ) -> dict[str, object]:
+        """목표 단전 결과 표시 행 구성"""
+
+        cancel_checker()
 
         target_danjeon_changes: dict[StatKey, float] = cls._build_target_danjeon_delta(
-            calculator_input
+            job_input.calculator_input
         )
         target_danjeon_summary: tuple[str, str] | None = None
         target_danjeon_delta_row: tuple[str, str] | None = None
         target_danjeon_base_stats: BaseStats | None = None
-
-        # 목표 단전 결과 표시 행 구성
         if target_danjeon_changes:
             # 목표 단전 수치 요약 행 구성
             target_danjeon_summary = cls._build_target_danjeon_summary_row(
-                calculator_input
+                job_input.calculator_input
             )
 
             # 목표 단전 기준 전투력 변화량 행 구성
@@ -2006,38 +2428,65 @@ class ResultsPage(QFrame):
                 app_state.macro.custom_power_formulas
             )
             target_danjeon_delta: float = evaluate_arbitrary_stat_delta(
-                context=context,
+                context=job_input.context,
                 stat_changes=target_danjeon_changes,
-                target_formula_id=selected_formula_id,
+                target_formula_id=job_input.selected_formula_id,
             )
             target_danjeon_delta_row = (
-                formula_labels[selected_formula_id],
+                formula_labels[job_input.selected_formula_id],
                 cls._format_delta(target_danjeon_delta),
             )
 
             # 목표 단전 적용 후 전체 스탯 구성
-            target_danjeon_base_stats = base_stats.with_changes(target_danjeon_changes)
+            target_danjeon_base_stats = job_input.base_stats.with_changes(
+                target_danjeon_changes
+            )
 
-        # 최적화 결과 계산 단계 반영
-        if progress_callback is not None:
-            progress_callback("최적화 결과 계산 중...", 0)
+        return {
+            "target_danjeon_summary": target_danjeon_summary,
+            "target_danjeon_delta": target_danjeon_delta_row,
+            "target_danjeon_base_stats": target_danjeon_base_stats,
+        }
 
-        if cancel_checker is not None:
-            cancel_checker()
+    @classmethod
+    def _build_optimization_group(
+        cls,
+        job_input: "ResultsPage.OutputJobInput",
+        cancel_checker: Callable[[], None],
+        progress_callback: Callable[[str, int], None] | None = None,
+        incumbent_callback: Callable[["OptimizationIncumbent"], None] | None = None,
+        stop_checker: Callable[[], bool] | None = None,
+    ) -> dict[str, object]:
+        """최적화 결과 출력 행 구성"""
+
+        cancel_checker()
+
+        calculator_input: CalculatorPresetInput = job_input.calculator_input
+
+        # 최적화 결과 행 구성 (중간 결과는 마지막 상태를 기록해 최적성 차이 표시)
+        latest_incumbents: list["OptimizationIncumbent"] = []
+
+        def record_incumbent(incumbent: "OptimizationIncumbent") -> None:
+            """최적화 중간 결과 기록 후 호출자에게 전달"""
+
+            latest_incumbents[:] = [incumbent]
+            if incumbent_callback is not None:
+                incumbent_callback(incumbent)
 
-        # 최적화 결과 행 구성
         optimization_result: OptimizationResult | OptimizationFailure = (
             optimize_current_selection(
-                server_spec=server_spec,
-                preset=preset,
-                skills_info=preset.usage_settings,
-                delay_ms=delay_ms,
-                context=context,
-                base_stats=base_stats,
+                server_spec=job_input.server_spec,
+                preset=job_input.preset,
+                skills_info=job_input.preset.usage_settings,
+                delay_ms=job_input.delay_ms,
+                context=job_input.context,
+                base_stats=job_input.base_stats,
                 calculator_input=calculator_input,
-                target_formula_id=selected_formula_id,
+                target_formula_id=job_input.selected_formula_id,
                 progress_callback=progress_callback,
                 cancel_checker=cancel_checker,
+                incumbent_callback=record_incumbent,
+                stop_checker=stop_checker,
             )
         )
         optimized_base_stats: BaseStats | None = None
@@ -2096,32 +2545,46 @@ class ResultsPage(QFrame):
                 ("최적 단전", danjeon_text),
                 ("최적 칭호", title_text),
                 ("최적 부적", talisman_text),
+                (
+                    "탐색 방식",
+                    (
+                        "정확 탐색"
+                        if optimization_result.is_exact
+                        else "근사 탐색 (상위 후보 조합만 평가)"
+                    ),
+                ),
             ]
 
-        # 결과 반환 직전 완료 단계 반영
-        if progress_callback is not None:
-            progress_callback("결과 화면 준비 중...", 100)
+            # 탐색 계측 요약 표시 (전체 값은 stats.to_dict()로 기록 가능)
+            optimization_stats: "OptimizationStats | None" = optimization_result.stats
+            if optimization_stats is not None:
+                optimization_rows.append(
+                    (
+                        "탐색 통계",
+                        (
+                            f"노드 {optimization_stats.expanded_node_count:,}개 전개, "
+                            f"{optimization_stats.pruned_node_count:,}개 가지치기, "
+                            f"공식 평가 {optimization_stats.formula_evaluation_count:,}회, "
+                            f"{optimization_stats.phase_seconds.get('total', 0.0):.2f}초"
+                        ),
+                    )
+                )
 
-        if cancel_checker is not None:
-            cancel_checker()
+            # 조기 종료한 결과면 증명된 상계와의 최대 차이 표시
+            if latest_incumbents and not latest_incumbents[-1].is_complete:
+                incumbent_gap: float | None = latest_incumbents[-1].gap
+                gap_text: str = "조기 종료 (상계 미확인)"
+                if incumbent_gap is not None:
+                    gap_text = (
+                        f"조기 종료 (최대 {cls._format_delta(incumbent_gap)} 개선 여지)"
+                    )
 
-        return cls.OutputRows(
-            current_power=current_power_row,
-            stat_efficiency=stat_rows,
-            level_up=level_up_rows,
-            realm_up=realm_rows,
-            scroll_efficiency=scroll_rows,
-            custom_delta=custom_delta_row,
-            target_distribution_summary=target_distribution_summary,
-            target_delta=target_delta_row,
-            target_danjeon_summary=target_danjeon_summary,
-            target_danjeon_delta=target_danjeon_delta_row,
-            optimization_result=optimization_rows,
-            custom_base_stats=custom_base_stats,
-            target_base_stats=target_base_stats,
-            target_danjeon_base_stats=target_danjeon_base_stats,
-            optimized_base_stats=optimized_base_stats,
-        )
+                optimization_rows.append(("최적성 차이", gap_text))
+
+        return {
+            "optimization_result": optimization_rows,
+            "optimized_base_stats": optimized_base_stats,
+        }
 
     @staticmethod
     def _build_custom_stat_change_map(
@@ -5714,6 +6177,28 @@ class ResultsPage(QFrame):
             self._stat_list: ResultsPage.ResultsView.RankedResultList = (
                 ResultsPage.ResultsView.RankedResultList(self)
             )
+            _stat_wrapper: QWidget = QWidget(self)
+            _stat_wrapper_layout: QVBoxLayout = QVBoxLayout(_stat_wrapper)
+            _stat_wrapper_layout.setContentsMargins(0, 0, 0, 0)
+            _stat_wrapper_layout.setSpacing(0)
+            _stat_wrapper_layout.addWidget(self._stat_list)
+
+            # 스탯 1포인트당 한계 가치 (기울기, floor/round 계단 무시한 평균 증가율)
+            self._stat_marginal_list: ResultsPage.ResultsView.RankedResultList = (
+                ResultsPage.ResultsView.RankedResultList(self)
+            )
+            _stat_marginal_title: QLabel = QLabel(
+                "스탯 1당 한계 가치 (기울기)", _stat_wrapper
+            )
+            _stat_marginal_title.setObjectName("resultsSubTitle")
+            _stat_marginal_title.setFont(CustomFont(11, bold=True))
+            _stat_wrapper_layout.addSpacing(10)
+            _stat_wrapper_layout.addWidget(_stat_marginal_title)
+            _stat_wrapper_layout.addSpacing(6)
+            _stat_wrapper_layout.addWidget(self._stat_marginal_list)
+            _stat_wrapper_layout.addStretch(1)
+            _stat_wrapper.setLayout(_stat_wrapper_layout)
+
             self._scroll_list: ResultsPage.ResultsView.RankedResultList = (
                 ResultsPage.ResultsView.RankedResultList(self)
             )
@@ -5726,13 +6211,27 @@ class ResultsPage(QFrame):
             _scroll_wrapper_layout.setContentsMargins(0, 0, 0, 0)
             _scroll_wrapper_layout.setSpacing(0)
             _scroll_wrapper_layout.addWidget(self._scroll_list)
+
+            # 다음 무공비급 강화 순서 (누적 증가량)
+            self._scroll_plan_list: ResultsPage.Efficiency.ResultList = (
+                ResultsPage.Efficiency.ResultList(self)
+            )
+            _scroll_plan_title: QLabel = QLabel(
+                f"다음 강화 순서 ({SCROLL_UPGRADE_PLAN_STEPS}회, 누적)", _scroll_wrapper
+            )
+            _scroll_plan_title.setObjectName("resultsSubTitle")
+            _scroll_plan_title.setFont(CustomFont(11, bold=True))
+            _scroll_wrapper_layout.addSpacing(10)
+            _scroll_wrapper_layout.addWidget(_scroll_plan_title)
+            _scroll_wrapper_layout.addSpacing(6)
+            _scroll_wrapper_layout.addWidget(self._scroll_plan_list)
             _scroll_wrapper_layout.addStretch(1)
             _scroll_wrapper.setLayout(_scroll_wrapper_layout)
 
             _eff_row: QHBoxLayout = QHBoxLayout()
             _eff_row.setContentsMargins(0, 0, 0, 0)
             _eff_row.setSpacing(10)
-            _eff_row.addWidget(self._stat_list)
+            _eff_row.addWidget(_stat_wrapper)
             _eff_row.addWidget(_vsep)
             _eff_row.addWidget(_scroll_wrapper)
             self._stat_scroll_card: SectionCard = SectionCard(self, "효율 비교")
@@ -5778,7 +6277,7 @@ class ResultsPage(QFrame):
             _level_wrapper_layout = QVBoxLayout(_level_wrapper)
             _level_wrapper_layout.setContentsMargins(0, 0, 0, 0)
             _level_wrapper_layout.setSpacing(6)
-            _level_wrapper_layout.addWidget(_make_sub_title("레벨 1업", _level_wrapper))
+            _level_wrapper_layout.addWidget(_make_sub_title("레벨업", _level_wrapper))
             _level_wrapper_layout.addWidget(self._level_up_list)
             _level_wrapper_layout.addStretch(1)
             _level_wrapper.setLayout(_level_wrapper_layout)
@@ -5808,8 +6307,18 @@ class ResultsPage(QFrame):
             _growth_row.addWidget(_growth_vsep)
             _growth_row.addWidget(_realm_wrapper)
 
+            # 다음 N레벨업 누적 최적 분배 기준 전투력 변화 곡선
+            self._level_up_canvas: LevelUpCurveCanvas = LevelUpCurveCanvas(self)
+            self._level_up_canvas.setFixedHeight(200)
+            self._level_up_canvas.setVisible(False)
+
             self._growth_card: SectionCard = SectionCard(self, "성장 효율")
             self._growth_card.add_layout(_growth_row)
+            self._growth_card.add_separator()
+            self._growth_card.add_sub_title(
+                f"레벨업 횟수별 전투력 변화 (최대 {LEVEL_UP_PLAN_MAX_LEVELS}레벨)"
+            )
+            self._growth_card.add_widget(self._level_up_canvas)
 
             # 사용자 지정 변화량 카드 (조건부 표시)
             self._custom_list: ResultsPage.Efficiency.ResultList = (
@@ -5911,9 +6420,12 @@ class ResultsPage(QFrame):
             error_row: tuple[str, str] = ("상태", "오류")
             self._power_list.set_row(error_row)
             self._stat_list.set_rows(error_rows)
+            self._stat_marginal_list.set_rows(error_rows)
             self._level_up_list.set_rows(error_rows)
+            self._set_level_up_curve([])
             self._realm_up_list.set_rows(error_rows)
             self._scroll_list.set_rows(error_rows)
+            self._scroll_plan_list.set_rows(error_rows)
             self._custom_card.setVisible(False)
 
             # 사용자 지정 변화량 전체 스탯 표시 초기화
@@ -5944,9 +6456,12 @@ class ResultsPage(QFrame):
             loading_row: tuple[str, str] = ("상태", "계산 중...")
             self._power_list.set_row(loading_row)
             self._stat_list.set_rows(loading_rows)
+            self._stat_marginal_list.set_rows(loading_rows)
             self._level_up_list.set_rows(loading_rows)
+            self._set_level_up_curve([])
             self._realm_up_list.set_rows(loading_rows)
             self._scroll_list.set_rows(loading_rows)
+            self._scroll_plan_list.set_rows(loading_rows)
             self._custom_card.setVisible(False)
 
             # 사용자 지정 변화량 전체 스탯 표시 초기화
@@ -5970,50 +6485,87 @@ class ResultsPage(QFrame):
             self._opt_result_list.set_rows(loading_rows)
             self._opt_stats_grid.set_stats(None)
 
+        def _set_level_up_curve(self, deltas: list[float]) -> None:
+            """레벨업 전투력 변화 곡선 갱신 (데이터가 없으면 숨김)"""
+
+            self._level_up_canvas.set_deltas(deltas)
+            self._level_up_canvas.setVisible(bool(deltas))
+
         def _on_relative_efficiency_toggled(self) -> None:
             """스탯/스킬 효율 상대 표시 체크박스 토글 반영"""
 
             enabled: bool = self._relative_efficiency_checkbox.isChecked()
             self._stat_list.set_relative_mode(enabled)
+            self._stat_marginal_list.set_relative_mode(enabled)
             self._scroll_list.set_relative_mode(enabled)
 
         def set_output_rows(self, output_rows: ResultsPage.OutputRows) -> None:
             """백그라운드 계산 완료 결과 UI 반영"""
 
             # 완료된 결과 구조를 각 카드에 반영
-            self._power_list.set_row(output_rows.current_power)
-            self._stat_list.set_rows(output_rows.stat_efficiency)
-            self._level_up_list.set_rows(output_rows.level_up)
-            self._realm_up_list.set_rows(output_rows.realm_up)
-            self._scroll_list.set_rows(output_rows.scroll_efficiency)
-            self._custom_card.setVisible(output_rows.custom_delta is not None)
-            if output_rows.custom_delta is not None:
-                # 사용자 지정 변화량 결과 카드 하위 섹션 동기화
-                self._custom_list.set_rows([output_rows.custom_delta])
-                self._custom_stats_grid.set_stats(output_rows.custom_base_stats)
-            else:
-                # 사용자 지정 변화량 미입력 시 이전 전체 스탯 표시 제거
-                self._custom_stats_grid.set_stats(None)
+            group: ResultsPage.OutputGroup
+            for group in ResultsPage.OutputGroup:
+                self.set_output_group(group, output_rows)
+
+        def set_output_group(
+            self,
+            group: ResultsPage.OutputGroup,
+            output_rows: ResultsPage.OutputRows,
+        ) -> None:
+            """계산이 끝난 행 묶음 하나를 해당 카드에 반영"""
+
+            if group is ResultsPage.OutputGroup.CURRENT_POWER:
+                self._power_list.set_row(output_rows.current_power)
+
+            elif group is ResultsPage.OutputGroup.STAT_EFFICIENCY:
+                self._stat_list.set_rows(output_rows.stat_efficiency)
+                self._stat_marginal_list.set_rows(output_rows.stat_marginal_value)
+
+            elif group is ResultsPage.OutputGroup.LEVEL_UP:
+                self._level_up_list.set_rows(output_rows.level_up)
+                self._set_level_up_curve(output_rows.level_up_curve)
+
+            elif group is ResultsPage.OutputGroup.REALM_UP:
+                self._realm_up_list.set_rows(output_rows.realm_up)
+
+            elif group is ResultsPage.OutputGroup.SCROLL_EFFICIENCY:
+                self._scroll_list.set_rows(output_rows.scroll_efficiency)
+                self._scroll_plan_list.set_rows(output_rows.scroll_upgrade_plan)
+
+            elif group is ResultsPage.OutputGroup.CUSTOM_DELTA:
+                self._custom_card.setVisible(output_rows.custom_delta is not None)
+                if output_rows.custom_delta is not None:
+                    # 사용자 지정 변화량 결과 카드 하위 섹션 동기화
+                    self._custom_list.set_rows([output_rows.custom_delta])
+                    self._custom_stats_grid.set_stats(output_rows.custom_base_stats)
+                else:
+                    # 사용자 지정 변화량 미입력 시 이전 전체 스탯 표시 제거
+                    self._custom_stats_grid.set_stats(None)
 
             # 목표 분배/단전 미리보기 결과 카드 동기화
-            self._set_preview_card(
-                self._target_card,
-                self._target_list,
-                self._target_stats_grid,
-                output_rows.target_distribution_summary,
-                output_rows.target_delta,
-                output_rows.target_base_stats,
-            )
-            self._set_preview_card(
-                self._target_danjeon_card,
-                self._target_danjeon_list,
-                self._target_danjeon_stats_grid,
-                output_rows.target_danjeon_summary,
-                output_rows.target_danjeon_delta,
-                output_rows.target_danjeon_base_stats,
-            )
-            self._opt_result_list.set_rows(output_rows.optimization_result)
-            self._opt_stats_grid.set_stats(output_rows.optimized_base_stats)
+            elif group is ResultsPage.OutputGroup.TARGET_DISTRIBUTION:
+                self._set_preview_card(
+                    self._target_card,
+                    self._target_list,
+                    self._target_stats_grid,
+                    output_rows.target_distribution_summary,
+                    output_rows.target_delta,
+                    output_rows.target_base_stats,
+                )
+
+            elif group is ResultsPage.OutputGroup.TARGET_DANJEON:
+                self._set_preview_card(
+                    self._target_danjeon_card,
+                    self._target_danjeon_list,
+                    self._target_danjeon_stats_grid,
+                    output_rows.target_danjeon_summary,
+                    output_rows.target_danjeon_delta,
+                    output_rows.target_danjeon_base_stats,
+                )
+
+            elif group is ResultsPage.OutputGroup.OPTIMIZATION:
+                self._opt_result_list.set_rows(output_rows.optimization_result)
+                self._opt_stats_grid.set_stats(output_rows.optimized_base_stats)
 
 
 class SkillInputs(QFrame):
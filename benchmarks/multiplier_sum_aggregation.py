@@ -0,0 +1,233 @@
+"""
+타격 계수 총합 집계(multiplier_sum)와 이전 타격별 누적 방식의 전투력 차이 측정
+
+이전 구현은 타격마다 _calculate_hit_damage로 피해량을 구해 더했고, 현재 구현은
+타격 계수 총합에 공통 스탯 배율을 한 번 곱한다. 곱셈 결합 순서가 달라 비트 단위로는
+다를 수 있으므로, 무작위 타임라인과 스탯 벡터에서 내장 공식 전체의 상대 오차가
+허용 오차(ACCEPTED_RELATIVE_TOLERANCE) 이내인지 확인한다.
+저장소 루트에서 실행: python -m benchmarks.multiplier_sum_aggregation [타임라인 수] [타임라인당 스탯 벡터 수] [시드]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from dataclasses import dataclass
+
+from app.scripts.calculator_engine import (
+    _POWER_FORMULA_BOSS_DAMAGE_NAME,
+    _POWER_FORMULA_LEVEL_NAME,
+    _POWER_FORMULA_NODES,
+    _POWER_FORMULA_NORMAL_DAMAGE_NAME,
+    _POWER_FORMULA_SKILL_SLOT_COUNT,
+    HitEvent,
+    TimelineEvaluationArtifacts,
+    _build_timeline_evaluation_artifacts,
+    _calculate_hit_damage,
+    _evaluate_compiled_power_formula,
+    evaluate_single_metric,
+)
+from app.scripts.calculator_models import (
+    OVERALL_STAT_ORDER,
+    BaseStats,
+    FinalStats,
+    PowerMetric,
+    StatKey,
+)
+
+# 허용 상대 오차 (타격별 누적 반올림 오차는 타격 수에 비례하며 수백 타격에서 1e-14 수준)
+ACCEPTED_RELATIVE_TOLERANCE: float = 1e-12
+
+
+@dataclass(frozen=True, slots=True)
+class MultiplierSumComparison:
+    """내장 공식별 타격별 누적 대비 계수 총합 집계 오차"""
+
+    power_metric: PowerMetric
+    vector_count: int
+    # 최대 상대 오차 (|현재 - 이전| / max(|이전|, 1))
+    max_relative_difference: float
+    # 비트 단위로 다른 평가 수
+    differing_count: int
+
+
+def build_random_artifacts(
+    rng: random.Random,
+    include_basic_attack: bool,
+) -> TimelineEvaluationArtifacts:
+    """무작위 60초 타임라인 평가 데이터 구성 (평타 포함 여부 선택)"""
+
+    hit_events: list[HitEvent] = []
+    slot_number: int
+    for slot_number in range(1, rng.randint(2, _POWER_FORMULA_SKILL_SLOT_COUNT) + 1):
+        multiplier: float = rng.uniform(0.5, 12.0)
+        for _ in range(rng.randint(1, 40)):
+            hit_events.append(
+                HitEvent(
+                    skill_id=f"skill_{slot_number}",
+                    time=rng.uniform(0.0, 60.0),
+                    multiplier=multiplier,
+                )
+            )
+
+    # 평타는 계수가 작고 타격 수가 많아 누적 오차가 가장 크게 쌓이는 경우
+    if include_basic_attack:
+        for _ in range(rng.randint(100, 600)):
+            hit_events.append(
+                HitEvent(
+                    skill_id="basic_attack",
+                    time=rng.uniform(0.0, 60.0),
+                    multiplier=rng.choice((0.1, 0.3, 0.7)),
+                )
+            )
+
+    hit_events.sort(key=lambda hit_event: hit_event.time)
+
+    skill_slot_variables: dict[str, float | int] = {}
+    for slot_number in range(1, _POWER_FORMULA_SKILL_SLOT_COUNT + 1):
+        skill_slot_variables[f"skill_{slot_number}_damage"] = rng.uniform(0.5, 12.0)
+        skill_slot_variables[f"skill_{slot_number}_cooltime"] = rng.choice(
+            (0.0, 4.0, 8.0, 15.0)
+        )
+        skill_slot_variables[f"skill_{slot_number}_target_count"] = rng.randint(1, 5)
+
+    return _build_timeline_evaluation_artifacts(
+        hit_events=tuple(hit_events),
+        level=rng.randint(1, 200),
+        skill_slot_variables=skill_slot_variables,
+    )
+
+
+def build_random_final_stats(rng: random.Random) -> FinalStats:
+    """무작위 베이스 스탯을 resolve한 최종 스탯 구성"""
+
+    base_values: dict[str, float] = {
+        stat_key.value: float(rng.randint(0, 3000)) for stat_key in OVERALL_STAT_ORDER
+    }
+    base_values[StatKey.CRIT_RATE_PERCENT.value] = rng.uniform(0.0, 120.0)
+    base_values[StatKey.CRIT_DAMAGE_PERCENT.value] = rng.uniform(100.0, 400.0)
+    # 스킬속도 공식은 (1 - 스킬속도%)로 나누므로 100% 미만만 사용
+    base_values[StatKey.SKILL_SPEED_PERCENT.value] = rng.uniform(0.0, 80.0)
+    return BaseStats(values=base_values).resolve()
+
+
+def evaluate_metric_per_hit(
+    artifacts: TimelineEvaluationArtifacts,
+    resolved_stats: FinalStats,
+    power_metric: PowerMetric,
+) -> float:
+    """이전 구현과 같이 타격별 피해량을 누적해 내장 공식 평가"""
+
+    boss_damage: float = 0.0
+    normal_damage: float = 0.0
+    hit_event: HitEvent
+    for hit_event in artifacts.hit_events:
+        normal_damage += _calculate_hit_damage(
+            resolved_stats=resolved_stats.values,
+            hit_event=hit_event,
+            is_boss=False,
+        )
+        boss_damage += _calculate_hit_damage(
+            resolved_stats=resolved_stats.values,
+            hit_event=hit_event,
+            is_boss=True,
+        )
+
+    formula_variables: dict[str, float | int | bool] = {
+        stat_key.value: resolved_stats.values[stat_key]
+        for stat_key in OVERALL_STAT_ORDER
+    }
+    formula_variables[_POWER_FORMULA_LEVEL_NAME] = artifacts.level
+    formula_variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = boss_damage
+    formula_variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = normal_damage
+    formula_variables.update(artifacts.skill_slot_variables)
+    return _evaluate_compiled_power_formula(
+        _POWER_FORMULA_NODES[power_metric],
+        formula_variables,
+    )
+
+
+def compare_multiplier_sum_aggregation(
+    timeline_count: int = 5,
+    vectors_per_timeline: int = 300,
+    seed: int = 0,
+) -> tuple[MultiplierSumComparison, ...]:
+    """무작위 타임라인 x 스탯 벡터에서 내장 공식별 두 집계 방식의 오차 측정"""
+
+    rng: random.Random = random.Random(seed)
+    max_differences: dict[PowerMetric, float] = {
+        power_metric: 0.0 for power_metric in _POWER_FORMULA_NODES
+    }
+    differing_counts: dict[PowerMetric, int] = {
+        power_metric: 0 for power_metric in _POWER_FORMULA_NODES
+    }
+    timeline_index: int
+    for timeline_index in range(timeline_count):
+        artifacts: TimelineEvaluationArtifacts = build_random_artifacts(
+            rng,
+            include_basic_attack=timeline_index % 2 == 0,
+        )
+        for _ in range(vectors_per_timeline):
+            resolved_stats: FinalStats = build_random_final_stats(rng)
+            power_metric: PowerMetric
+            for power_metric in _POWER_FORMULA_NODES:
+                expected: float = evaluate_metric_per_hit(
+                    artifacts,
+                    resolved_stats,
+                    power_metric,
+                )
+                actual: float = evaluate_single_metric(
+                    artifacts=artifacts,
+                    resolved_stats=resolved_stats,
+                    target_formula_id=power_metric.value,
+                    compiled_custom_formula=None,
+                )
+                if actual == expected:
+                    continue
+
+                differing_counts[power_metric] += 1
+                max_differences[power_metric] = max(
+                    max_differences[power_metric],
+                    abs(actual - expected) / max(abs(expected), 1.0),
+                )
+
+    return tuple(
+        MultiplierSumComparison(
+            power_metric=power_metric,
+            vector_count=timeline_count * vectors_per_timeline,
+            max_relative_difference=max_differences[power_metric],
+            differing_count=differing_counts[power_metric],
+        )
+        for power_metric in _POWER_FORMULA_NODES
+    )
+
+
+def main() -> None:
+    timeline_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    vectors_per_timeline: int = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    seed: int = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    results: tuple[MultiplierSumComparison, ...] = compare_multiplier_sum_aggregation(
+        timeline_count,
+        vectors_per_timeline,
+        seed,
+    )
+    result: MultiplierSumComparison
+    for result in results:
+        print(
+            f"{result.power_metric.value:<32} "
+            f"벡터 {result.vector_count}개  "
+            f"비트 불일치 {result.differing_count:5d}  "
+            f"최대 상대 오차 {result.max_relative_difference:.3g}"
+        )
+
+    worst_difference: float = max(result.max_relative_difference for result in results)
+    print(
+        f"허용 상대 오차 {ACCEPTED_RELATIVE_TOLERANCE:g}, 최대 {worst_difference:.3g}"
+    )
+    if worst_difference > ACCEPTED_RELATIVE_TOLERANCE:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+워커 수별 병렬 분기 한정 탐색의 평가 노드 수와 소요 시간 측정
+
+최근 사용한 매크로 프리셋의 계산기 입력으로 측정한다.
+저장소 루트에서 실행: python -m benchmarks.parallel_branch_and_bound [워커 수 ...]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from concurrent.futures import wait
+from dataclasses import dataclass
+
+from app.scripts.app_state import app_state
+from app.scripts.calculator_engine import (
+    DistributionSearchRange,
+    EvaluationContext,
+    OptimizationFailure,
+    OptimizationStats,
+    ParallelSearchOutcome,
+    _generate_sub_ranges,
+    _prepare_optimization_search,
+    _run_parallel_subtree_search,
+    _warm_up_optimization_worker,
+    build_calculator_context,
+)
+from app.scripts.calculator_models import BaseStats, CalculatorPresetInput
+from app.scripts.data_manager import load_data
+from app.scripts.macro_models import MacroPreset
+from app.scripts.optimization_pool import OptimizationWorkerPool
+
+
+@dataclass(frozen=True, slots=True)
+class ParallelSearchBenchmark:
+    """워커 수별 병렬 분기 한정 탐색 측정 결과"""
+
+    worker_count: int
+    task_count: int
+    node_count: int
+    elapsed_seconds: float
+    best_delta: float | None
+    stats: OptimizationStats
+
+
+def build_default_worker_counts() -> tuple[int, ...]:
+    """기본 측정 대상 워커 수: 1개부터 2배씩 CPU 코어 수까지"""
+
+    cpu_count: int = os.cpu_count() or 4
+    counts: list[int] = []
+    count: int = 1
+    while count < cpu_count:
+        counts.append(count)
+        count *= 2
+
+    counts.append(cpu_count)
+    return tuple(counts)
+
+
+def benchmark_parallel_branch_and_bound(
+    context: EvaluationContext,
+    base_stats: BaseStats,
+    calculator_input: CalculatorPresetInput,
+    target_formula_id: str,
+    worker_counts: tuple[int, ...],
+) -> tuple[ParallelSearchBenchmark, ...]:
+    """워커 수별 병렬 분기 한정 탐색의 평가 노드 수와 소요 시간 측정"""
+
+    prepared_search: (
+        tuple[tuple[object, ...], DistributionSearchRange] | OptimizationFailure
+    ) = _prepare_optimization_search(
+        context=context,
+        base_stats=base_stats,
+        calculator_input=calculator_input,
+        target_formula_id=target_formula_id,
+    )
+    if isinstance(prepared_search, OptimizationFailure):
+        raise ValueError(prepared_search.message)
+
+    shared_args: tuple[object, ...]
+    distribution_root: DistributionSearchRange
+    shared_args, distribution_root = prepared_search
+
+    results: list[ParallelSearchBenchmark] = []
+    worker_count: int
+    for worker_count in worker_counts:
+        # 워커 수별 전용 풀을 예열까지 마친 뒤 탐색 시간만 측정
+        pool: OptimizationWorkerPool = OptimizationWorkerPool(max_workers=worker_count)
+        try:
+            wait(pool.start(_warm_up_optimization_worker))
+            sub_ranges: list[DistributionSearchRange] = _generate_sub_ranges(
+                distribution_root, worker_count * 2
+            )
+
+            started_at: float = time.perf_counter()
+            outcome: ParallelSearchOutcome = _run_parallel_subtree_search(
+                pool=pool,
+                shared_args=shared_args,
+                sub_ranges=sub_ranges,
+            )
+            elapsed_seconds: float = time.perf_counter() - started_at
+
+        finally:
+            pool.shutdown()
+
+        best_delta: float | None = None
+        if outcome.best_result is not None:
+            best_delta = outcome.best_result.delta
+
+        results.append(
+            ParallelSearchBenchmark(
+                worker_count=worker_count,
+                task_count=outcome.task_count,
+                node_count=outcome.node_count,
+                elapsed_seconds=elapsed_seconds,
+                best_delta=best_delta,
+                stats=outcome.stats,
+            )
+        )
+
+    return tuple(results)
+
+
+def main() -> None:
+    worker_counts: tuple[int, ...] = (
+        tuple(int(arg) for arg in sys.argv[1:])
+        if len(sys.argv) > 1
+        else build_default_worker_counts()
+    )
+
+    # 저장된 최근 프리셋의 계산기 입력 기준 탐색 컨텍스트 구성
+    load_data()
+    preset: MacroPreset = app_state.macro.current_preset
+    calculator_input: CalculatorPresetInput = preset.info.calculator
+    context: EvaluationContext = build_calculator_context(
+        server_spec=app_state.macro.current_server,
+        preset=preset,
+        skills_info=preset.usage_settings,
+        delay_ms=app_state.macro.current_delay,
+        base_stats=calculator_input.base_stats,
+        target_formula_id=calculator_input.selected_formula_id,
+        custom_formulas=tuple(app_state.macro.custom_power_formulas),
+    )
+
+    result: ParallelSearchBenchmark
+    for result in benchmark_parallel_branch_and_bound(
+        context=context,
+        base_stats=calculator_input.base_stats,
+        calculator_input=calculator_input,
+        target_formula_id=calculator_input.selected_formula_id,
+        worker_counts=worker_counts,
+    ):
+        print(
+            f"워커 {result.worker_count:>3}  작업 {result.task_count:>4}  "
+            f"노드 {result.node_count:>10,}  {result.elapsed_seconds:8.3f}s  "
+            f"최적 증가량 {result.best_delta}"
+        )
+
+
+if __name__ == "__main__":
+    main()
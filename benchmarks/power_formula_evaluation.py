@@ -0,0 +1,126 @@
+"""
+내장 전투력 공식 AST 순회 인터프리터와 바이트코드 평가 함수 소요 시간 비교
+
+저장소 루트에서 실행: python -m benchmarks.power_formula_evaluation [반복 횟수]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass
+
+from app.scripts.calculator_engine import (
+    _POWER_FORMULA_BOSS_DAMAGE_NAME,
+    _POWER_FORMULA_LEVEL_NAME,
+    _POWER_FORMULA_NODES,
+    _POWER_FORMULA_NORMAL_DAMAGE_NAME,
+    _POWER_FORMULA_SKILL_SLOT_COUNT,
+    CompiledPowerFormula,
+    _evaluate_compiled_power_formula,
+    _interpret_compiled_power_formula,
+)
+from app.scripts.calculator_models import OVERALL_STAT_ORDER, PowerMetric
+
+
+@dataclass(frozen=True, slots=True)
+class PowerFormulaBenchmark:
+    """내장 전투력 공식 평가 경로별 소요 시간 비교 결과"""
+
+    power_metric: PowerMetric
+    iterations: int
+    # AST 순회 인터프리터 총 소요 시간 (초)
+    interpreted_seconds: float
+    # 바이트코드 평가 함수 총 소요 시간 (초)
+    compiled_seconds: float
+    # 두 경로 결과값 차이 (0이어야 정상)
+    value_difference: float
+
+    @property
+    def speedup(self) -> float:
+        """인터프리터 대비 바이트코드 평가 배속"""
+
+        if self.compiled_seconds <= 0.0:
+            return float("inf")
+
+        return self.interpreted_seconds / self.compiled_seconds
+
+
+def build_benchmark_variables() -> dict[str, float | int | bool]:
+    """벤치마크용 고정 공식 입력 변수 구성"""
+
+    # 모든 분기가 실행되도록 스탯/스킬 슬롯 변수를 0이 아닌 값으로 채움
+    variables: dict[str, float | int | bool] = {
+        stat_key.value: 10.0 + stat_index
+        for stat_index, stat_key in enumerate(OVERALL_STAT_ORDER)
+    }
+    variables[_POWER_FORMULA_LEVEL_NAME] = 100
+    variables[_POWER_FORMULA_BOSS_DAMAGE_NAME] = 1_000_000.0
+    variables[_POWER_FORMULA_NORMAL_DAMAGE_NAME] = 800_000.0
+    slot_number: int
+    for slot_number in range(1, _POWER_FORMULA_SKILL_SLOT_COUNT + 1):
+        variables[f"skill_{slot_number}_damage"] = 3.0 + (slot_number * 0.1)
+        variables[f"skill_{slot_number}_cooltime"] = 8.0 if slot_number % 2 else 0.0
+        variables[f"skill_{slot_number}_target_count"] = 1 + (slot_number % 5)
+
+    return variables
+
+
+def benchmark_power_formula_evaluation(
+    iterations: int = 10000,
+) -> tuple[PowerFormulaBenchmark, ...]:
+    """내장 전투력 공식 전체의 인터프리터/바이트코드 평가 시간 비교"""
+
+    variables: dict[str, float | int | bool] = build_benchmark_variables()
+    results: list[PowerFormulaBenchmark] = []
+    power_metric: PowerMetric
+    compiled_formula: CompiledPowerFormula
+    for power_metric, compiled_formula in _POWER_FORMULA_NODES.items():
+        # AST 순회 인터프리터 경로 측정
+        interpreted_value: float = 0.0
+        started_at: float = time.perf_counter()
+        for _ in range(iterations):
+            interpreted_value = _interpret_compiled_power_formula(
+                compiled_formula,
+                variables,
+            )
+        interpreted_seconds: float = time.perf_counter() - started_at
+
+        # 바이트코드 평가 함수 경로 측정
+        compiled_value: float = 0.0
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            compiled_value = _evaluate_compiled_power_formula(
+                compiled_formula,
+                variables,
+            )
+        compiled_seconds: float = time.perf_counter() - started_at
+
+        results.append(
+            PowerFormulaBenchmark(
+                power_metric=power_metric,
+                iterations=iterations,
+                interpreted_seconds=interpreted_seconds,
+                compiled_seconds=compiled_seconds,
+                value_difference=abs(interpreted_value - compiled_value),
+            )
+        )
+
+    return tuple(results)
+
+
+def main() -> None:
+    iterations: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    result: PowerFormulaBenchmark
+    for result in benchmark_power_formula_evaluation(iterations):
+        print(
+            f"{result.power_metric.value:<32} "
+            f"인터프리터 {result.interpreted_seconds:8.4f}s  "
+            f"바이트코드 {result.compiled_seconds:8.4f}s  "
+            f"x{result.speedup:5.1f}  차이 {result.value_difference:g}"
+        )
+
+
+if __name__ == "__main__":
+    main()
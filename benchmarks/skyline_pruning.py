@@ -0,0 +1,190 @@
+"""
+지배 후보 제거(skyline) 결과를 이전 쌍별 비교 구현과 무작위 입력으로 대조
+
+이전 구현(_contribution_dominates + 쌍별 _prune_contribution_entries)을 오라클로 보관하고,
+같은 입력에 대해 현재 _prune_contribution_entries가 같은 항목을 같은 순서로 남기는지 확인한다.
+저장소 루트에서 실행: python -m benchmarks.skyline_pruning [사례 수] [시드]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+
+from app.scripts.calculator_engine import (
+    Contribution,
+    EntryPayload,
+    _build_contribution_signature,
+    _prune_contribution_entries,
+)
+from app.scripts.calculator_models import OVERALL_STAT_ORDER, StatKey
+
+# 무작위 기여 값 후보 (정수 동률, 0, 음수, 부동소수 합이 같아지는 0.1/0.2/0.3 포함)
+_VALUE_CHOICES: tuple[float, ...] = (0.0, 1.0, 2.0, 3.0, -1.0, 0.1, 0.2, 0.3, 0.5)
+
+
+@dataclass(frozen=True, slots=True)
+class SkylinePruningComparison:
+    """무작위 입력 대조 결과"""
+
+    case_count: int
+    entry_count: int
+    # 결과(남은 항목과 순서)가 오라클과 다른 사례 수 (0이어야 정상)
+    mismatch_count: int
+    # 이전 쌍별 비교 구현 총 소요 시간 (초)
+    pairwise_seconds: float
+    # 현재 skyline 구현 총 소요 시간 (초)
+    skyline_seconds: float
+
+
+def _contribution_dominates(
+    left_contribution: Contribution,
+    right_contribution: Contribution,
+) -> bool:
+    """좌측 기여의 우월 관계 확인 (이전 구현 사본)"""
+
+    # 비교 대상 스탯 키 집합 구성
+    target_stat_keys: set[StatKey] = set(left_contribution.values.keys()) | set(
+        right_contribution.values.keys()
+    )
+    has_strict_advantage: bool = False
+    stat_key: StatKey
+    for stat_key in target_stat_keys:
+        left_value: float = float(left_contribution.values.get(stat_key, 0.0))
+        right_value: float = float(right_contribution.values.get(stat_key, 0.0))
+        if left_value < right_value:
+            return False
+
+        if left_value > right_value:
+            has_strict_advantage = True
+
+    return has_strict_advantage
+
+
+def prune_contribution_entries_pairwise(
+    entries: list[tuple[EntryPayload, Contribution]],
+) -> list[tuple[EntryPayload, Contribution]]:
+    """중복 및 지배 후보 제거 (이전 쌍별 비교 구현 사본)"""
+
+    # 완전 동일 기여 제거
+    signature_to_entry: dict[
+        tuple[tuple[str, float], ...], tuple[EntryPayload, Contribution]
+    ] = {}
+    payload: EntryPayload
+    contribution: Contribution
+    for payload, contribution in entries:
+        signature: tuple[tuple[str, float], ...] = _build_contribution_signature(
+            contribution
+        )
+        if signature in signature_to_entry:
+            continue
+
+        signature_to_entry[signature] = (payload, contribution)
+
+    # 지배 후보 제거
+    unique_entries: list[tuple[EntryPayload, Contribution]] = list(
+        signature_to_entry.values()
+    )
+    pruned_entries: list[tuple[EntryPayload, Contribution]] = []
+    target_index: int
+    for target_index, (payload, contribution) in enumerate(unique_entries):
+        is_dominated: bool = False
+        compare_index: int
+        other_contribution: Contribution
+        for compare_index, (_, other_contribution) in enumerate(unique_entries):
+            if compare_index == target_index:
+                continue
+
+            if not _contribution_dominates(other_contribution, contribution):
+                continue
+
+            is_dominated = True
+            break
+
+        if is_dominated:
+            continue
+
+        pruned_entries.append((payload, contribution))
+
+    return pruned_entries
+
+
+def build_random_entries(rng: random.Random) -> list[tuple[int, Contribution]]:
+    """무작위 (번호, 기여) 후보 목록 구성 (중복/지배/동률 포함)"""
+
+    entry_count: int = rng.randint(0, 80)
+    stat_keys: list[StatKey] = rng.sample(OVERALL_STAT_ORDER, rng.randint(1, 6))
+    entries: list[tuple[int, Contribution]] = []
+    entry_index: int
+    for entry_index in range(entry_count):
+        # 일부는 이전 후보를 그대로 복제해 중복 제거 경로도 확인
+        if entries and rng.random() < 0.1:
+            entries.append((entry_index, rng.choice(entries)[1]))
+            continue
+
+        values: dict[StatKey, float] = {
+            stat_key: rng.choice(_VALUE_CHOICES)
+            for stat_key in stat_keys
+            if rng.random() < 0.8
+        }
+        entries.append((entry_index, Contribution(values=values)))
+
+    return entries
+
+
+def compare_skyline_pruning(
+    case_count: int = 3000,
+    seed: int = 0,
+) -> SkylinePruningComparison:
+    """무작위 사례마다 현재 구현과 이전 구현의 남은 항목 번호 목록 비교"""
+
+    rng: random.Random = random.Random(seed)
+    entry_count: int = 0
+    mismatch_count: int = 0
+    pairwise_seconds: float = 0.0
+    skyline_seconds: float = 0.0
+    for _ in range(case_count):
+        entries: list[tuple[int, Contribution]] = build_random_entries(rng)
+        entry_count += len(entries)
+
+        started_at: float = time.perf_counter()
+        expected: list[tuple[int, Contribution]] = prune_contribution_entries_pairwise(
+            entries
+        )
+        pairwise_seconds += time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        actual: list[tuple[int, Contribution]] = _prune_contribution_entries(entries)
+        skyline_seconds += time.perf_counter() - started_at
+
+        if [payload for payload, _ in actual] != [payload for payload, _ in expected]:
+            mismatch_count += 1
+
+    return SkylinePruningComparison(
+        case_count=case_count,
+        entry_count=entry_count,
+        mismatch_count=mismatch_count,
+        pairwise_seconds=pairwise_seconds,
+        skyline_seconds=skyline_seconds,
+    )
+
+
+def main() -> None:
+    case_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    seed: int = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    result: SkylinePruningComparison = compare_skyline_pruning(case_count, seed)
+    print(
+        f"사례 {result.case_count}개 (후보 {result.entry_count}개)  "
+        f"불일치 {result.mismatch_count}개  "
+        f"쌍별 {result.pairwise_seconds:8.4f}s  "
+        f"skyline {result.skyline_seconds:8.4f}s"
+    )
+    if result.mismatch_count:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()